@@ -10,21 +10,34 @@ from app.routers.categories_router import categories_router
 from app.routers.dev_router import dev_router
 from app.routers.payments_router import payments_router
 from app.routers.income_router import income_router
+from app.routers.metrics_router import metrics_router
 from app.routers.ping_router import ping_router
 from app.routers.users_router import users_router
-from app.settings import ENGINE, SETTINGS, TEMPLATES
+from app.settings import ASYNC_ENGINE, ENGINE, METRICS, SETTINGS, TEMPLATES
+from app.utils.tools.request_stats import record_request_stats
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     yield  # pragma: no cover
     ENGINE.dispose()  # pragma: no cover
+    if ASYNC_ENGINE is not None:  # pragma: no cover
+        await ASYNC_ENGINE.dispose()
+
+
+def handle_exception(request: Request, exc: Exception):
+    """Counts the error for /metrics and renders it as JSON."""
+    METRICS.count_error(type(exc).__name__)
+    return beeb_exception_handler(request, exc)
 
 
 def build_app():
     app = FastAPI(lifespan=lifespan)
-    app.add_exception_handler(Exception, beeb_exception_handler)
+    app.add_exception_handler(Exception, handle_exception)
+    app.middleware("http")(METRICS.record_request)
+    app.middleware("http")(record_request_stats)
     app.include_router(ping_router)
+    app.include_router(metrics_router)
     app.include_router(users_router)
     app.include_router(auth_router)
     app.include_router(payments_router)
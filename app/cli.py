@@ -0,0 +1,119 @@
+import argparse
+import sys
+import time
+
+from loguru import logger
+
+from app.repositories.ledger import LedgerRepo
+from app.repositories.rollups import RollupRepo
+from app.settings import SESSION_FACTORY
+from app.utils.tools.data_generator import populate
+
+
+def rebuild_ledger(user_ids: list[int]) -> int:
+    with SESSION_FACTORY() as session:
+        repo = LedgerRepo(session)
+        for user_id in user_ids or repo.list_user_ids():
+            repo.rebuild(user_id)
+            session.commit()
+            logger.info(f"Баланс пользователя {user_id} пересчитан")
+    return 0
+
+
+def rebuild_rollup(user_ids: list[int]) -> int:
+    with SESSION_FACTORY() as session:
+        repo = RollupRepo(session)
+        for user_id in user_ids or LedgerRepo(session).list_user_ids():
+            repo.rebuild(user_id)
+            session.commit()
+            logger.info(f"Месячные итоги пользователя {user_id} пересчитаны")
+    return 0
+
+
+def verify_ledger(user_ids: list[int]) -> int:
+    exit_code = 0
+    with SESSION_FACTORY() as session:
+        repo = LedgerRepo(session)
+        for user_id in user_ids or repo.list_user_ids():
+            report = repo.verify(user_id)
+            if report.is_consistent:
+                logger.info(f"Баланс пользователя {user_id} сходится")
+                continue
+            exit_code = 1
+            logger.error(
+                f"Баланс пользователя {user_id} не сходится: "
+                f"{report.model_dump_json()}"
+            )
+    return exit_code
+
+
+def populate_users(
+    users: int, years: int, payments_per_day: int, seed: int
+) -> int:
+    start = time.perf_counter()
+    with SESSION_FACTORY() as session:
+        totals = populate(
+            session,
+            users=users,
+            years=years,
+            payments_per_day=payments_per_day,
+            seed=seed,
+        )
+    logger.info(
+        f"Создано пользователей: {totals['users']}, "
+        f"расходов: {totals['payments']}, доходов: {totals['income']} "
+        f"за {time.perf_counter() - start:.1f} с"
+    )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="beeb")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ledger = commands.add_parser(
+        "ledger", help="пересчитать или сверить баланс с записями"
+    )
+    ledger.add_argument("action", choices=["rebuild", "verify"])
+    ledger.add_argument(
+        "--user-id",
+        type=int,
+        action="append",
+        default=[],
+        help="по умолчанию все пользователи",
+    )
+    rollup = commands.add_parser(
+        "rollup", help="пересчитать месячные итоги для дашбордов"
+    )
+    rollup.add_argument("action", choices=["rebuild"])
+    rollup.add_argument(
+        "--user-id",
+        type=int,
+        action="append",
+        default=[],
+        help="по умолчанию все пользователи",
+    )
+    generator = commands.add_parser(
+        "populate", help="создать пользователей с синтетическими записями"
+    )
+    generator.add_argument("--users", type=int, default=1)
+    generator.add_argument("--years", type=int, default=3)
+    generator.add_argument("--payments-per-day", type=int, default=5)
+    generator.add_argument("--seed", type=int, default=0)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "populate":
+        return populate_users(
+            args.users, args.years, args.payments_per_day, args.seed
+        )
+    if args.command == "rollup":
+        return rebuild_rollup(args.user_id)
+    if args.command == "ledger" and args.action == "rebuild":
+        return rebuild_ledger(args.user_id)
+    return verify_ledger(args.user_id)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
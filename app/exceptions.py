@@ -128,3 +128,19 @@ class IncomeNotFoundError(BeebError):
         self.message = f"Доход под номером {value} не найден"
         self.status_code = status.HTTP_404_NOT_FOUND
         self.detail = f"Код ошибки: {self.status_code}. " + self.message
+
+
+class InvalidCursorError(BeebError):
+    def __init__(self, value: str):
+        self.value = value
+        self.message = f"Неверный курсор страницы: {value}"
+        self.status_code = status.HTTP_400_BAD_REQUEST
+        self.detail = f"Код ошибки: {self.status_code}. " + self.message
+
+
+class FileOutsideUploadDirError(BeebError):
+    def __init__(self, value: str):
+        self.value = value
+        self.message = f"Файл {value} не найден в папке для загрузки"
+        self.status_code = status.HTTP_400_BAD_REQUEST
+        self.detail = f"Код ошибки: {self.status_code}. " + self.message
@@ -3,8 +3,10 @@ from uuid import UUID, uuid4
 
 from sqlalchemy import (
     BigInteger,
+    Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     LargeBinary,
     MetaData,
@@ -41,6 +43,9 @@ class User(AlchemyBaseModel):
 
 class Category(AlchemyBaseModel):
     __tablename__ = "category"
+    __table_args__ = (
+        Index("category_user_id_name_key", "user_id", "name", unique=True),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(nullable=False, default=True)
@@ -63,6 +68,14 @@ class Category(AlchemyBaseModel):
 
 class Payment(AlchemyBaseModel):
     __tablename__ = "payments"
+    __table_args__ = (
+        Index(
+            "payments_user_id_created_at_idx",
+            "user_id",
+            "created_at",
+            postgresql_include=["amount", "category_id"],
+        ),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     uuid: Mapped[UUID] = mapped_column(
         types.UUID, nullable=False, unique=True, default=uuid4
@@ -100,6 +113,14 @@ class Payment(AlchemyBaseModel):
 
 class Income(AlchemyBaseModel):
     __tablename__ = "income"
+    __table_args__ = (
+        Index(
+            "income_user_id_created_at_idx",
+            "user_id",
+            "created_at",
+            postgresql_include=["amount"],
+        ),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     uuid: Mapped[UUID] = mapped_column(
         types.UUID, nullable=False, unique=True, default=uuid4
@@ -117,3 +138,39 @@ class Income(AlchemyBaseModel):
     income_user: Mapped["User"] = relationship(
         back_populates="income_list",
     )
+
+
+class BalanceSnapshot(AlchemyBaseModel):
+    __tablename__ = "balance_snapshots"
+    user_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    balance: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, doc="приход минус расход"
+    )
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=True
+    )
+
+
+class BalanceDelta(AlchemyBaseModel):
+    __tablename__ = "balance_deltas"
+    user_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    day: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    delta: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, doc="изменение за день"
+    )
+
+
+class MonthlyRollup(AlchemyBaseModel):
+    __tablename__ = "monthly_rollup"
+    user_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    month: Mapped[int] = mapped_column(Integer, primary_key=True)
+    category_id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, doc="0 для доходов"
+    )
+    amount: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    grams: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    quantity: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
@@ -0,0 +1,67 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.payments import PaymentRepo
+from app.repositories.rollups import RollupRepo
+from app.schemas.dashboard import DashboardAggregates
+from app.schemas.dates import DateBounds, DateFilter
+
+
+class AsyncPaymentRepo:
+    """Dashboard reads of PaymentRepo over an AsyncSession and asyncpg.
+
+    Only the dashboard reads have an async variant, income, category
+    and user reads and all writes stay on the sync session.
+
+    Statements and formatting come from PaymentRepo and RollupRepo,
+    only the round trips are awaited, so the queries stay in one place
+    and the event loop never waits on a thread.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.repo = PaymentRepo(session.sync_session)
+        self.rollup = RollupRepo(session.sync_session)
+
+    async def get_date_bounds(self, user_id: int) -> DateBounds:
+        statement = self.repo.select_date_bounds(user_id)
+        min_date, max_date = (await self.session.execute(statement)).one()
+        return DateBounds(min_date=min_date, max_date=max_date)
+
+    async def aggregate_dashboard(
+        self, user_id: int, max_date, min_date
+    ) -> DashboardAggregates:
+        statement = self.repo.select_dashboard_aggregates(
+            user_id=user_id, max_date=max_date, min_date=min_date
+        )
+        rows = await self.session.execute(statement)
+        return self.repo.read_dashboard_aggregates(rows)
+
+    async def aggregate_dashboard_from_rollup(
+        self, user_id: int, limit: DateFilter
+    ) -> DashboardAggregates:
+        has_rows = await self.session.scalar(
+            self.rollup.select_has_rows(user_id)
+        )
+        statement = self.rollup.select_aggregate_rows(
+            user_id, limit, has_rows=has_rows is not None
+        )
+        rows = await self.session.execute(statement)
+        return self.rollup.read_aggregates(rows, limit)
+
+    async def get_period_dashboard(
+        self, user_id: int, limit: DateFilter
+    ) -> dict:
+        """Same as PaymentRepo.get_period_dashboard."""
+        if not limit.year:
+            bounds = await self.get_date_bounds(user_id)
+            aggregates = await self.aggregate_dashboard(
+                user_id=user_id,
+                max_date=bounds.max_date,
+                min_date=bounds.min_date,
+            )
+            return self.repo.format_period_dashboard(limit, aggregates, bounds)
+        aggregates = await self.aggregate_dashboard_from_rollup(
+            user_id=user_id, limit=limit
+        )
+        return self.repo.format_period_dashboard(limit, aggregates)
+
@@ -0,0 +1,56 @@
+import csv
+import io
+from uuid import uuid4
+
+from sqlalchemy import Integer, any_, func, literal, select
+from sqlalchemy.orm import Session
+from sqlalchemy.types import ARRAY
+
+from app.models import AlchemyBaseModel
+
+
+def id_in(column, ids: list[int]):
+    """Matches ids passed as one array parameter instead of one per id."""
+    return column == any_(literal(ids, ARRAY(Integer)))
+
+
+def lock_user(session: Session, scope: int, user_id: int) -> None:
+    """Serializes writers of the user until the transaction ends."""
+    session.execute(select(func.pg_advisory_xact_lock(scope, user_id)))
+
+
+def reserve_ids(session: Session, model: type[AlchemyBaseModel], size: int):
+    sequence = func.pg_get_serial_sequence(model.__table__.fullname, "id")
+    statement = select(func.nextval(sequence)).select_from(
+        func.generate_series(1, size)
+    )
+    return session.scalars(statement).all()
+
+
+def copy_records(
+    session: Session, model: type[AlchemyBaseModel], records: list[dict]
+) -> list[int]:
+    """Writes records with COPY FROM STDIN, returns their ids.
+
+    Ids are taken from the table sequence beforehand, so the rows need
+    no RETURNING. The copy runs on the session connection and is part
+    of its transaction.
+    """
+    if not records:
+        return []
+    ids = reserve_ids(session, model, len(records))
+    columns = ["id", "uuid", *records[0]]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for record_id, record in zip(ids, records):
+        writer.writerow([record_id, uuid4(), *record.values()])
+    buffer.seek(0)
+    table = model.__table__
+    statement = (
+        f'COPY "{table.schema}"."{table.name}" ({", ".join(columns)}) '
+        "FROM STDIN WITH (FORMAT csv)"
+    )
+    connection = session.connection().connection
+    with connection.cursor() as cursor:
+        cursor.copy_expert(statement, buffer)
+    return ids
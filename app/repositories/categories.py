@@ -1,4 +1,6 @@
 from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.exceptions import (
@@ -8,6 +10,7 @@ from app.exceptions import (
 )
 from app.models import Category
 from app.schemas.categories import CategoryCreate, CategoryShowOne
+from app.settings import CATEGORY_CACHE, DASHBOARD_CACHE
 from app.utils.tools.helpers import sort_options
 
 
@@ -25,20 +28,40 @@ class CategoryRepo:
         return res.scalars().all()
 
     def list_names(self, user_id: int) -> list[str]:
-        results = self.read_all(user_id)
-        return [x.name for x in results]
+        return list(self.get_dict_names(user_id))
 
     def list_statuses(self) -> list[str]:
         return [True, False]
 
-    def get_dict_names(self, user_id: int) -> dict:
-        statement = select(Category).where(Category.user_id == user_id)
-        res = self.session.execute(statement)
-        res = res.scalars().all()
-        tmp_list = [dict(sub.__dict__.items()) for sub in res]
-        all_keys = [x["name"] for x in tmp_list]
-        all_values = [x["id"] for x in tmp_list]
-        return dict(zip(all_keys, all_values))
+    def read_dict_names(self, user_id: int) -> dict[str, int]:
+        statement = (
+            select(Category.name, Category.id)
+            .where(Category.user_id == user_id)
+            .order_by(Category.name)
+        )
+        return {name: id for name, id in self.session.execute(statement)}
+
+    def get_dict_names(self, user_id: int) -> dict[str, int]:
+        """Maps category names to ids, sorted by name.
+
+        Served from the category cache, the database is read on a miss.
+        """
+        if (names := CATEGORY_CACHE.get(user_id)) is None:
+            names = self.read_dict_names(user_id)
+            CATEGORY_CACHE.set(user_id, names)
+        return names
+
+    def get_category_id(self, name: str, user_id: int) -> int:
+        """Resolves a category name to its id.
+
+        An unknown name re-reads the categories once, in case they were
+        changed by another process. Raises KeyError if it is still missing.
+        """
+        names = self.get_dict_names(user_id)
+        if name not in names:
+            names = self.read_dict_names(user_id)
+            CATEGORY_CACHE.set(user_id, names)
+        return names[name]
 
     def get_payments_options(
         self,
@@ -101,31 +124,51 @@ class CategoryRepo:
         self,
         category: CategoryCreate,
     ) -> Category:
-        if new_category := self.read_name(
-            category_name=category.name, user_id=category.user_id
-        ):
+        """Inserts the category in one statement.
+
+        The unique index on (user_id, name) decides duplicates, so two
+        parallel requests cannot both create the same name.
+        """
+        statement = (
+            pg_insert(Category)
+            .values(**category.model_dump())
+            .on_conflict_do_nothing(
+                index_elements=[Category.user_id, Category.name]
+            )
+            .returning(Category)
+        )
+        new_category = self.session.scalars(statement).one_or_none()
+        if new_category is None:
+            self.session.rollback()
             raise DuplicateNameCreateError(category.name)
-        new_category = Category(**category.model_dump())
-        self.session.add(new_category)
         self.session.commit()
-        statement = select(Category).where(Category.id == new_category.id)
-        results = self.session.execute(statement)
-        return results.scalars().one_or_none()
+        CATEGORY_CACHE.invalidate(category.user_id)
+        DASHBOARD_CACHE.invalidate(category.user_id)
+        return new_category
 
     def update(self, category_id: int, to_update: CategoryCreate):
-        previous_state = self.read(category_id)
-        if previous_state.user_id != to_update.user_id:
-            raise NotOwnerError(previous_state.name)
-        category_with_the_same_name = self.read_name(
-            to_update.name, user_id=to_update.user_id
-        )
-        if category_with_the_same_name:
-            if category_with_the_same_name.id != category_id:
-                raise DuplicateNameEditError(category_with_the_same_name.name)
+        """Updates the category of the owner in one statement.
+
+        The category is read only to explain why nothing was updated.
+        """
         statement = (
             update(Category)
             .where(Category.id == category_id)
+            .where(Category.user_id == to_update.user_id)
             .values(name=to_update.name, is_active=to_update.is_active)
+            .returning(Category.id)
         )
-        self.session.execute(statement)
+        try:
+            updated_id = self.session.scalar(statement)
+        except IntegrityError:
+            self.session.rollback()
+            raise DuplicateNameEditError(to_update.name)
+        if updated_id is None:
+            self.session.rollback()
+            previous_state = self.read(category_id)
+            raise NotOwnerError(
+                previous_state.name if previous_state else category_id
+            )
         self.session.commit()
+        CATEGORY_CACHE.invalidate(to_update.user_id)
+        DASHBOARD_CACHE.invalidate(to_update.user_id)
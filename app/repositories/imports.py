@@ -0,0 +1,113 @@
+from collections.abc import Iterable
+from itertools import batched
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.exceptions import BeebError
+from app.models import Category, Income, Payment
+from app.repositories.ledger import LedgerRepo
+from app.repositories.rollups import RollupRepo
+from app.schemas.imports import ImportReport, ImportRow, ImportRowError
+from app.settings import CATEGORY_CACHE, DASHBOARD_CACHE
+from app.utils.constants import IMPORT_CHUNK_SIZE
+
+
+class ImportRepo:
+    """Loads payments and income in bulk.
+
+    Rows are validated and inserted chunk by chunk inside one
+    transaction, invalid rows are reported and skipped. Balance checks
+    are not applied, since history is imported in arbitrary order.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_category_ids(self, user_id: int) -> dict[str, int]:
+        statement = select(Category.name, Category.id).where(
+            Category.user_id == user_id
+        )
+        return {name: id for name, id in self.session.execute(statement)}
+
+    def add_categories(self, user_id: int, names: set[str]) -> None:
+        self.session.execute(
+            pg_insert(Category)
+            .values([{"name": x, "user_id": user_id} for x in names])
+            .on_conflict_do_nothing()
+        )
+
+    def validate(
+        self, chunk: Iterable[tuple[int, dict]], report: ImportReport
+    ) -> list[ImportRow]:
+        rows = []
+        for row_number, values in chunk:
+            try:
+                rows.append(ImportRow(**values))
+            except BeebError as exc:
+                report.errors.append(
+                    ImportRowError(row=row_number, message=exc.message)
+                )
+            except ValidationError as exc:
+                message = "; ".join(x["msg"] for x in exc.errors())
+                report.errors.append(
+                    ImportRowError(row=row_number, message=message)
+                )
+        return rows
+
+    def import_rows(
+        self,
+        user_id: int,
+        rows: Iterable[dict],
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> ImportReport:
+        """Imports rows, the first data row is number 2 after the header."""
+        report = ImportReport()
+        category_ids = self.get_category_ids(user_id)
+        for chunk in batched(enumerate(rows, start=2), chunk_size):
+            valid_rows = self.validate(chunk, report)
+            new_categories = {
+                x.category
+                for x in valid_rows
+                if x.category and x.category not in category_ids
+            }
+            if new_categories:
+                self.add_categories(user_id, new_categories)
+                category_ids = self.get_category_ids(user_id)
+            payments = [
+                {
+                    "user_id": user_id,
+                    "name": x.name,
+                    "amount": x.amount,
+                    "category_id": category_ids[x.category],
+                    "created_at": x.created_at,
+                    "grams": x.grams,
+                    "quantity": x.quantity,
+                }
+                for x in valid_rows
+                if x.category
+            ]
+            income = [
+                {
+                    "user_id": user_id,
+                    "name": x.name,
+                    "amount": x.amount,
+                    "created_at": x.created_at,
+                }
+                for x in valid_rows
+                if not x.category
+            ]
+            if payments:
+                self.session.execute(insert(Payment), payments)
+            if income:
+                self.session.execute(insert(Income), income)
+            report.payments += len(payments)
+            report.income += len(income)
+        LedgerRepo(self.session).rebuild(user_id)
+        RollupRepo(self.session).rebuild(user_id)
+        self.session.commit()
+        CATEGORY_CACHE.invalidate(user_id)
+        DASHBOARD_CACHE.invalidate(user_id)
+        return report
@@ -4,8 +4,12 @@ from sqlalchemy.orm import Session
 
 from app.exceptions import IncomeNotFoundError, NotOwnerError
 from app.models import Income
+from app.repositories.bulk import copy_records
+from app.repositories.ledger import LedgerRepo
+from app.repositories.rollups import RollupRepo
 from app.schemas.dates import DateFilter
 from app.schemas.income import IncomeCreate, IncomeShowOne, IncomeUpdate
+from app.settings import DASHBOARD_CACHE
 
 
 class IncomeRepo:
@@ -13,13 +17,48 @@ class IncomeRepo:
         self.session = session
 
     def create(self, income: IncomeCreate, user_id: int) -> Income:
+        ledger = LedgerRepo(self.session)
+        ledger.ensure(user_id)
+        rollup = RollupRepo(self.session)
+        rollup.ensure(user_id)
         new_income = Income(**income.model_dump())
         self.session.add(new_income)
+        self.session.flush()
+        ledger.apply(
+            user_id=user_id,
+            created_at=new_income.created_at,
+            delta=int(new_income.amount),
+        )
+        rollup.apply(
+            user_id=user_id,
+            created_at=new_income.created_at,
+            amount=int(new_income.amount),
+        )
         self.session.commit()
+        DASHBOARD_CACHE.invalidate(user_id)
         statement = select(Income).where(Income.id == new_income.id)
         results = self.session.execute(statement)
         return results.scalars().one_or_none()
 
+    def bulk_create(
+        self, incomes: list[IncomeCreate], user_id: int
+    ) -> list[int]:
+        """Creates income records with one COPY, returns their ids in order."""
+        if not incomes:
+            return []
+        ledger = LedgerRepo(self.session)
+        ledger.ensure(user_id)
+        rollup = RollupRepo(self.session)
+        rollup.ensure(user_id)
+        ids = copy_records(
+            self.session, Income, [x.model_dump() for x in incomes]
+        )
+        ledger.apply_records(user_id, payment_ids=[], income_ids=ids)
+        rollup.apply_records(user_id, payment_ids=[], income_ids=ids)
+        self.session.commit()
+        DASHBOARD_CACHE.invalidate(user_id)
+        return ids
+
     def read(self, income_id: int) -> Income | None:
         statement = select(Income).where(Income.id == income_id)
         results = self.session.execute(statement)
@@ -32,25 +71,64 @@ class IncomeRepo:
         old_income = self.read(income_id)
         if old_income.user_id != user_id:
             raise NotOwnerError(old_income.name)
+        ledger = LedgerRepo(self.session)
+        ledger.ensure(user_id)
+        rollup = RollupRepo(self.session)
+        rollup.ensure(user_id)
         statement = delete(Income).where(Income.id == income_id)
         self.session.execute(statement)
+        ledger.apply(
+            user_id=user_id,
+            created_at=old_income.created_at,
+            delta=-old_income.amount,
+        )
+        rollup.apply(
+            user_id=user_id,
+            created_at=old_income.created_at,
+            amount=old_income.amount,
+            sign=-1,
+        )
         self.session.commit()
+        DASHBOARD_CACHE.invalidate(user_id)
 
     def update(self, income_id: int, user_id: int, to_update: IncomeUpdate):
         old_income = self.read(income_id)
         if old_income.user_id != user_id:
             raise NotOwnerError(old_income.name)
+        ledger = LedgerRepo(self.session)
+        ledger.ensure(user_id)
+        rollup = RollupRepo(self.session)
+        rollup.ensure(user_id)
+        created_at = to_update.created_at
         statement = (
             update(Income)
             .where(Income.id == income_id)
             .values(
                 name=to_update.name,
                 amount=to_update.amount,
-                created_at=to_update.created_at,
+                created_at=created_at,
             )
         )
         self.session.execute(statement)
+        ledger.apply(
+            user_id=user_id,
+            created_at=old_income.created_at,
+            delta=-old_income.amount,
+        )
+        ledger.apply(
+            user_id=user_id, created_at=created_at, delta=to_update.amount
+        )
+        rollup.apply(
+            user_id=user_id,
+            created_at=old_income.created_at,
+            amount=old_income.amount,
+            sign=-1,
+        )
+        rollup.apply(
+            user_id=user_id, created_at=created_at, amount=to_update.amount
+        )
         self.session.commit()
+        DASHBOARD_CACHE.invalidate(user_id)
 
     def read_all(self, user_id: int) -> list[Income]:
         statement = select(Income).where(Income.user_id == user_id)
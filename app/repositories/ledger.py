@@ -0,0 +1,259 @@
+import datetime
+
+from sqlalchemy import (
+    DateTime,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models import BalanceDelta, BalanceSnapshot, Income, Payment, User
+from app.repositories.bulk import id_in, lock_user
+from app.schemas.ledger import LedgerReport
+from app.settings import SETTINGS
+from app.utils.constants import LEDGER_LOCK_SCOPE
+from app.utils.tools.helpers import to_local_day
+
+
+class LedgerRepo:
+    """Keeps a running balance per user.
+
+    The snapshot holds income minus payments over all records,
+    deltas hold the net change per day. Writes update both in the
+    caller's transaction, so a balance check never sums the history.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def has_snapshot(self, user_id: int) -> bool:
+        statement = select(BalanceSnapshot.user_id).where(
+            BalanceSnapshot.user_id == user_id
+        )
+        return self.session.scalar(statement) is not None
+
+    def ensure(self, user_id: int) -> None:
+        """Builds the ledger from the raw tables if the user has none yet.
+
+        Must be called before the write that is going to be applied,
+        otherwise that write would be counted twice. Concurrent first
+        writes wait for the one that builds it and then skip the build.
+        """
+        if self.has_snapshot(user_id):
+            return
+        lock_user(self.session, LEDGER_LOCK_SCOPE, user_id)
+        if not self.has_snapshot(user_id):
+            self.rebuild(user_id)
+
+    def apply(
+        self, user_id: int, created_at: datetime.datetime, delta: int
+    ) -> None:
+        """Adds delta to the day of created_at and to the snapshot."""
+        if not delta:
+            return
+        delta_statement = pg_insert(BalanceDelta).values(
+            user_id=user_id, day=to_local_day(created_at), delta=delta
+        )
+        self.session.execute(
+            delta_statement.on_conflict_do_update(
+                index_elements=[BalanceDelta.user_id, BalanceDelta.day],
+                set_={
+                    "delta": BalanceDelta.delta
+                    + delta_statement.excluded.delta
+                },
+            )
+        )
+        snapshot_statement = pg_insert(BalanceSnapshot).values(
+            user_id=user_id, balance=delta
+        )
+        self.session.execute(
+            snapshot_statement.on_conflict_do_update(
+                index_elements=[BalanceSnapshot.user_id],
+                set_={
+                    "balance": BalanceSnapshot.balance
+                    + snapshot_statement.excluded.balance,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    def get_balance(
+        self, user_id: int, max_date: datetime.datetime
+    ) -> int | None:
+        """Gets the balance at max_date, None if the ledger is not built.
+
+        Only the deltas of later days and the records of the same day
+        after max_date are read, so the cost does not depend on history.
+        """
+        day = to_local_day(max_date)
+        day_end = func.timezone(
+            SETTINGS.server.timezone, cast(day + 1, DateTime())
+        )
+        later_deltas = (
+            select(func.coalesce(func.sum(BalanceDelta.delta), 0))
+            .where(BalanceDelta.user_id == user_id)
+            .where(BalanceDelta.day > day)
+            .scalar_subquery()
+        )
+        later_payments = (
+            select(func.coalesce(func.sum(Payment.amount), 0))
+            .where(Payment.user_id == user_id)
+            .where(Payment.created_at > max_date)
+            .where(Payment.created_at < day_end)
+            .scalar_subquery()
+        )
+        later_income = (
+            select(func.coalesce(func.sum(Income.amount), 0))
+            .where(Income.user_id == user_id)
+            .where(Income.created_at > max_date)
+            .where(Income.created_at < day_end)
+            .scalar_subquery()
+        )
+        statement = select(
+            BalanceSnapshot.balance
+            - later_deltas
+            + later_payments
+            - later_income
+        ).where(BalanceSnapshot.user_id == user_id)
+        balance = self.session.scalar(statement)
+        return int(balance) if balance is not None else None
+
+    def get_raw_deltas(
+        self,
+        user_id: int,
+        payment_ids: list[int] | None = None,
+        income_ids: list[int] | None = None,
+    ):
+        """Sums records per day, optionally only the given ids."""
+        payments = select(
+            to_local_day(Payment.created_at).label("day"),
+            (-Payment.amount).label("delta"),
+        ).where(Payment.user_id == user_id)
+        income = select(
+            to_local_day(Income.created_at).label("day"),
+            Income.amount.label("delta"),
+        ).where(Income.user_id == user_id)
+        if payment_ids is not None:
+            payments = payments.where(id_in(Payment.id, payment_ids))
+        if income_ids is not None:
+            income = income.where(id_in(Income.id, income_ids))
+        ledger = union_all(payments, income).subquery()
+        return select(
+            ledger.c.day, func.sum(ledger.c.delta).label("delta")
+        ).group_by(ledger.c.day)
+
+    def apply_records(
+        self,
+        user_id: int,
+        payment_ids: list[int] | None = None,
+        income_ids: list[int] | None = None,
+    ) -> None:
+        """Adds freshly inserted records to the ledger in two statements.
+
+        Pass [] for the kind that was not inserted, None means all.
+        """
+        raw_deltas = self.get_raw_deltas(
+            user_id, payment_ids=payment_ids, income_ids=income_ids
+        ).subquery()
+        delta_statement = pg_insert(BalanceDelta).from_select(
+            ["user_id", "day", "delta"],
+            select(literal(user_id), raw_deltas.c.day, raw_deltas.c.delta),
+        )
+        self.session.execute(
+            delta_statement.on_conflict_do_update(
+                index_elements=[BalanceDelta.user_id, BalanceDelta.day],
+                set_={
+                    "delta": BalanceDelta.delta
+                    + delta_statement.excluded.delta
+                },
+            )
+        )
+        total = select(
+            func.coalesce(func.sum(raw_deltas.c.delta), 0)
+        ).scalar_subquery()
+        snapshot_statement = pg_insert(BalanceSnapshot).values(
+            user_id=user_id, balance=total
+        )
+        self.session.execute(
+            snapshot_statement.on_conflict_do_update(
+                index_elements=[BalanceSnapshot.user_id],
+                set_={
+                    "balance": BalanceSnapshot.balance
+                    + snapshot_statement.excluded.balance,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    def rebuild(self, user_id: int) -> None:
+        """Recomputes the ledger of the user from the raw tables."""
+        lock_user(self.session, LEDGER_LOCK_SCOPE, user_id)
+        raw_deltas = self.get_raw_deltas(user_id).subquery()
+        self.session.execute(
+            delete(BalanceDelta).where(BalanceDelta.user_id == user_id)
+        )
+        self.session.execute(
+            insert(BalanceDelta).from_select(
+                ["user_id", "day", "delta"],
+                select(
+                    literal(user_id), raw_deltas.c.day, raw_deltas.c.delta
+                ),
+            )
+        )
+        balance = (
+            select(func.coalesce(func.sum(BalanceDelta.delta), 0))
+            .where(BalanceDelta.user_id == user_id)
+            .scalar_subquery()
+        )
+        snapshot_statement = pg_insert(BalanceSnapshot).values(
+            user_id=user_id, balance=balance
+        )
+        self.session.execute(
+            snapshot_statement.on_conflict_do_update(
+                index_elements=[BalanceSnapshot.user_id],
+                set_={
+                    "balance": snapshot_statement.excluded.balance,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    def verify(self, user_id: int) -> LedgerReport:
+        """Compares the stored ledger with the raw tables."""
+        expected = {
+            row.day: int(row.delta)
+            for row in self.session.execute(self.get_raw_deltas(user_id))
+        }
+        stored = {
+            row.day: int(row.delta)
+            for row in self.session.execute(
+                select(BalanceDelta.day, BalanceDelta.delta).where(
+                    BalanceDelta.user_id == user_id
+                )
+            )
+        }
+        mismatched_days = sorted(
+            day
+            for day in expected.keys() | stored.keys()
+            if expected.get(day, 0) != stored.get(day, 0)
+        )
+        balance = self.session.scalar(
+            select(BalanceSnapshot.balance).where(
+                BalanceSnapshot.user_id == user_id
+            )
+        )
+        return LedgerReport(
+            user_id=user_id,
+            balance=balance,
+            expected_balance=sum(expected.values()),
+            mismatched_days=mismatched_days,
+        )
+
+    def list_user_ids(self) -> list[int]:
+        return self.session.scalars(select(User.id).order_by(User.id)).all()
@@ -1,9 +1,11 @@
 import calendar
 import datetime
+from collections.abc import Iterable, Iterator
 
 from fastapi import Request
 from sqlalchemy import (
     Column,
+    Row,
     String,
     delete,
     desc,
@@ -13,7 +15,8 @@ from sqlalchemy import (
     null,
     select,
     text,
-    union,
+    tuple_,
+    union_all,
     update,
 )
 from sqlalchemy.orm import Session
@@ -27,27 +30,37 @@ from app.exceptions import (
     SpendingOverBalanceError,
 )
 from app.models import Category, Income, Payment
+from app.repositories.bulk import copy_records
 from app.repositories.income import IncomeRepo
-from app.schemas.dates import DateFilter
+from app.repositories.ledger import LedgerRepo
+from app.repositories.rollups import RollupRepo
+from app.schemas.dashboard import DashboardAggregates
+from app.schemas.dates import DateBounds, DateFilter
 from app.schemas.payments import (
+    PaymentCursor,
     PaymentCreate,
-    PaymentShow,
+    PaymentRow,
     PaymentShowOne,
     PaymentUpdate,
 )
-from app.utils.constants import INT_TO_MONTHS, MONTHS
+from app.settings import DASHBOARD_CACHE, METRICS
+from app.utils.constants import INT_TO_MONTHS, MONTHS, STREAM_BATCH_SIZE
+from app.utils.enums import LedgerSource
+from app.utils.tools.analytics import load_payments
 from app.utils.tools.category_helpers import (
     get_payments_shares,
-    get_payments_sums_per_category,
     sort_payment_shares,
 )
 from app.utils.tools.helpers import (
     check_current_year_and_month,
+    filter_by_period,
     get_current_year_and_month,
     get_date_from_datetime_without_year,
     get_max_date_from_year_and_month,
-    get_monthly_payments,
+    get_max_date_from_year_and_month_datetime_format,
+    get_min_date_from_year_and_month_datetime_format,
     get_readable_amount,
+    to_local_time,
 )
 
 
@@ -55,55 +68,48 @@ class PaymentRepo:
     def __init__(self, session: Session) -> None:
         self.session = session
 
-    def get_min_date_overall(self, user_id: int) -> datetime.datetime:
-        payment_subquery = select(func.min(Payment.created_at)).where(
-            Payment.user_id == user_id
-        )
-        income_subquery = select(func.min(Income.created_at)).where(
-            Income.user_id == user_id
-        )
+    def select_date_bounds(
+        self, user_id: int, source: LedgerSource = LedgerSource.all
+    ):
+        """Selects the first and the last record dates in one query.
+
+        Every min/max is a scalar subquery answered by the
+        (user_id, created_at) index, so no join between tables is needed.
+        """
+        models = {
+            LedgerSource.payments: [Payment],
+            LedgerSource.income: [Income],
+            LedgerSource.all: [Payment, Income],
+        }[source]
+        min_dates = [
+            select(func.min(model.created_at))
+            .where(model.user_id == user_id)
+            .scalar_subquery()
+            for model in models
+        ]
+        max_dates = [
+            select(func.max(model.created_at))
+            .where(model.user_id == user_id)
+            .scalar_subquery()
+            for model in models
+        ]
+        return select(func.least(*min_dates), func.greatest(*max_dates))
+
+    def get_date_bounds(
+        self, user_id: int, source: LedgerSource = LedgerSource.all
+    ) -> DateBounds:
+        statement = self.select_date_bounds(user_id, source)
+        min_date, max_date = self.session.execute(statement).one()
+        return DateBounds(min_date=min_date, max_date=max_date)
 
-        statement = (
-            select(
-                func.least(
-                    income_subquery.scalar_subquery(),
-                    payment_subquery.scalar_subquery(),
-                )
-            )
-            .select_from(
-                Income,
-            )
-            .where(Income.user_id == user_id)
-            .join(Payment, Income.user_id == Payment.user_id)
-        )
-        return self.session.execute(statement).scalar()
+    def get_min_date_overall(self, user_id: int) -> datetime.datetime:
+        return self.get_date_bounds(user_id).min_date
 
     def get_max_date_overall(self, user_id: int) -> datetime.datetime:
-        payment_subquery = select(func.max(Payment.created_at)).where(
-            Payment.user_id == user_id
-        )
-        income_subquery = select(func.max(Income.created_at)).where(
-            Income.user_id == user_id
-        )
-
-        statement = (
-            select(
-                func.greatest(
-                    income_subquery.scalar_subquery(),
-                    payment_subquery.scalar_subquery(),
-                )
-            )
-            .select_from(Income)
-            .where(Income.user_id == user_id)
-            .join(Payment, Income.user_id == Payment.user_id)
-        )
-        return self.session.execute(statement).scalar()
+        return self.get_date_bounds(user_id).max_date
 
-    def read_all(
-        self,
-        user_id: int,
-    ) -> list[PaymentShow]:
-        income_subquery = select(
+    def select_income_records(self, user_id: int):
+        return select(
             Income.id,
             Income.uuid,
             Income.name,
@@ -116,7 +122,9 @@ class PaymentRepo:
             null().label("category"),
             literal("доход").label("type"),
         ).where(Income.user_id == user_id)
-        payment_subquery = (
+
+    def select_payment_records(self, user_id: int):
+        return (
             select(
                 Payment.id,
                 Payment.uuid,
@@ -133,58 +141,137 @@ class PaymentRepo:
             .where(Payment.user_id == user_id)
             .join(Payment.payment_category)
         )
-        union_query = union(income_subquery, payment_subquery).order_by(
+
+    def read_all(
+        self,
+        user_id: int,
+        cursor: PaymentCursor | None = None,
+        limit: int | None = None,
+    ) -> list[PaymentRow]:
+        """Reads income and payments, latest first.
+
+        Records are sorted by (created_at, id, type), so a cursor taken
+        from the last record of a page points exactly at the next one.
+        Each branch is limited on its own and only reads the index range
+        before the cursor, so the cost of a page does not grow with history.
+        """
+        income_subquery = self.select_income_records(user_id)
+        payment_subquery = self.select_payment_records(user_id)
+        if cursor:
+            # within the same (created_at, id) a payment sorts before income
+            position = tuple_(
+                literal(cursor.created_at), literal(cursor.id)
+            )
+            income_key = tuple_(Income.created_at, Income.id)
+            income_subquery = income_subquery.where(
+                income_key <= position
+                if cursor.type == "расход"
+                else income_key < position
+            )
+            payment_subquery = payment_subquery.where(
+                tuple_(Payment.created_at, Payment.id) < position
+            )
+        if limit:
+            income_subquery = income_subquery.order_by(
+                desc(Income.created_at), desc(Income.id)
+            ).limit(limit)
+            payment_subquery = payment_subquery.order_by(
+                desc(Payment.created_at), desc(Payment.id)
+            ).limit(limit)
+        records = union_all(income_subquery, payment_subquery).subquery()
+        statement = select(records).order_by(
+            desc(records.c.created_at), desc(records.c.id), desc(records.c.type)
+        )
+        if cursor:
+            statement = statement.where(
+                tuple_(records.c.created_at, records.c.id, records.c.type)
+                < tuple_(
+                    literal(cursor.created_at),
+                    literal(cursor.id),
+                    literal(cursor.type),
+                )
+            )
+        if limit:
+            statement = statement.limit(limit)
+        final_query = self.session.execute(statement)
+        return [PaymentRow.from_row(row) for row in final_query]
+
+    def get_cursor(self, payment: PaymentRow) -> PaymentCursor:
+        return PaymentCursor(
+            created_at=payment.created_at,
+            id=payment.id,
+            type="доход" if payment.type == "доход" else "расход",
+        )
+
+    def select_between_dates(
+        self,
+        user_id: int,
+        max_date: datetime.datetime,
+        min_date: datetime.datetime,
+    ):
+        income_subquery = self.select_income_records(user_id).where(
+            Income.created_at.between(min_date, max_date)
+        )
+        payment_subquery = self.select_payment_records(user_id).where(
+            Payment.created_at.between(min_date, max_date)
+        )
+        return union_all(income_subquery, payment_subquery).order_by(
             desc("created_at")
         )
-        final_query = self.session.execute(union_query)
-        return [PaymentShow(**row._mapping) for row in final_query]
 
     def read_all_between_dates(
         self,
         user_id: int,
         max_date: datetime.datetime,
         min_date: datetime.datetime,
-    ) -> list[PaymentShow]:
-        income_subquery = (
-            select(
-                Income.id,
-                Income.uuid,
-                Income.name,
-                null().label("grams"),
-                null().label("quantity"),
-                Income.amount,
-                null().label("category_id"),
-                Income.user_id,
-                Income.created_at,
-                null().label("category"),
-                literal("доход").label("type"),
-            )
-            .where(Income.user_id == user_id)
-            .where(Income.created_at.between(min_date, max_date))
+    ) -> list[PaymentRow]:
+        final_query = self.session.execute(
+            self.select_between_dates(user_id, max_date, min_date)
         )
-        payment_subquery = (
-            select(
-                Payment.id,
-                Payment.uuid,
-                Payment.name,
-                Payment.grams,
-                Payment.quantity,
-                Payment.amount,
-                Payment.category_id,
-                Payment.user_id,
-                Payment.created_at,
-                Category.name.label("category"),
-                literal("расход").label("type"),
-            )
-            .where(Payment.user_id == user_id)
-            .where(Payment.created_at.between(min_date, max_date))
-            .join(Payment.payment_category)
+        return [PaymentRow.from_row(row) for row in final_query]
+
+    def stream_between_dates(
+        self,
+        user_id: int,
+        max_date: datetime.datetime,
+        min_date: datetime.datetime,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Row]:
+        """Yields the same records as read_all_between_dates, one by one.
+
+        Rows are fetched from a server-side cursor batch_size at a time
+        and are not turned into pydantic models, so memory stays bounded
+        whatever the range. The session must stay open while iterating.
+        """
+        statement = self.select_between_dates(
+            user_id, max_date, min_date
+        ).execution_options(yield_per=batch_size)
+        for partition in self.session.execute(statement).partitions():
+            yield from partition
+
+    def stream_for_period(
+        self,
+        user_id: int,
+        limit: DateFilter,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Row]:
+        """Yields income and payments of a year, a month or all time.
+
+        Works like stream_between_dates, with the dashboard filters.
+        """
+        income_subquery = self.select_income_records(user_id).where(
+            filter_by_period(Income.created_at, limit)
         )
-        union_query = union(income_subquery, payment_subquery).order_by(
-            desc("created_at")
+        payment_subquery = self.select_payment_records(user_id).where(
+            filter_by_period(Payment.created_at, limit)
         )
-        final_query = self.session.execute(union_query)
-        return [PaymentShow(**row._mapping) for row in final_query]
+        statement = (
+            union_all(income_subquery, payment_subquery)
+            .order_by(desc("created_at"))
+            .execution_options(yield_per=batch_size)
+        )
+        for partition in self.session.execute(statement).partitions():
+            yield from partition
 
     def get_spendings(self, payments: list[Payment]) -> list[Payment]:
         return [payment for payment in payments if payment.type != "доход"]
@@ -207,7 +294,7 @@ class PaymentRepo:
         statement = (
             select(Payment)
             .where(Payment.user_id == user_id)
-            .filter(extract("year", Payment.created_at) == year)
+            .where(filter_by_period(Payment.created_at, DateFilter(year=year)))
         )
         res = self.session.execute(statement)
         return res.scalars().all()
@@ -215,11 +302,11 @@ class PaymentRepo:
     def get_payments_per_month(
         self, year: int, month: int, user_id: int
     ) -> list[Payment]:
+        limit = DateFilter(year=year, month=month)
         statement = (
             select(Payment)
             .where(Payment.user_id == user_id)
-            .filter(extract("year", Payment.created_at) == year)
-            .filter(extract("month", Payment.created_at) == month)
+            .where(filter_by_period(Payment.created_at, limit))
         )
         res = self.session.execute(statement)
         return res.scalars().all()
@@ -231,7 +318,7 @@ class PaymentRepo:
             select(Payment)
             .where(Payment.user_id == user_id)
             .join(Payment.payment_category)
-            .filter(extract("year", Payment.created_at) == year)
+            .where(filter_by_period(Payment.created_at, DateFilter(year=year)))
         )
         res = self.session.execute(statement)
         return res.scalars().all()
@@ -240,52 +327,24 @@ class PaymentRepo:
         return self.sum_payment_amounts(payments)
 
     def sum_payment_amounts(self, payments):
-        all_values = [int(x.amount) for x in payments]
-        result = sum(all_values)
-        return result if result else 0
+        return load_payments(payments).total()
 
     def get_max_date(
         self, limit: DateFilter, user_id: int
     ) -> datetime.datetime:
-        if not limit.year and not limit.month:
-            return self.session.scalar(
-                select(func.max(Payment.created_at)).where(
-                    Payment.user_id == user_id
-                )
-            )
-        if limit.year and not limit.month:
-            return self.session.scalar(
-                select(func.max(Payment.created_at))
-                .where(Payment.user_id == user_id)
-                .filter(extract("year", Payment.created_at) == limit.year)
-            )
         return self.session.scalar(
             select(func.max(Payment.created_at))
             .where(Payment.user_id == user_id)
-            .filter(extract("year", Payment.created_at) == limit.year)
-            .filter(extract("month", Payment.created_at) == limit.month)
+            .where(filter_by_period(Payment.created_at, limit))
         )
 
     def get_min_date(
         self, limit: DateFilter, user_id: int
     ) -> datetime.datetime:
-        if not limit.year and not limit.month:
-            return self.session.scalar(
-                select(func.min(Payment.created_at)).where(
-                    Payment.user_id == user_id
-                )
-            )
-        if limit.year and not limit.month:
-            return self.session.scalar(
-                select(func.min(Payment.created_at))
-                .where(Payment.user_id == user_id)
-                .filter(extract("year", Payment.created_at) == limit.year)
-            )
         return self.session.scalar(
             select(func.min(Payment.created_at))
             .where(Payment.user_id == user_id)
-            .filter(extract("year", Payment.created_at) == limit.year)
-            .filter(extract("month", Payment.created_at) == limit.month)
+            .where(filter_by_period(Payment.created_at, limit))
         )
 
     def get_total_days(
@@ -306,21 +365,32 @@ class PaymentRepo:
     def get_monthly_payments(
         self, payments: list[Payment], year: int | None = None
     ) -> dict[str, str]:
-        monthly_payments = get_monthly_payments(payments)
-        sorted_monthly_payments = dict(sorted(monthly_payments.items()))
+        monthly_payments = load_payments(payments).monthly_sums()
+        return self.format_monthly_payments(monthly_payments, year=year)
+
+    def format_monthly_payments(
+        self, monthly_payments: dict, year: int | None = None
+    ) -> dict[str, str]:
+        sorted_monthly_payments = dict(
+            sorted(monthly_payments.items(), key=lambda item: int(item[0]))
+        )
         return {
             MONTHS[calendar.month_name[int(key)]]: (
                 get_readable_amount(value),
-                f"/dashboard/{year}/{key}" if year else None,
+                f"/dashboard/{year}/{str(key).zfill(2)}" if year else None,
             )
             for key, value in sorted_monthly_payments.items()
         }
 
     def get_total_monthly_payments_shares(
-        self, payments: list[Payment]
+        self, payments: Iterable[Payment]
+    ) -> dict:
+        """Reads payments once, so a stream can be passed as well."""
+        return sort_payment_shares(load_payments(payments).shares())
+
+    def format_payments_shares(
+        self, payments_per_categories: dict[str, int], total: int
     ) -> dict:
-        total = self.get_total(payments)
-        payments_per_categories = get_payments_sums_per_category(payments)
         payment_shares = get_payments_shares(
             payments_per_categories=payments_per_categories, total=total
         )
@@ -365,7 +435,14 @@ class PaymentRepo:
         max_date: datetime.datetime,
         previous_payment_amount: int,
     ):
-        balance = self.get_balance(user_id=user_id, max_date=max_date)
+        with METRICS.time_balance_check():
+            balance = LedgerRepo(self.session).get_balance(
+                user_id=user_id, max_date=max_date
+            )
+            if balance is None:
+                balance = self.get_balance(
+                    user_id=user_id, max_date=max_date
+                )
         balance += previous_payment_amount
         remains = balance - desired_payment_amount
         if remains < 0:
@@ -375,6 +452,10 @@ class PaymentRepo:
 
     def create(self, payment: PaymentCreate, user_id: int) -> Payment:
         current_date = datetime.datetime.now()
+        ledger = LedgerRepo(self.session)
+        ledger.ensure(user_id)
+        rollup = RollupRepo(self.session)
+        rollup.ensure(user_id)
         self.check_balance(
             user_id=user_id,
             desired_payment_amount=int(payment.amount),
@@ -383,16 +464,65 @@ class PaymentRepo:
         )
         new_payment = Payment(**payment.model_dump())
         self.session.add(new_payment)
+        self.session.flush()
+        ledger.apply(
+            user_id=user_id,
+            created_at=new_payment.created_at,
+            delta=-int(new_payment.amount),
+        )
+        rollup.apply(
+            user_id=user_id,
+            created_at=new_payment.created_at,
+            amount=int(new_payment.amount),
+            category_id=new_payment.category_id,
+            grams=new_payment.grams,
+            quantity=new_payment.quantity,
+        )
         self.session.commit()
+        DASHBOARD_CACHE.invalidate(user_id)
         statement = select(Payment).where(Payment.id == new_payment.id)
         results = self.session.execute(statement)
         return results.scalars().one_or_none()
 
+    def bulk_create(
+        self, payments: list[PaymentCreate], user_id: int
+    ) -> list[int]:
+        """Creates payments with one COPY, returns their ids in order.
+
+        The balance is checked once against the total of the batch,
+        the ledger and the rollup are updated once per batch.
+        """
+        if not payments:
+            return []
+        ledger = LedgerRepo(self.session)
+        ledger.ensure(user_id)
+        rollup = RollupRepo(self.session)
+        rollup.ensure(user_id)
+        self.check_balance(
+            user_id=user_id,
+            desired_payment_amount=sum(int(x.amount) for x in payments),
+            previous_payment_amount=0,
+            max_date=datetime.datetime.now(),
+        )
+        ids = copy_records(
+            self.session, Payment, [x.model_dump() for x in payments]
+        )
+        ledger.apply_records(user_id, payment_ids=ids, income_ids=[])
+        rollup.apply_records(user_id, payment_ids=ids, income_ids=[])
+        self.session.commit()
+        DASHBOARD_CACHE.invalidate(user_id)
+        return ids
+
     def update(self, payment_id: int, to_update: PaymentUpdate):
         old_payment = self.read(payment_id)
 
         if old_payment.user_id != to_update.user_id:
             raise NotOwnerError(old_payment.name)
+        ledger = LedgerRepo(self.session)
+        ledger.ensure(old_payment.user_id)
+        rollup = RollupRepo(self.session)
+        rollup.ensure(old_payment.user_id)
+        created_at = to_update.date_to_update
         max_date = old_payment.created_at
         self.check_balance(
             user_id=old_payment.user_id,
@@ -408,48 +538,206 @@ class PaymentRepo:
                 name=to_update.name,
                 amount=to_update.amount_in_kopecks,
                 category_id=to_update.category_id,
-                created_at=to_update.date_to_update,
+                created_at=created_at,
                 grams=to_update.grams,
                 quantity=to_update.quantity,
             )
         )
         self.session.execute(statement)
+        ledger.apply(
+            user_id=old_payment.user_id,
+            created_at=old_payment.created_at,
+            delta=old_payment.amount,
+        )
+        ledger.apply(
+            user_id=old_payment.user_id,
+            created_at=created_at,
+            delta=-to_update.amount_in_kopecks,
+        )
+        rollup.apply(
+            user_id=old_payment.user_id,
+            created_at=old_payment.created_at,
+            amount=old_payment.amount,
+            category_id=old_payment.category_id,
+            grams=old_payment.grams,
+            quantity=old_payment.quantity,
+            sign=-1,
+        )
+        rollup.apply(
+            user_id=old_payment.user_id,
+            created_at=created_at,
+            amount=to_update.amount_in_kopecks,
+            category_id=to_update.category_id,
+            grams=to_update.grams,
+            quantity=to_update.quantity,
+        )
         self.session.commit()
+        DASHBOARD_CACHE.invalidate(old_payment.user_id)
 
     def delete(self, payment_id: int, user_id: int):
         old_payment = self.read(payment_id)
         if old_payment.user_id != user_id:
             raise NotOwnerError(old_payment.name)
+        ledger = LedgerRepo(self.session)
+        ledger.ensure(user_id)
+        rollup = RollupRepo(self.session)
+        rollup.ensure(user_id)
         statement = delete(Payment).where(Payment.id == payment_id)
         self.session.execute(statement)
+        ledger.apply(
+            user_id=user_id,
+            created_at=old_payment.created_at,
+            delta=old_payment.amount,
+        )
+        rollup.apply(
+            user_id=user_id,
+            created_at=old_payment.created_at,
+            amount=old_payment.amount,
+            category_id=old_payment.category_id,
+            grams=old_payment.grams,
+            quantity=old_payment.quantity,
+            sign=-1,
+        )
         self.session.commit()
+        DASHBOARD_CACHE.invalidate(user_id)
 
     def get_all_years(self, user_id: int, payments: list[Payment]):
         all_payments = list({x.created_at.year for x in payments})
         all_payments.sort(reverse=True)
         return all_payments
 
+    def select_dashboard_aggregates(
+        self,
+        user_id: int,
+        max_date: datetime.datetime,
+        min_date: datetime.datetime,
+    ):
+        """Selects every dashboard total in a single query.
+
+        Income and payments up to max_date are grouped with GROUPING SETS:
+        - (kind): totals for the balance
+        - (kind, in_period, month): monthly buckets
+        - (kind, in_period, category): category shares
+        - (in_period, year): years that have records
+        """
+        payment_time = to_local_time(Payment.created_at)
+        income_time = to_local_time(Income.created_at)
+        payment_subquery = (
+            select(
+                literal("расход").label("kind"),
+                Payment.amount,
+                Category.name.label("category"),
+                (Payment.created_at >= min_date).label("in_period"),
+                extract("month", payment_time).label("month"),
+                extract("year", payment_time).label("year"),
+            )
+            .join(Payment.payment_category)
+            .where(Payment.user_id == user_id)
+            .where(Payment.created_at <= max_date)
+        )
+        income_subquery = (
+            select(
+                literal("доход").label("kind"),
+                Income.amount,
+                null().label("category"),
+                (Income.created_at >= min_date).label("in_period"),
+                extract("month", income_time).label("month"),
+                extract("year", income_time).label("year"),
+            )
+            .where(Income.user_id == user_id)
+            .where(Income.created_at <= max_date)
+        )
+        ledger = union_all(payment_subquery, income_subquery).subquery()
+        return select(
+            ledger.c.kind,
+            ledger.c.in_period,
+            ledger.c.month,
+            ledger.c.category,
+            ledger.c.year,
+            func.grouping(ledger.c.kind).label("no_kind"),
+            func.grouping(ledger.c.month).label("no_month"),
+            func.grouping(ledger.c.category).label("no_category"),
+            func.sum(ledger.c.amount).label("total"),
+        ).group_by(
+            func.grouping_sets(
+                tuple_(ledger.c.kind),
+                tuple_(ledger.c.kind, ledger.c.in_period, ledger.c.month),
+                tuple_(ledger.c.kind, ledger.c.in_period, ledger.c.category),
+                tuple_(ledger.c.in_period, ledger.c.year),
+            )
+        )
+
+    def read_dashboard_aggregates(
+        self, rows: Iterable[Row]
+    ) -> DashboardAggregates:
+        """Collects the rows of select_dashboard_aggregates."""
+        aggregates = DashboardAggregates()
+        for row in rows:
+            total = int(row.total)
+            if row.no_kind:
+                if row.in_period:
+                    aggregates.years.append(int(row.year))
+            elif row.no_month and row.no_category:
+                if row.kind == "доход":
+                    aggregates.total_income = total
+                else:
+                    aggregates.total_spending = total
+            elif row.kind == "доход" or not row.in_period:
+                continue
+            elif not row.no_month:
+                aggregates.monthly_spending[int(row.month)] = total
+            else:
+                aggregates.category_spending[row.category] = total
+                aggregates.period_spending += total
+        aggregates.years.sort(reverse=True)
+        return aggregates
+
+    def aggregate_dashboard(
+        self,
+        user_id: int,
+        max_date: datetime.datetime,
+        min_date: datetime.datetime,
+    ) -> DashboardAggregates:
+        statement = self.select_dashboard_aggregates(
+            user_id=user_id, max_date=max_date, min_date=min_date
+        )
+        return self.read_dashboard_aggregates(self.session.execute(statement))
+
+    def aggregate_dashboard_from_rollup(
+        self, user_id: int, limit: DateFilter
+    ) -> DashboardAggregates:
+        """Same totals as aggregate_dashboard, read from the monthly rollup."""
+        return RollupRepo(self.session).aggregate(user_id=user_id, limit=limit)
+
     def get_dashboard(
         self,
         user_id: int,
-        payments: list[Payment],
         max_date: datetime.datetime,
         min_date: datetime.datetime,
+        aggregates: DashboardAggregates | None = None,
     ):
-        total_spending = self.sum_payments(user_id=user_id, max_date=max_date)
-        total_income = IncomeRepo(self.session).sum_income(
-            user_id=user_id, max_date=max_date
+        if aggregates is None:
+            aggregates = self.aggregate_dashboard(
+                user_id=user_id, max_date=max_date, min_date=min_date
+            )
+        return self.format_dashboard(
+            aggregates, max_date=max_date, min_date=min_date
         )
-        available_amount = self.get_balance(user_id=user_id, max_date=max_date)
+
+    def format_dashboard(
+        self,
+        aggregates: DashboardAggregates,
+        max_date: datetime.datetime,
+        min_date: datetime.datetime,
+    ) -> dict:
+        """Turns the totals into the template context, without queries."""
+        available_amount = aggregates.balance
         available_amount_frontend = get_readable_amount(available_amount)
-        total_days = self.calculate_total_days(
-            user_id=user_id, min_date=min_date, max_date=max_date
-        )
+        total_days = self.get_total_days(max_date=max_date, min_date=min_date)
 
         rate_per_day = self.get_rate_per_day(
-            expenses=total_spending, elapsed_days=total_days
+            expenses=aggregates.total_spending, elapsed_days=total_days
         )
-        all_spendings = self.get_spendings(payments)
 
         try:
             remaining_days = int(available_amount / rate_per_day)
@@ -468,19 +756,66 @@ class PaymentRepo:
             ),
             "available_amount_frontend": available_amount_frontend,
             "days_left": left_until,
-            "total_income": get_readable_amount(total_income),
-            "total_spending": get_readable_amount(total_spending),
-            "all_spendings": all_spendings,
-            "total_per_month": self.get_monthly_payments(
-                payments=all_spendings, year=year
+            "total_income": get_readable_amount(aggregates.total_income),
+            "total_spending": get_readable_amount(aggregates.total_spending),
+            "total_per_month": self.format_monthly_payments(
+                aggregates.monthly_spending, year=year
             ),
             "rate_per_day": get_readable_amount(rate_per_day),
             "total_shares": list(
-                self.get_total_monthly_payments_shares(all_spendings).items()
+                self.format_payments_shares(
+                    aggregates.category_spending,
+                    total=aggregates.period_spending,
+                ).items()
             ),
+            "all_years": aggregates.years,
             "header_text": f"{capitalized_month} {year} года",
         }
 
+    def get_period_dashboard(self, user_id: int, limit: DateFilter) -> dict:
+        """Builds the dashboard of all time, a year or a month.
+
+        All time is aggregated from the raw tables up to the last record,
+        a year or a month is read from the monthly rollup.
+        """
+        if not limit.year:
+            bounds = self.get_date_bounds(user_id)
+            aggregates = self.aggregate_dashboard(
+                user_id=user_id,
+                max_date=bounds.max_date,
+                min_date=bounds.min_date,
+            )
+            return self.format_period_dashboard(limit, aggregates, bounds)
+        aggregates = self.aggregate_dashboard_from_rollup(
+            user_id=user_id, limit=limit
+        )
+        return self.format_period_dashboard(limit, aggregates)
+
+    def format_period_dashboard(
+        self,
+        limit: DateFilter,
+        aggregates: DashboardAggregates,
+        bounds: DateBounds | None = None,
+    ) -> dict:
+        """Formats a dashboard, bounds default to the whole period."""
+        if bounds is None:
+            bounds = DateBounds(
+                min_date=get_min_date_from_year_and_month_datetime_format(
+                    year=limit.year, month=limit.month or 1
+                ),
+                max_date=get_max_date_from_year_and_month_datetime_format(
+                    year=limit.year, month=limit.month or 12
+                ),
+            )
+        dashboard = self.format_dashboard(
+            aggregates, max_date=bounds.max_date, min_date=bounds.min_date
+        )
+        if not limit.year:
+            dashboard["header_text"] = "Расходы за всё время"
+        elif not limit.month:
+            dashboard["header_text"] = f"Расходы за {limit.year} год"
+        return dashboard
+
     def calculate_total_days(self, user_id, max_date, min_date):
         total_days = self.get_total_days(max_date, min_date)
         return total_days
@@ -0,0 +1,298 @@
+import datetime
+from collections.abc import Iterable
+
+from sqlalchemy import (
+    DateTime,
+    Row,
+    cast,
+    delete,
+    extract,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models import Category, Income, MonthlyRollup, Payment
+from app.repositories.bulk import id_in, lock_user
+from app.schemas.dashboard import DashboardAggregates
+from app.schemas.dates import DateFilter
+from app.utils.constants import INCOME_CATEGORY_ID, ROLLUP_LOCK_SCOPE
+from app.utils.tools.helpers import get_period_bounds, to_local_time
+
+ROLLUP_COLUMNS = [
+    "user_id",
+    "year",
+    "month",
+    "category_id",
+    "amount",
+    "count",
+    "grams",
+    "quantity",
+]
+
+
+class RollupRepo:
+    """Keeps monthly totals per user and category.
+
+    Income is stored under INCOME_CATEGORY_ID. Writes update the rollup
+    in the caller's transaction, reads never touch the raw tables.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def select_has_rows(self, user_id: int):
+        return (
+            select(MonthlyRollup.user_id)
+            .where(MonthlyRollup.user_id == user_id)
+            .limit(1)
+        )
+
+    def has_rows(self, user_id: int) -> bool:
+        statement = self.select_has_rows(user_id)
+        return self.session.scalar(statement) is not None
+
+    def ensure(self, user_id: int) -> None:
+        """Builds the rollup from the raw tables if the user has none yet.
+
+        Must be called before the write that is going to be applied,
+        otherwise that write would be counted twice. Concurrent first
+        writes wait for the one that builds it and then skip the build.
+        """
+        if self.has_rows(user_id):
+            return
+        lock_user(self.session, ROLLUP_LOCK_SCOPE, user_id)
+        if not self.has_rows(user_id):
+            self.rebuild(user_id)
+
+    def apply(
+        self,
+        user_id: int,
+        created_at: datetime.datetime,
+        amount: int,
+        category_id: int = INCOME_CATEGORY_ID,
+        grams: int | None = None,
+        quantity: int | None = None,
+        sign: int = 1,
+    ) -> None:
+        """Adds a record to its month, sign=-1 removes it."""
+        local_time = to_local_time(cast(created_at, DateTime(timezone=True)))
+        statement = pg_insert(MonthlyRollup).values(
+            user_id=user_id,
+            year=extract("year", local_time),
+            month=extract("month", local_time),
+            category_id=category_id,
+            amount=sign * amount,
+            count=sign,
+            grams=sign * (grams or 0),
+            quantity=sign * (quantity or 0),
+        )
+        excluded = statement.excluded
+        self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    MonthlyRollup.user_id,
+                    MonthlyRollup.year,
+                    MonthlyRollup.month,
+                    MonthlyRollup.category_id,
+                ],
+                set_={
+                    "amount": MonthlyRollup.amount + excluded.amount,
+                    "count": MonthlyRollup.count + excluded.count,
+                    "grams": MonthlyRollup.grams + excluded.grams,
+                    "quantity": MonthlyRollup.quantity + excluded.quantity,
+                },
+            )
+        )
+
+    def get_raw_rollup(
+        self,
+        user_id: int,
+        payment_ids: list[int] | None = None,
+        income_ids: list[int] | None = None,
+    ):
+        """Groups records by month and category, optionally only the ids."""
+        payment_time = to_local_time(Payment.created_at)
+        income_time = to_local_time(Income.created_at)
+        payments = select(
+            extract("year", payment_time).label("year"),
+            extract("month", payment_time).label("month"),
+            Payment.category_id,
+            Payment.amount,
+            func.coalesce(Payment.grams, 0).label("grams"),
+            func.coalesce(Payment.quantity, 0).label("quantity"),
+        ).where(Payment.user_id == user_id)
+        income = select(
+            extract("year", income_time).label("year"),
+            extract("month", income_time).label("month"),
+            literal(INCOME_CATEGORY_ID).label("category_id"),
+            Income.amount,
+            literal(0).label("grams"),
+            literal(0).label("quantity"),
+        ).where(Income.user_id == user_id)
+        if payment_ids is not None:
+            payments = payments.where(id_in(Payment.id, payment_ids))
+        if income_ids is not None:
+            income = income.where(id_in(Income.id, income_ids))
+        records = union_all(payments, income).subquery()
+        return select(
+            records.c.year,
+            records.c.month,
+            records.c.category_id,
+            func.sum(records.c.amount).label("amount"),
+            func.count().label("count"),
+            func.sum(records.c.grams).label("grams"),
+            func.sum(records.c.quantity).label("quantity"),
+        ).group_by(records.c.year, records.c.month, records.c.category_id)
+
+    def apply_records(
+        self,
+        user_id: int,
+        payment_ids: list[int] | None = None,
+        income_ids: list[int] | None = None,
+    ) -> None:
+        """Adds freshly inserted records to the rollup in one statement.
+
+        Pass [] for the kind that was not inserted.
+        """
+        raw_rollup = self.get_raw_rollup(
+            user_id, payment_ids=payment_ids, income_ids=income_ids
+        ).subquery()
+        statement = pg_insert(MonthlyRollup).from_select(
+            ROLLUP_COLUMNS, select(literal(user_id), *raw_rollup.c)
+        )
+        excluded = statement.excluded
+        self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    MonthlyRollup.user_id,
+                    MonthlyRollup.year,
+                    MonthlyRollup.month,
+                    MonthlyRollup.category_id,
+                ],
+                set_={
+                    "amount": MonthlyRollup.amount + excluded.amount,
+                    "count": MonthlyRollup.count + excluded.count,
+                    "grams": MonthlyRollup.grams + excluded.grams,
+                    "quantity": MonthlyRollup.quantity + excluded.quantity,
+                },
+            )
+        )
+
+    def rebuild(self, user_id: int) -> None:
+        """Recomputes the rollup of the user from the raw tables."""
+        lock_user(self.session, ROLLUP_LOCK_SCOPE, user_id)
+        raw_rollup = self.get_raw_rollup(user_id).subquery()
+        self.session.execute(
+            delete(MonthlyRollup).where(MonthlyRollup.user_id == user_id)
+        )
+        self.session.execute(
+            insert(MonthlyRollup).from_select(
+                ROLLUP_COLUMNS, select(literal(user_id), *raw_rollup.c)
+            )
+        )
+
+    def read_rows(self, user_id: int) -> set[tuple]:
+        """Returns non-empty rollup rows, used to compare with a rebuild."""
+        statement = (
+            select(
+                MonthlyRollup.year,
+                MonthlyRollup.month,
+                MonthlyRollup.category_id,
+                MonthlyRollup.amount,
+                MonthlyRollup.count,
+                MonthlyRollup.grams,
+                MonthlyRollup.quantity,
+            )
+            .where(MonthlyRollup.user_id == user_id)
+            .where(MonthlyRollup.count != 0)
+        )
+        return {tuple(row) for row in self.session.execute(statement)}
+
+    def select_aggregate_rows(
+        self, user_id: int, limit: DateFilter, has_rows: bool
+    ):
+        """Selects the monthly rows a dashboard of the period needs.
+
+        Totals cover every month before the period end, the rest
+        covers the period only. The rows read are bounded by the number
+        of months times the number of categories. A user without a rollup
+        yet gets the same rows grouped from the raw tables, reads never
+        build it: that is left to the writes and the CLI.
+        """
+        if has_rows:
+            rows = (
+                select(
+                    MonthlyRollup.year,
+                    MonthlyRollup.month,
+                    MonthlyRollup.category_id,
+                    MonthlyRollup.amount,
+                    MonthlyRollup.count,
+                )
+                .where(MonthlyRollup.user_id == user_id)
+                .subquery()
+            )
+        else:
+            rows = self.get_raw_rollup(user_id).subquery()
+        statement = (
+            select(
+                rows.c.year,
+                rows.c.month,
+                rows.c.category_id,
+                rows.c.amount,
+                Category.name.label("category"),
+            )
+            .outerjoin(Category, Category.id == rows.c.category_id)
+            .where(rows.c.count != 0)
+        )
+        if bounds := get_period_bounds(limit):
+            _, end = bounds
+            month_key = tuple_(rows.c.year, rows.c.month)
+            statement = statement.where(month_key < (end.year, end.month))
+        return statement
+
+    def read_aggregates(
+        self, rows: Iterable[Row], limit: DateFilter
+    ) -> DashboardAggregates:
+        """Collects the rows of select_aggregate_rows."""
+        start_key = None
+        if bounds := get_period_bounds(limit):
+            start, _ = bounds
+            start_key = (start.year, start.month)
+        aggregates = DashboardAggregates()
+        years = set()
+        for row in rows:
+            year, month, amount = int(row.year), int(row.month), int(row.amount)
+            is_income = row.category_id == INCOME_CATEGORY_ID
+            if is_income:
+                aggregates.total_income += amount
+            else:
+                aggregates.total_spending += amount
+            if start_key and (year, month) < start_key:
+                continue
+            years.add(year)
+            if is_income:
+                continue
+            aggregates.period_spending += amount
+            aggregates.monthly_spending[month] = (
+                aggregates.monthly_spending.get(month, 0) + amount
+            )
+            aggregates.category_spending[row.category] = (
+                aggregates.category_spending.get(row.category, 0) + amount
+            )
+        aggregates.years = sorted(years, reverse=True)
+        return aggregates
+
+    def aggregate(
+        self, user_id: int, limit: DateFilter
+    ) -> DashboardAggregates:
+        """Computes dashboard totals for a year or a month from the rollup."""
+        statement = self.select_aggregate_rows(
+            user_id, limit, has_rows=self.has_rows(user_id)
+        )
+        return self.read_aggregates(self.session.execute(statement), limit)
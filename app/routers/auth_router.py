@@ -1,15 +1,18 @@
+import inspect
 from functools import wraps
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Form, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 
 from app.exceptions import BeebError
 from app.models import User
 from app.repositories.users import UserRepo
-from app.settings import SETTINGS, TEMPLATES
+from app.settings import METRICS, SETTINGS, TEMPLATES
 from app.utils.dependencies import (
     get_block_name,
+    get_token_from_cookie,
     get_user_id_from_token,
     user_repo,
 )
@@ -19,6 +22,12 @@ auth_router = APIRouter(tags=["Auth"])
 
 
 def authenticate(func):
+    """Checks the token cookie and passes the user id to the handler.
+
+    Sync handlers query the database and render templates, so they are
+    run in the threadpool, the same way FastAPI runs plain sync routes.
+    """
+
     @wraps(func)
     async def wrapper(
         request: Request,
@@ -30,15 +39,24 @@ def authenticate(func):
                 SETTINGS.urls.login, status_code=status.HTTP_303_SEE_OTHER
             )
         try:
-            token = AuthHandler().decode_token(token=request.cookies["token"])
+            token = get_token_from_cookie(request, request.cookies["token"])
             kwargs.pop("user_id")
             user_id = get_user_id_from_token(token)
-        except BeebError:
+        except BeebError as exc:
+            METRICS.count_error(type(exc).__name__)
             return RedirectResponse(
                 SETTINGS.urls.login, status_code=status.HTTP_303_SEE_OTHER
             )
 
-        return func(
+        if inspect.iscoroutinefunction(func):
+            return await func(
+                *args,
+                request=request,
+                user_id=user_id,
+                **kwargs,
+            )
+        return await run_in_threadpool(
+            func,
             *args,
             request=request,
             user_id=user_id,
@@ -71,6 +89,7 @@ def login(
     try:
         user: User = repo.login(username, password)
     except BeebError as exc:
+        METRICS.count_error(type(exc).__name__)
         return TEMPLATES.TemplateResponse(
             request,
             SETTINGS.templates.login,
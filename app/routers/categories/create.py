@@ -9,7 +9,7 @@ from app.exceptions import BeebError
 from app.repositories.categories import CategoryRepo
 from app.routers.auth_router import authenticate
 from app.schemas.categories import CategoryCreate
-from app.settings import SETTINGS, TEMPLATES
+from app.settings import METRICS, SETTINGS, TEMPLATES
 from app.utils.dependencies import categories_repo
 
 create_categories_router = APIRouter()
@@ -44,6 +44,7 @@ def create_category(
             status_code=status.HTTP_303_SEE_OTHER,
         )
     except BeebError as exc:
+        METRICS.count_error(type(exc).__name__)
         return TEMPLATES.TemplateResponse(
             request,
             SETTINGS.templates.create_category,
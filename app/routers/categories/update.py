@@ -9,7 +9,7 @@ from app.exceptions import BeebError
 from app.repositories.categories import CategoryRepo
 from app.routers.auth_router import authenticate
 from app.schemas.categories import CategoryCreate
-from app.settings import SETTINGS, TEMPLATES
+from app.settings import METRICS, SETTINGS, TEMPLATES
 from app.utils.dependencies import categories_repo
 
 update_category_router = APIRouter()
@@ -78,6 +78,7 @@ def update_category(
         )
 
     except BeebError as exc:
+        METRICS.count_error(type(exc).__name__)
         return TEMPLATES.TemplateResponse(
             request,
             SETTINGS.templates.read_payment,
@@ -8,24 +8,35 @@ import select
 from typing import Annotated
 from fastapi import APIRouter
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from pyexcel_odsr import get_data
 from sqlalchemy.orm import Session
 
 from app.models import Category, Payment
 from app.repositories.categories import CategoryRepo
+from app.repositories.imports import ImportRepo
+from app.repositories.ledger import LedgerRepo
+from app.repositories.rollups import RollupRepo
 from app.repositories.payments import PaymentRepo
+from app.routers.auth_router import authenticate
 from app.schemas.categories import CategoryCreate
-from app.settings import PAYMENTS_TO_UPLOAD_DIR
+from app.schemas.imports import ImportReport
+from app.settings import (
+    DASHBOARD_CACHE,
+    PAYMENTS_TO_UPLOAD_DIR,
+    POOL_METRICS,
+)
 from app.utils.constants import CATEGORIES, PRODUCTS
 from app.utils.dependencies import categories_repo, get_session, payments_repo
 from app.utils.tools.category_helpers import add_category_to_db
+from app.utils.tools.data_generator import populate
 from app.utils.tools.helpers import (
     add_payments_to_db,
     convert_to_copecks,
     get_date_for_database,
     get_number_for_db,
 )
+from app.utils.tools.importers import get_upload_path, read_import_rows
 
 dev_router = APIRouter(tags=["Dev"], include_in_schema=True)
 
@@ -69,3 +80,47 @@ def create_payments_in_db(
         add_payments_to_db(
             session, category_id=random.choice(category_ids), user_id=user_id
         )
+    LedgerRepo(session).rebuild(user_id)
+    RollupRepo(session).rebuild(user_id)
+    session.commit()
+    DASHBOARD_CACHE.invalidate(user_id)
+
+
+@dev_router.post("/populate-bulk")
+def populate_bulk(
+    session: Annotated[Session, Depends(get_session)],
+    users: int = 1,
+    years: int = 3,
+    payments_per_day: int = 5,
+    seed: int = 0,
+) -> dict[str, int]:
+    """Creates users generated_1..N with multi-year ledgers via COPY."""
+    return populate(
+        session,
+        users=users,
+        years=years,
+        payments_per_day=payments_per_day,
+        seed=seed,
+    )
+
+
+@dev_router.post("/import-payments")
+@authenticate
+def import_payments_from_file(
+    request: Request,
+    session: Annotated[Session, Depends(get_session)],
+    file_name: str,
+    user_id: int | None = None,
+) -> ImportReport:
+    """Imports a .csv or .ods file from the payments_to_upload folder.
+
+    Payments are added to the user of the token.
+    """
+    path = get_upload_path(PAYMENTS_TO_UPLOAD_DIR, file_name)
+    rows = read_import_rows(path)
+    return ImportRepo(session).import_rows(user_id, rows)
+
+
+@dev_router.get("/pool-metrics")
+def read_pool_metrics():
+    return POOL_METRICS.snapshot()
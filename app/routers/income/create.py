@@ -7,7 +7,7 @@ from app.exceptions import BeebError
 from app.repositories.income import IncomeRepo
 from app.routers.auth_router import authenticate
 from app.schemas.income import IncomeCreate
-from app.settings import SETTINGS, TEMPLATES
+from app.settings import METRICS, SETTINGS, TEMPLATES
 from app.utils.dependencies import income_repo
 from fastapi import Request
 
@@ -51,6 +51,7 @@ def create_income(
         )
 
     except BeebError as exc:
+        METRICS.count_error(type(exc).__name__)
         return TEMPLATES.TemplateResponse(
             request,
             SETTINGS.templates.create_income,
@@ -7,7 +7,7 @@ from fastapi.responses import RedirectResponse
 from app.exceptions import BeebError
 from app.repositories.income import IncomeRepo
 from app.routers.auth_router import authenticate
-from app.settings import SETTINGS, TEMPLATES
+from app.settings import METRICS, SETTINGS, TEMPLATES
 from app.utils.dependencies import income_repo
 
 delete_income_router = APIRouter()
@@ -27,6 +27,7 @@ def delete_income(
             url=SETTINGS.urls.payments, status_code=status.HTTP_303_SEE_OTHER
         )
     except BeebError as exc:
+        METRICS.count_error(type(exc).__name__)
         return TEMPLATES.TemplateResponse(
             request,
             SETTINGS.templates.delete_payment,
@@ -6,7 +6,7 @@ from app.exceptions import BeebError, IncomeNotFoundError
 from app.repositories.income import IncomeRepo
 from app.routers.auth_router import authenticate
 from app.schemas.income import IncomeUpdate
-from app.settings import SETTINGS, TEMPLATES
+from app.settings import METRICS, SETTINGS, TEMPLATES
 from app.utils.dependencies import income_repo
 
 
@@ -50,6 +50,7 @@ def update_income(
             status_code=status.HTTP_303_SEE_OTHER,
         )
     except BeebError as exc:
+        METRICS.count_error(type(exc).__name__)
         return TEMPLATES.TemplateResponse(
             request,
             SETTINGS.templates.update_income,
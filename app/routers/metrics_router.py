@@ -0,0 +1,38 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.settings import (
+    CATEGORY_CACHE,
+    DASHBOARD_CACHE,
+    METRICS,
+    POOL_METRICS,
+    SETTINGS,
+)
+from app.utils.tools.auth_handler import CLAIMS_CACHE
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+def get_cache_counters() -> dict[str, tuple[int, int]]:
+    return {
+        "token_claims": (CLAIMS_CACHE.hits, CLAIMS_CACHE.misses),
+        "dashboard": (
+            DASHBOARD_CACHE.backend.hits,
+            DASHBOARD_CACHE.backend.misses,
+        ),
+        "categories": (
+            CATEGORY_CACHE.backend.hits,
+            CATEGORY_CACHE.backend.misses,
+        ),
+    }
+
+
+@metrics_router.get(SETTINGS.urls.metrics, response_class=PlainTextResponse)
+def read_metrics():
+    """Exposes metrics in the Prometheus text format."""
+    return PlainTextResponse(
+        METRICS.render(
+            pool=POOL_METRICS.snapshot(), caches=get_cache_counters()
+        ),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -11,7 +11,7 @@ from app.repositories.categories import CategoryRepo
 from app.repositories.payments import PaymentRepo
 from app.routers.auth_router import authenticate
 from app.schemas.payments import PaymentCreate
-from app.settings import SETTINGS, TEMPLATES
+from app.settings import METRICS, SETTINGS, TEMPLATES
 from app.utils.dependencies import categories_repo, payments_repo
 
 create_payments_router = APIRouter()
@@ -101,12 +101,13 @@ def create_payment(
     else:
         url = SETTINGS.templates.create_payment_non_food
     try:
-        options = category_repo.get_dict_names(user_id=user_id)
         new_payment = PaymentCreate(
             user_id=user_id,
             name=name,
             amount_in_rub=amount,
-            category_id=options[category],
+            category_id=category_repo.get_category_id(
+                name=category, user_id=user_id
+            ),
             created_at=datetime.now(),
             grams=grams,
             quantity=quantity,
@@ -123,6 +124,7 @@ def create_payment(
                 status_code=status.HTTP_303_SEE_OTHER,
             )
     except BeebError as exc:
+        METRICS.count_error(type(exc).__name__)
         return TEMPLATES.TemplateResponse(
             request,
             url,
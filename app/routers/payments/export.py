@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from app.routers.auth_router import authenticate
+from app.schemas.dates import DateFilter
+from app.settings import SETTINGS
+from app.utils.tools.exporters import export_csv, export_ndjson
+
+export_payments_router = APIRouter()
+
+
+def get_download_headers(limit: DateFilter, extension: str) -> dict:
+    period = "-".join(str(x) for x in (limit.year, limit.month) if x)
+    file_name = f"payments-{period or 'all'}.{extension}"
+    return {"Content-Disposition": f'attachment; filename="{file_name}"'}
+
+
+@export_payments_router.get(SETTINGS.urls.payments_export_csv)
+@authenticate
+async def export_payments_csv(
+    request: Request,
+    year: int | None = None,
+    month: int | None = None,
+    user_id: int | None = None,
+):
+    limit = DateFilter(year=year, month=month)
+    return StreamingResponse(
+        export_csv(user_id, limit),
+        media_type="text/csv; charset=utf-8",
+        headers=get_download_headers(limit, "csv"),
+    )
+
+
+@export_payments_router.get(SETTINGS.urls.payments_export_ndjson)
+@authenticate
+async def export_payments_ndjson(
+    request: Request,
+    year: int | None = None,
+    month: int | None = None,
+    user_id: int | None = None,
+):
+    limit = DateFilter(year=year, month=month)
+    return StreamingResponse(
+        export_ndjson(user_id, limit),
+        media_type="application/x-ndjson",
+        headers=get_download_headers(limit, "ndjson"),
+    )
@@ -1,16 +1,45 @@
 from typing import Annotated
+from urllib.parse import urlencode
 
 from fastapi import APIRouter
 from fastapi import Depends, Request, status
 
+from app.exceptions import BeebError
 from app.repositories.payments import PaymentRepo
 from app.routers.auth_router import authenticate
-from app.settings import SETTINGS, TEMPLATES
+from app.schemas.payments import PaymentCursor
+from app.settings import METRICS, SETTINGS, TEMPLATES
+from app.utils.constants import PAYMENTS_PAGE_SIZE
 from app.utils.dependencies import payments_repo
 
 read_payments_router = APIRouter()
 
 
+def get_page_context(
+    repo: PaymentRepo, user_id: int, cursor: PaymentCursor | None = None
+) -> dict:
+    payments = repo.read_all(
+        user_id=user_id, cursor=cursor, limit=PAYMENTS_PAGE_SIZE + 1
+    )
+    next_page = None
+    if len(payments) > PAYMENTS_PAGE_SIZE:
+        payments = payments[:PAYMENTS_PAGE_SIZE]
+        next_cursor = repo.get_cursor(payments[-1]).encode()
+        next_page = (
+            f"{SETTINGS.urls.payments_page}?"
+            + urlencode({"cursor": next_cursor})
+        )
+    return {
+        "payments": payments,
+        "next_page": next_page,
+        "create": SETTINGS.urls.select_income_expense,
+        "update_payment": SETTINGS.urls.update_payment_core,
+        "update_income": SETTINGS.urls.update_income_core,
+        "delete_payment": SETTINGS.urls.delete_payment_core,
+        "delete_income": SETTINGS.urls.delete_income_core,
+    }
+
+
 @read_payments_router.get(SETTINGS.urls.payments)
 @authenticate
 def read_all(
@@ -19,21 +48,54 @@ def read_all(
     user_id: int | None = None,
 ):
     try:
-        payments = repo.read_all(
-            user_id=user_id,
+        return TEMPLATES.TemplateResponse(
+            request,
+            SETTINGS.templates.read_payments,
+            context=get_page_context(repo=repo, user_id=user_id),
+        )
+    except Exception as exc:
+        return TEMPLATES.TemplateResponse(
+            request,
+            SETTINGS.templates.read_payments,
+            context={
+                "payments": [],
+                "exception": f"Ошибка: {str(exc)}",
+            },
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
         )
 
+
+@read_payments_router.get(SETTINGS.urls.payments_page)
+@authenticate
+def read_page(
+    repo: Annotated[PaymentRepo, Depends(payments_repo)],
+    request: Request,
+    cursor: str,
+    user_id: int | None = None,
+):
+    """Renders the next rows of the list for infinite scroll."""
+    try:
+        return TEMPLATES.TemplateResponse(
+            request,
+            SETTINGS.templates.read_payments,
+            context=get_page_context(
+                repo=repo,
+                user_id=user_id,
+                cursor=PaymentCursor.decode(cursor),
+            ),
+            block_name="rows",
+        )
+    except BeebError as exc:
+        METRICS.count_error(type(exc).__name__)
         return TEMPLATES.TemplateResponse(
             request,
             SETTINGS.templates.read_payments,
             context={
-                "payments": payments,
-                "create": SETTINGS.urls.select_income_expense,
-                "update_payment": SETTINGS.urls.update_payment_core,
-                "update_income": SETTINGS.urls.update_income_core,
-                "delete_payment": SETTINGS.urls.delete_payment_core,
-                "delete_income": SETTINGS.urls.delete_income_core,
+                "payments": [],
+                "exception": exc.detail,
             },
+            block_name="rows",
+            status_code=exc.status_code,
         )
     except Exception as exc:
         return TEMPLATES.TemplateResponse(
@@ -43,5 +105,6 @@ def read_all(
                 "payments": [],
                 "exception": f"Ошибка: {str(exc)}",
             },
+            block_name="rows",
             status_code=status.HTTP_501_NOT_IMPLEMENTED,
         )
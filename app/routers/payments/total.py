@@ -1,59 +1,67 @@
-from datetime import datetime
+from collections.abc import Callable
 from typing import Annotated
 
 from fastapi import APIRouter
 from fastapi import Depends, Request, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.exceptions import BeebError
-from app.repositories.income import IncomeRepo
+from app.repositories.asynchronous import AsyncPaymentRepo
 from app.repositories.payments import PaymentRepo
 from app.routers.auth_router import authenticate
 from app.schemas.dates import DateFilter
-from app.settings import SETTINGS, TEMPLATES
-from app.utils.dependencies import income_repo, payments_repo
-from app.utils.tools.helpers import (
-    get_current_year_and_month,
-    get_max_date_from_year_and_month,
-    get_max_date_from_year_and_month_datetime_format,
-    get_min_date_from_year_and_month_datetime_format,
-)
+from app.settings import DASHBOARD_CACHE, METRICS, SETTINGS, TEMPLATES
+from app.utils.dependencies import async_payments_repo, payments_repo
 
 payments_dashboard_router = APIRouter()
 
 
-@payments_dashboard_router.get(SETTINGS.urls.payments_dashboard)
-@authenticate
-def dashboard_for_all_years(
-    repo: Annotated[PaymentRepo, Depends(payments_repo)],
-    request: Request,
-    user_id: int | None = None,
-):
+def get_dashboard(repo: PaymentRepo, user_id: int, limit: DateFilter) -> dict:
+    if not (dashboard := DASHBOARD_CACHE.get(user_id, limit)):
+        dashboard = repo.get_period_dashboard(user_id, limit)
+        DASHBOARD_CACHE.set(user_id, limit, dashboard)
+    return dashboard
+
+
+async def read_dashboard_async(
+    repo: AsyncPaymentRepo, user_id: int, **limit
+) -> Callable[[], dict]:
+    """Awaits the dashboard, an error is raised once the result is read.
+
+    The cache backend may be a blocking redis client, so it is used
+    from the threadpool.
+    """
     try:
-        max_date = repo.get_max_date_overall(user_id)
-        min_date = repo.get_min_date_overall(user_id)
+        limit = DateFilter(**limit)
+        dashboard = await run_in_threadpool(DASHBOARD_CACHE.get, user_id, limit)
+        if not dashboard:
+            dashboard = await repo.get_period_dashboard(user_id, limit)
+            await run_in_threadpool(
+                DASHBOARD_CACHE.set, user_id, limit, dashboard
+            )
+    except Exception as exc:
+        error = exc
 
-        payments = repo.read_all_between_dates(
-            user_id=user_id, max_date=max_date, min_date=min_date
-        )
+        def read():
+            raise error
 
-        dashboard = repo.get_dashboard(
-            payments=payments,
-            user_id=user_id,
-            max_date=max_date,
-            min_date=min_date,
-        )
-        dashboard["all_years"] = repo.get_all_years(
-            user_id=user_id, payments=payments
-        )
-        dashboard["header_text"] = "Расходы за всё время"
+        return read
+    return lambda: dashboard
 
-        return TEMPLATES.TemplateResponse(
-            request, SETTINGS.templates.payments_dashboard, context=dashboard
-        )
+
+def render_dashboard(
+    request: Request,
+    template: str,
+    error_template: str,
+    read: Callable[[], dict],
+):
+    try:
+        return TEMPLATES.TemplateResponse(request, template, context=read())
     except BeebError as exc:
+        METRICS.count_error(type(exc).__name__)
         return TEMPLATES.TemplateResponse(
             request,
-            SETTINGS.templates.payments_dashboard_monthly,
+            error_template,
             context={
                 "exception": exc.detail,
             },
@@ -62,7 +70,7 @@ def dashboard_for_all_years(
     except Exception as exc:
         return TEMPLATES.TemplateResponse(
             request,
-            SETTINGS.templates.payments_dashboard_monthly,
+            error_template,
             context={
                 "exception": f"Ошибка: {str(exc)}",
                 "status_code": status.HTTP_501_NOT_IMPLEMENTED,
@@ -70,103 +78,108 @@ def dashboard_for_all_years(
         )
 
 
-@payments_dashboard_router.get(SETTINGS.urls.payments_dashboard_yearly)
-@authenticate
-def read_all_payments_per_year(
-    repo: Annotated[PaymentRepo, Depends(payments_repo)],
-    request: Request,
-    year: int,
-    user_id: int | None = None,
-):
-    try:
-        max_date = get_max_date_from_year_and_month_datetime_format(
-            year=year, month=12
-        )
-        min_date = get_min_date_from_year_and_month_datetime_format(
-            year=year, month=1
-        )
-        payments = repo.read_all_between_dates(
-            user_id=user_id, max_date=max_date, min_date=min_date
-        )
-        dashboard = repo.get_dashboard(
-            payments=payments,
-            user_id=user_id,
-            max_date=max_date,
-            min_date=min_date,
-        )
-        dashboard["header_text"] = f"Расходы за {year} год"
+# only the dashboard reads have an async variant, the routes stay sync
+# unless use_async is set, see README
+if SETTINGS.database.use_async:
 
-        return TEMPLATES.TemplateResponse(
+    @payments_dashboard_router.get(SETTINGS.urls.payments_dashboard)
+    @authenticate
+    async def dashboard_for_all_years(
+        repo: Annotated[AsyncPaymentRepo, Depends(async_payments_repo)],
+        request: Request,
+        user_id: int | None = None,
+    ):
+        read = await read_dashboard_async(repo, user_id)
+        return await run_in_threadpool(
+            render_dashboard,
             request,
-            SETTINGS.templates.payments_dashboard_yearly,
-            context=dashboard,
+            SETTINGS.templates.payments_dashboard,
+            SETTINGS.templates.payments_dashboard_monthly,
+            read,
         )
-    except BeebError as exc:
-        return TEMPLATES.TemplateResponse(
+
+    @payments_dashboard_router.get(SETTINGS.urls.payments_dashboard_yearly)
+    @authenticate
+    async def read_all_payments_per_year(
+        repo: Annotated[AsyncPaymentRepo, Depends(async_payments_repo)],
+        request: Request,
+        year: int,
+        user_id: int | None = None,
+    ):
+        read = await read_dashboard_async(repo, user_id, year=year)
+        return await run_in_threadpool(
+            render_dashboard,
             request,
             SETTINGS.templates.payments_dashboard_yearly,
-            context={
-                "exception": exc.detail,
-            },
-            status_code=exc.status_code,
-        )
-    except Exception as exc:
-        return TEMPLATES.TemplateResponse(
-            request,
             SETTINGS.templates.payments_dashboard_yearly,
-            context={
-                "exception": f"Ошибка: {str(exc)}",
-                "status_code": status.HTTP_501_NOT_IMPLEMENTED,
-            },
+            read,
         )
 
-
-@payments_dashboard_router.get(SETTINGS.urls.payments_dashboard_monthly)
-@authenticate
-def read_all_payments_per_month(
-    repo: Annotated[PaymentRepo, Depends(payments_repo)],
-    request: Request,
-    year: int,
-    month: int,
-    user_id: int | None = None,
-):
-    try:
-        max_date = get_max_date_from_year_and_month_datetime_format(
-            year=year, month=month
-        )
-        min_date = get_min_date_from_year_and_month_datetime_format(
-            year=year, month=month
-        )
-        payments = repo.read_all_between_dates(
-            user_id=user_id, max_date=max_date, min_date=min_date
-        )
-        dashboard = repo.get_dashboard(
-            payments=payments,
-            user_id=user_id,
-            max_date=max_date,
-            min_date=min_date,
+    @payments_dashboard_router.get(SETTINGS.urls.payments_dashboard_monthly)
+    @authenticate
+    async def read_all_payments_per_month(
+        repo: Annotated[AsyncPaymentRepo, Depends(async_payments_repo)],
+        request: Request,
+        year: int,
+        month: int,
+        user_id: int | None = None,
+    ):
+        read = await read_dashboard_async(
+            repo, user_id, year=year, month=month
+        )
+        return await run_in_threadpool(
+            render_dashboard,
+            request,
+            SETTINGS.templates.payments_dashboard_monthly,
+            SETTINGS.templates.payments_dashboard_monthly,
+            read,
         )
 
-        return TEMPLATES.TemplateResponse(
+else:
+
+    @payments_dashboard_router.get(SETTINGS.urls.payments_dashboard)
+    @authenticate
+    def dashboard_for_all_years(
+        repo: Annotated[PaymentRepo, Depends(payments_repo)],
+        request: Request,
+        user_id: int | None = None,
+    ):
+        return render_dashboard(
             request,
+            SETTINGS.templates.payments_dashboard,
             SETTINGS.templates.payments_dashboard_monthly,
-            context=dashboard,
+            lambda: get_dashboard(repo, user_id, DateFilter()),
         )
-    except BeebError as exc:
-        return TEMPLATES.TemplateResponse(
+
+    @payments_dashboard_router.get(SETTINGS.urls.payments_dashboard_yearly)
+    @authenticate
+    def read_all_payments_per_year(
+        repo: Annotated[PaymentRepo, Depends(payments_repo)],
+        request: Request,
+        year: int,
+        user_id: int | None = None,
+    ):
+        return render_dashboard(
             request,
-            SETTINGS.templates.payments_dashboard_monthly,
-            context={
-                "exception": exc.detail,
-            },
-            status_code=exc.status_code,
+            SETTINGS.templates.payments_dashboard_yearly,
+            SETTINGS.templates.payments_dashboard_yearly,
+            lambda: get_dashboard(repo, user_id, DateFilter(year=year)),
         )
-    except Exception as exc:
-        return TEMPLATES.TemplateResponse(
+
+    @payments_dashboard_router.get(SETTINGS.urls.payments_dashboard_monthly)
+    @authenticate
+    def read_all_payments_per_month(
+        repo: Annotated[PaymentRepo, Depends(payments_repo)],
+        request: Request,
+        year: int,
+        month: int,
+        user_id: int | None = None,
+    ):
+        return render_dashboard(
             request,
             SETTINGS.templates.payments_dashboard_monthly,
-            context={
-                "exception": f"Ошибка: {str(exc)}",
-                "status_code": status.HTTP_501_NOT_IMPLEMENTED,
-            },
+            SETTINGS.templates.payments_dashboard_monthly,
+            lambda: get_dashboard(
+                repo, user_id, DateFilter(year=year, month=month)
+            ),
         )
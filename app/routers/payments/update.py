@@ -9,7 +9,7 @@ from app.repositories.categories import CategoryRepo
 from app.repositories.payments import PaymentRepo
 from app.routers.auth_router import authenticate
 from app.schemas.payments import PaymentUpdate
-from app.settings import SETTINGS, TEMPLATES
+from app.settings import METRICS, SETTINGS, TEMPLATES
 from app.utils.dependencies import categories_repo, payments_repo
 
 update_payment_router = APIRouter()
@@ -72,12 +72,13 @@ def update_payment(
     user_id: int | None = None,
 ):
     try:
-        options = category_repo.get_dict_names(user_id=user_id)
         to_update = PaymentUpdate(
             user_id=user_id,
             name=name,
             amount=amount,
-            category_id=options[category],
+            category_id=category_repo.get_category_id(
+                name=category, user_id=user_id
+            ),
             date=date,
         )
         repo.update(payment_id=payment_id, to_update=to_update)
@@ -85,6 +86,7 @@ def update_payment(
             url=SETTINGS.urls.payments, status_code=status.HTTP_303_SEE_OTHER
         )
     except BeebError as exc:
+        METRICS.count_error(type(exc).__name__)
         return TEMPLATES.TemplateResponse(
             request,
             SETTINGS.templates.read_payment,
@@ -2,11 +2,13 @@ from fastapi import APIRouter
 
 from app.routers.payments.create import create_payments_router
 from app.routers.payments.delete import delete_payments_router
+from app.routers.payments.export import export_payments_router
 from app.routers.payments.read_all import read_payments_router
 from app.routers.payments.total import payments_dashboard_router
 from app.routers.payments.update import update_payment_router
 
 payments_router = APIRouter(tags=["payments"])
+payments_router.include_router(export_payments_router)
 payments_router.include_router(create_payments_router)
 payments_router.include_router(read_payments_router)
 payments_router.include_router(update_payment_router)
@@ -7,7 +7,7 @@ from fastapi.responses import RedirectResponse
 from app.exceptions import BeebError, EmptyStringError
 from app.repositories.users import UserRepo
 from app.schemas.users import UserCreate
-from app.settings import SETTINGS, TEMPLATES
+from app.settings import METRICS, SETTINGS, TEMPLATES
 from app.utils.dependencies import get_block_name, user_repo
 
 create_users_router = APIRouter()
@@ -48,6 +48,7 @@ def create_user_in_db(
     except ValueError as exc:
         raise EmptyStringError(exc.args[0])
     except BeebError as exc:
+        METRICS.count_error(type(exc).__name__)
         return TEMPLATES.TemplateResponse(
             request,
             SETTINGS.templates.home_page,
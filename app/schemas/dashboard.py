@@ -0,0 +1,23 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field, computed_field
+
+
+class DashboardAggregates(BaseModel):
+    """Totals needed to render a dashboard, computed in one round trip.
+
+    - total_spending and total_income cover everything up to the period end
+    - the remaining fields cover only the requested period
+    """
+
+    total_spending: Annotated[int, Field(default=0)]
+    total_income: Annotated[int, Field(default=0)]
+    period_spending: Annotated[int, Field(default=0)]
+    monthly_spending: dict[int, int] = Field(default_factory=dict)
+    category_spending: dict[str, int] = Field(default_factory=dict)
+    years: list[int] = Field(default_factory=list)
+
+    @computed_field
+    @property
+    def balance(cls) -> int:
+        return cls.total_income - cls.total_spending
@@ -1,6 +1,13 @@
+import datetime
+
 from pydantic import BaseModel, Field
 
 
 class DateFilter(BaseModel):
     year: int | None = Field(default=None)
     month: int | None = Field(default=None)
+
+
+class DateBounds(BaseModel):
+    min_date: datetime.datetime | None = Field(default=None)
+    max_date: datetime.datetime | None = Field(default=None)
@@ -0,0 +1,92 @@
+import datetime
+from typing import Annotated
+
+from pydantic import (
+    BaseModel,
+    Field,
+    StringConstraints,
+    computed_field,
+    field_validator,
+)
+
+from app.utils.tools.helpers import (
+    convert_to_copecks,
+    get_date_for_database,
+    prevent_blank_strings,
+    validate_positive_number_for_db,
+)
+
+
+class ImportRow(BaseModel):
+    """One spreadsheet row, a payment if it has a category, else income.
+
+    amount is in rubles, as people type it, e.g. "1 200 ₽".
+    """
+
+    name: Annotated[
+        str,
+        StringConstraints(
+            min_length=1, max_length=255, strip_whitespace=True, to_lower=True
+        ),
+    ]
+    amount_in_rub: Annotated[int, Field(exclude=True)]
+    category: str | None = None
+    created_at: datetime.datetime
+    grams: int | None = None
+    quantity: int | None = None
+
+    @field_validator("name")
+    def prevent_blank_strings(cls, value):
+        return prevent_blank_strings(value)
+
+    @field_validator("amount_in_rub", mode="before")
+    @classmethod
+    def validate_amount_in_rub(cls, value) -> int:
+        if isinstance(value, str):
+            for symbol in ("₽", " ", "\xa0", "\u202f"):
+                value = value.replace(symbol, "")
+        return validate_positive_number_for_db(value)
+
+    @field_validator("grams", "quantity", mode="before")
+    @classmethod
+    def validate_optional_number(cls, value) -> int | None:
+        if value in ("", None):
+            return None
+        return validate_positive_number_for_db(value)
+
+    @field_validator("category", mode="before")
+    @classmethod
+    def validate_category(cls, value) -> str | None:
+        if not value or not str(value).strip():
+            return None
+        return str(value).strip().lower()
+
+    @field_validator("created_at", mode="before")
+    @classmethod
+    def validate_created_at(cls, value) -> datetime.datetime:
+        if isinstance(value, datetime.datetime):
+            return value if value.tzinfo else value.astimezone()
+        if isinstance(value, datetime.date):
+            midnight = datetime.datetime.combine(value, datetime.time())
+            return midnight.astimezone()
+        value = str(value).strip()
+        try:
+            return datetime.datetime.fromisoformat(value).astimezone()
+        except ValueError:
+            return get_date_for_database(value)
+
+    @computed_field
+    @property
+    def amount(cls) -> int:
+        return convert_to_copecks(cls.amount_in_rub)
+
+
+class ImportRowError(BaseModel):
+    row: int
+    message: str
+
+
+class ImportReport(BaseModel):
+    payments: Annotated[int, Field(default=0)]
+    income: Annotated[int, Field(default=0)]
+    errors: list[ImportRowError] = Field(default_factory=list)
@@ -0,0 +1,18 @@
+import datetime
+from typing import Annotated
+
+from pydantic import BaseModel, Field, computed_field
+
+
+class LedgerReport(BaseModel):
+    user_id: Annotated[int, Field(gt=0)]
+    balance: int | None = None
+    expected_balance: Annotated[int, Field(default=0)]
+    mismatched_days: list[datetime.date] = Field(default_factory=list)
+
+    @computed_field
+    @property
+    def is_consistent(cls) -> bool:
+        return (cls.balance or 0) == cls.expected_balance and not (
+            cls.mismatched_days
+        )
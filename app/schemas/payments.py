@@ -1,3 +1,4 @@
+import base64
 import datetime
 from typing import Annotated
 from uuid import UUID
@@ -11,6 +12,7 @@ from pydantic import (
 )
 
 from app.exceptions import (
+    InvalidCursorError,
     NotIntegerError,
     NotPositiveValueError,
     ValueTooLargeError,
@@ -85,6 +87,106 @@ class PaymentShow(PaymentBase):
         return value
 
 
+class PaymentRow:
+    """Read-only record for list pages, a drop-in for PaymentShow.
+
+    Built straight from a SQLAlchemy row without validation.
+    Display fields are computed only when a template reads them.
+    """
+
+    __slots__ = (
+        "id",
+        "uuid",
+        "name",
+        "grams",
+        "quantity",
+        "amount",
+        "category_id",
+        "user_id",
+        "created_at",
+        "category",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        uuid: UUID,
+        name: str,
+        grams: int | None,
+        quantity: int | None,
+        amount: int,
+        category_id: int | None,
+        user_id: int,
+        created_at: datetime.datetime,
+        category: str | None = None,
+    ) -> None:
+        self.id = id
+        self.uuid = uuid
+        self.name = name
+        self.grams = grams
+        self.quantity = quantity
+        self.amount = amount
+        self.category_id = category_id
+        self.user_id = user_id
+        self.created_at = created_at
+        self.category = category or "зарплата"
+
+    @classmethod
+    def from_row(cls, row) -> "PaymentRow":
+        return cls(
+            id=row.id,
+            uuid=row.uuid,
+            name=row.name,
+            grams=row.grams,
+            quantity=row.quantity,
+            amount=row.amount,
+            category_id=row.category_id,
+            user_id=row.user_id,
+            created_at=row.created_at,
+            category=row.category,
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PaymentRow):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.__slots__
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"PaymentRow(id={self.id}, uuid={self.uuid}, name={self.name!r}, "
+            f"amount={self.amount}, created_at={self.created_at})"
+        )
+
+    @property
+    def readable_grams(self) -> str:
+        return get_readable_number(self.grams) if self.grams else None
+
+    @property
+    def readable_quantity(self) -> str:
+        return get_readable_number(self.quantity) if self.quantity else None
+
+    @property
+    def amount_in_rub(self) -> str:
+        return get_readable_amount(self.amount) if self.amount else None
+
+    @property
+    def date(self) -> str:
+        return get_date_from_datetime_without_year(date=self.created_at)
+
+    @property
+    def type(self) -> str:
+        if not any([self.grams, self.quantity, self.category_id]):
+            return "доход"
+        elif not self.quantity:
+            return "еда"
+        return "вещь"
+
+
 class PaymentShowOne(PaymentShow):
     user_id: Annotated[int, Field(gt=0, exclude=True)]
 
@@ -152,3 +254,23 @@ class PaymentUpdate(PaymentBase):
     @property
     def date_to_update(cls) -> datetime.datetime:
         return get_date_for_database(cls.date)
+
+
+class PaymentCursor(BaseModel):
+    """Position in the list of records sorted by (created_at, id, type)."""
+
+    created_at: datetime.datetime
+    id: int
+    type: str
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(
+            self.model_dump_json().encode()
+        ).decode()
+
+    @classmethod
+    def decode(cls, value: str) -> "PaymentCursor":
+        try:
+            return cls.model_validate_json(base64.urlsafe_b64decode(value))
+        except ValueError:
+            raise InvalidCursorError(value)
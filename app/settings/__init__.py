@@ -1,10 +1,19 @@
 from functools import lru_cache
 from pathlib import Path
 
-from jinja2_fragments.fastapi import Jinja2Blocks
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
 
 from app.settings.schema import Settings
+from app.utils.tools.cache import (
+    CategoryCache,
+    DashboardCache,
+    build_cache_backend,
+)
+from app.utils.tools.metrics import Metrics
+from app.utils.tools.pool_metrics import PoolMetrics
+from app.utils.tools.request_stats import QueryStats, TimedTemplates
 
 
 @lru_cache
@@ -15,10 +24,48 @@ def get_settings():
 SETTINGS = get_settings()
 
 ENGINE = create_engine(
-    url=SETTINGS.database.db_url, echo=eval(SETTINGS.server.debug)
+    url=SETTINGS.database.db_url,
+    echo=eval(SETTINGS.server.debug),
+    **SETTINGS.database.engine_options,
+)
+SESSION_FACTORY = sessionmaker(bind=ENGINE)
+POOL_METRICS = PoolMetrics()
+POOL_METRICS.register(ENGINE)
+METRICS = Metrics()
+QUERY_STATS = QueryStats(slow_query_ms=SETTINGS.server.slow_query_ms)
+QUERY_STATS.register(ENGINE)
+
+ASYNC_ENGINE = None
+ASYNC_SESSION_FACTORY = None
+if SETTINGS.database.use_async:
+    ASYNC_ENGINE = create_async_engine(
+        url=SETTINGS.database.async_db_url,
+        echo=eval(SETTINGS.server.debug),
+        **SETTINGS.database.async_engine_options,
+    )
+    ASYNC_SESSION_FACTORY = async_sessionmaker(
+        bind=ASYNC_ENGINE, expire_on_commit=False
+    )
+    QUERY_STATS.register(ASYNC_ENGINE.sync_engine)
+
+DASHBOARD_CACHE = DashboardCache(
+    build_cache_backend(
+        SETTINGS.server.selected_cache_backend,
+        max_size=SETTINGS.server.dashboard_cache_size,
+        redis_url=SETTINGS.server.redis_url,
+        namespace="beeb:dashboard",
+    )
+)
+CATEGORY_CACHE = CategoryCache(
+    build_cache_backend(
+        SETTINGS.server.selected_cache_backend,
+        max_size=SETTINGS.server.category_cache_size,
+        redis_url=SETTINGS.server.redis_url,
+        namespace="beeb:categories",
+    )
 )
 
 TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 PAYMENTS_TO_UPLOAD_DIR = Path(__file__).parent.parent / "payments_to_upload"
-TEMPLATES = Jinja2Blocks(directory=TEMPLATES_DIR)
+TEMPLATES = TimedTemplates(directory=TEMPLATES_DIR)
 TEMPLATES.env.globals["URLS"] = SETTINGS.urls
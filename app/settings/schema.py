@@ -36,6 +36,25 @@ class ServerSettings(BaseModel):
     port: int
     debug: str
     log_level: str = "critical"
+    timezone: str = "Europe/Moscow"
+    dashboard_cache_size: int = 1024
+    category_cache_size: int = 1024
+    slow_query_ms: int = 100
+    workers: int = 1
+    cache_backend: str = ""
+    redis_url: str = "redis://localhost:6379/0"
+
+    @property
+    def selected_cache_backend(self) -> str:
+        """Backend of the dashboard and category caches.
+
+        An empty cache_backend picks "memory" for one worker and "redis"
+        for several: a memory cache is per process, so a write would only
+        invalidate the entries of the worker that handled it.
+        """
+        if self.cache_backend:
+            return self.cache_backend
+        return "redis" if self.workers > 1 else "memory"
 
 
 class DatabaseSettings(BaseModel):
@@ -47,6 +66,13 @@ class DatabaseSettings(BaseModel):
     database: str
     user: str
     password: str
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_pre_ping: bool = True
+    pool_recycle: int = 1800
+    statement_timeout: int = 0
+    use_async: bool = False
+    async_dialect: str = "postgresql+asyncpg"
 
     @computed_field
     @property
@@ -60,9 +86,45 @@ class DatabaseSettings(BaseModel):
             database=self.database,
         )
 
+    @computed_field
+    @property
+    def async_db_url(self) -> URL:
+        return self.db_url.set(drivername=self.async_dialect)
+
+    @property
+    def engine_options(self) -> dict:
+        """Keyword arguments for create_engine.
+
+        statement_timeout is in milliseconds, 0 disables it.
+        """
+        options = {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_pre_ping": self.pool_pre_ping,
+            "pool_recycle": self.pool_recycle,
+        }
+        if self.statement_timeout:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={self.statement_timeout}"
+            }
+        return options
+
+    @property
+    def async_engine_options(self) -> dict:
+        """Keyword arguments for create_async_engine with asyncpg."""
+        options = self.engine_options
+        if self.statement_timeout:
+            options["connect_args"] = {
+                "server_settings": {
+                    "statement_timeout": str(self.statement_timeout)
+                }
+            }
+        return options
+
 
 class Urls(BaseModel):
     ping: str
+    metrics: str
     signup: str
     login: str
     select_food_non_food: str
@@ -72,6 +134,9 @@ class Urls(BaseModel):
     create_payment_non_food: str
     payment: str
     payments: str
+    payments_page: str
+    payments_export_csv: str
+    payments_export_ndjson: str
     update_payment_core: str
     update_payment: str
     delete_payment_core: str
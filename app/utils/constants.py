@@ -58,3 +58,23 @@ INT_TO_MONTHS = {
     11: "ноябрь",
     12: "декабрь",
 }
+
+INCOME_CATEGORY_ID = 0
+
+# first key of pg_advisory_xact_lock, the second one is the user id
+LEDGER_LOCK_SCOPE = 1
+ROLLUP_LOCK_SCOPE = 2
+
+PAYMENTS_PAGE_SIZE = 50
+
+STREAM_BATCH_SIZE = 1000
+
+TOKEN_CACHE_SIZE = 4096
+
+IMPORT_CHUNK_SIZE = 5000
+
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+GENERATOR_CHUNK_SIZE = 50_000
+
+GENERATED_USER_PASSWORD = "generated_password"
@@ -1,24 +1,32 @@
 from typing import Annotated
 
-from fastapi import Cookie, Depends, Header
-from sqlalchemy.orm import Session, sessionmaker
+from fastapi import Cookie, Depends, Header, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.repositories.asynchronous import AsyncPaymentRepo
 from app.repositories.categories import CategoryRepo
 from app.repositories.income import IncomeRepo
 from app.repositories.payments import PaymentRepo
 from app.repositories.users import UserRepo
-from app.settings import ENGINE
+from app.settings import ASYNC_SESSION_FACTORY, SESSION_FACTORY
 from app.utils.tools.auth_handler import AuthHandler
 
 
 def get_session():
-    session = sessionmaker(bind=ENGINE)
+    session = SESSION_FACTORY()
     try:
-        yield (session := session())
+        yield session
     finally:
         session.close()
 
 
+async def get_async_session():
+    """Yields an AsyncSession, only available if use_async is set."""
+    async with ASYNC_SESSION_FACTORY() as session:
+        yield session
+
+
 def user_repo(session: Session = Depends(get_session)) -> UserRepo:
     return UserRepo(session)
 
@@ -35,12 +43,24 @@ def income_repo(session: Session = Depends(get_session)) -> IncomeRepo:
     return IncomeRepo(session)
 
 
+async def async_payments_repo(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncPaymentRepo:
+    return AsyncPaymentRepo(session)
+
+
 def get_block_name(hx_request: Annotated[str | None, Header()] = None):
     return "body" if hx_request else None
 
 
-def get_token_from_cookie(token: Annotated[str | None, Cookie()]):
-    return AuthHandler().decode_token(token)
+def get_token_from_cookie(
+    request: Request, token: Annotated[str | None, Cookie()]
+):
+    """Reuses the claims decoded by authenticate for this request."""
+    if claims := getattr(request.state, "token_claims", None):
+        return claims
+    request.state.token_claims = AuthHandler().decode_token(token)
+    return request.state.token_claims
 
 
 def get_user_id_from_token(
@@ -8,3 +8,9 @@ class CategoryStatus(StrEnum):
     @classmethod
     def list_names(cls):
         return list(map(lambda c: c.value, cls))
+
+
+class LedgerSource(StrEnum):
+    payments = "payments"
+    income = "income"
+    all = "all"
@@ -0,0 +1,117 @@
+"""Dashboard statistics over payment lists, vectorized with NumPy.
+
+NumPy is an optional dependency (the "analytics" extra). Without it
+load_payments falls back to the plain Python helpers.
+"""
+
+from collections.abc import Iterable
+
+from app.models import Payment
+from app.utils.tools.category_helpers import (
+    get_payments_shares,
+    get_payments_sums_per_category,
+)
+from app.utils.tools.helpers import get_monthly_payments, get_readable_amount
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+class PaymentArrays:
+    """Amounts, months and categories of payments as arrays.
+
+    Payments are read once with np.fromiter, every statistic is then
+    computed without a Python loop over the payments.
+    """
+
+    def __init__(self, payments: Iterable[Payment]) -> None:
+        category_codes = {}
+        rows = np.fromiter(
+            (
+                (
+                    payment.amount,
+                    payment.created_at.month,
+                    category_codes.setdefault(
+                        getattr(payment, "category", None),
+                        len(category_codes),
+                    ),
+                )
+                for payment in payments
+            ),
+            dtype=[
+                ("amount", np.int64),
+                ("month", np.int64),
+                ("category", np.int64),
+            ],
+        )
+        self.amounts = rows["amount"]
+        self.months = rows["month"]
+        self.category_names = list(category_codes)
+        self.category_codes = rows["category"]
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def total(self) -> int:
+        return int(self.amounts.sum())
+
+    def sums_by(self, codes, size: int):
+        counts = np.bincount(codes, minlength=size)
+        sums = np.bincount(codes, weights=self.amounts, minlength=size)
+        return counts, np.rint(sums).astype(np.int64)
+
+    def monthly_sums(self) -> dict[str, int]:
+        """Same result as helpers.get_monthly_payments."""
+        counts, sums = self.sums_by(self.months, 13)
+        return {
+            f"{month:02d}": int(sums[month]) for month in np.flatnonzero(counts)
+        }
+
+    def shares(self) -> dict:
+        """Same result as category_helpers.get_payments_shares."""
+        if not len(self):
+            return {}
+        _, sums = self.sums_by(self.category_codes, len(self.category_names))
+        percents = sums * 100 // sums.sum()
+        return {
+            int(percent): (name, get_readable_amount(int(amount)))
+            for name, amount, percent in zip(
+                self.category_names, sums, percents
+            )
+        }
+
+
+class PaymentList:
+    """Same statistics as PaymentArrays with the plain Python helpers."""
+
+    def __init__(self, payments: Iterable[Payment]) -> None:
+        self.payments = list(payments)
+
+    def __len__(self) -> int:
+        return len(self.payments)
+
+    def total(self) -> int:
+        return sum(int(x.amount) for x in self.payments)
+
+    def monthly_sums(self) -> dict[str, int]:
+        return get_monthly_payments(self.payments)
+
+    def shares(self) -> dict:
+        category_sums = get_payments_sums_per_category(self.payments)
+        return get_payments_shares(category_sums, sum(category_sums.values()))
+
+
+def load_payments(
+    payments: Iterable[Payment],
+) -> PaymentArrays | PaymentList:
+    """Reads payments once, into arrays if numpy is installed.
+
+    Load them once and compute every statistic from the result.
+    """
+    if not HAS_NUMPY:
+        return PaymentList(payments)
+    return PaymentArrays(payments)
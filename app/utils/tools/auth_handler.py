@@ -1,4 +1,7 @@
 import datetime
+import threading
+import time
+from collections import OrderedDict
 from datetime import timedelta
 
 from fastapi import Response
@@ -6,6 +9,52 @@ from jose import ExpiredSignatureError, JWTError, jwt
 
 from app.exceptions import ExpiredTokenError, InvalidTokenError
 from app.settings import SETTINGS
+from app.utils.constants import TOKEN_CACHE_SIZE
+
+
+class ClaimsCache:
+    """Verified tokens and their claims, bounded by max_size.
+
+    A token is kept until its exp, after that it is decoded again,
+    so an expired token still raises ExpiredTokenError.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.claims: OrderedDict[str, dict] = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> dict | None:
+        with self.lock:
+            claims = self.claims.get(token)
+            if claims is None:
+                self.misses += 1
+                return None
+            if claims["exp"] <= time.time():
+                del self.claims[token]
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.claims.move_to_end(token)
+            return dict(claims)
+
+    def set(self, token: str, claims: dict) -> None:
+        if "exp" not in claims:
+            return
+        with self.lock:
+            self.claims[token] = dict(claims)
+            self.claims.move_to_end(token)
+            while len(self.claims) > self.max_size:
+                self.claims.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.claims.clear()
+
+
+CLAIMS_CACHE = ClaimsCache(max_size=TOKEN_CACHE_SIZE)
 
 
 class AuthHandler:
@@ -30,12 +79,16 @@ class AuthHandler:
         return jwt.encode(payload, self.secret)
 
     def decode_token(self, token: str) -> dict:
+        if claims := CLAIMS_CACHE.get(token):
+            return claims
         try:
-            return jwt.decode(token, self.secret)
+            claims = jwt.decode(token, self.secret)
         except ExpiredSignatureError as exc:
             raise ExpiredTokenError from exc
         except JWTError as exc:
             raise InvalidTokenError from exc
+        CLAIMS_CACHE.set(token, claims)
+        return claims
 
     def set_cookies(self, response: Response, username: str, id: int):
         return response.set_cookie(
@@ -0,0 +1,181 @@
+import datetime
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+from app.schemas.dates import DateFilter
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+class CacheBackend(ABC):
+    """Storage for cached values, keyed by strings."""
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None: ...
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class MemoryCache(CacheBackend):
+    """In-process LRU cache holding at most max_size values."""
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.values: OrderedDict[str, Any] = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any | None:
+        with self.lock:
+            if key not in self.values:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.values.move_to_end(key)
+            return self.values[key]
+
+    def set(self, key: str, value: Any) -> None:
+        with self.lock:
+            self.values[key] = value
+            self.values.move_to_end(key)
+            while len(self.values) > self.max_size:
+                self.values.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self.lock:
+            for key in [x for x in self.values if x.startswith(prefix)]:
+                del self.values[key]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.values.clear()
+
+
+class RedisCache(CacheBackend):
+    """Adapter for a Redis-like client.
+
+    The client needs get, set, scan_iter and delete.
+    Values are stored as JSON, eviction is left to the store
+    (maxmemory-policy allkeys-lru). Hits and misses are counted per
+    process, like MemoryCache.
+    """
+
+    def __init__(self, client, namespace: str = "beeb") -> None:
+        self.client = client
+        self.namespace = namespace
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any | None:
+        value = self.client.get(f"{self.namespace}:{key}")
+        with self.lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        self.client.set(f"{self.namespace}:{key}", json.dumps(value))
+
+    def delete_prefix(self, prefix: str) -> None:
+        keys = list(self.client.scan_iter(f"{self.namespace}:{prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def clear(self) -> None:
+        self.delete_prefix("")
+
+
+def build_cache_backend(
+    name: str, max_size: int, redis_url: str, namespace: str
+) -> CacheBackend:
+    """Creates the backend selected in the server settings.
+
+    Redis is an optional dependency (the "cache" extra).
+    """
+    if name == "memory":
+        return MemoryCache(max_size=max_size)
+    if name == "redis":
+        if redis is None:
+            raise RuntimeError(
+                "cache_backend = redis needs the redis package, "
+                "install the cache extra"
+            )
+        return RedisCache(redis.Redis.from_url(redis_url), namespace)
+    raise ValueError(f"Unknown cache backend: {name}")
+
+
+class DashboardCache:
+    """Rendered dashboard contexts per user and period.
+
+    Entries are dropped by the write paths of the user and also expire
+    at the end of the day, since days left depend on today's date.
+    """
+
+    def __init__(self, backend: CacheBackend) -> None:
+        self.backend = backend
+
+    def get_key(self, user_id: int, limit: DateFilter) -> str:
+        return f"dashboard:{user_id}:{limit.year or ''}:{limit.month or ''}"
+
+    def get(self, user_id: int, limit: DateFilter) -> dict | None:
+        entry = self.backend.get(self.get_key(user_id, limit))
+        if not entry or entry["day"] != datetime.date.today().isoformat():
+            return None
+        return dict(entry["dashboard"])
+
+    def set(self, user_id: int, limit: DateFilter, dashboard: dict) -> None:
+        entry = {
+            "day": datetime.date.today().isoformat(),
+            "dashboard": dict(dashboard),
+        }
+        self.backend.set(self.get_key(user_id, limit), entry)
+
+    def invalidate(self, user_id: int) -> None:
+        self.backend.delete_prefix(f"dashboard:{user_id}:")
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+
+class CategoryCache:
+    """Category names mapped to ids per user, in name order.
+
+    Entries are dropped whenever categories of the user are written,
+    so payment writes can resolve a category without a query.
+    """
+
+    def __init__(self, backend: CacheBackend) -> None:
+        self.backend = backend
+
+    def get_key(self, user_id: int) -> str:
+        return f"categories:{user_id}:"
+
+    def get(self, user_id: int) -> dict[str, int] | None:
+        entry = self.backend.get(self.get_key(user_id))
+        return dict(entry) if entry is not None else None
+
+    def set(self, user_id: int, categories: dict[str, int]) -> None:
+        self.backend.set(self.get_key(user_id), dict(categories))
+
+    def invalidate(self, user_id: int) -> None:
+        self.backend.delete_prefix(self.get_key(user_id))
+
+    def clear(self) -> None:
+        self.backend.clear()
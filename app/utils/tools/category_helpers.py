@@ -1,12 +1,14 @@
 import math
+from collections.abc import Iterable
 
 from app.models import Category, Payment
 from app.schemas.categories import CategoryCreate
+from app.settings import CATEGORY_CACHE
 from app.utils.tools.helpers import get_readable_amount
 
 
 def get_payments_sums_per_category(
-    all_payments: list[Payment],
+    all_payments: Iterable[Payment],
 ) -> dict[int, str]:
     payments_sums_per_category = {}
     for payment in all_payments:
@@ -43,4 +45,5 @@ def add_category_to_db(session, name: str, user_id: int) -> Category:
     category = Category(**CategoryCreate(name=name, user_id=user_id).__dict__)
     session.add(category)
     session.commit()
+    CATEGORY_CACHE.invalidate(user_id)
     return category
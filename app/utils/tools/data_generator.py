@@ -0,0 +1,223 @@
+import datetime
+import random
+from collections.abc import Iterator
+from itertools import batched
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models import Category, Income, Payment, User
+from app.repositories.bulk import copy_records
+from app.repositories.ledger import LedgerRepo
+from app.repositories.rollups import RollupRepo
+from app.settings import CATEGORY_CACHE, DASHBOARD_CACHE
+from app.utils.constants import (
+    CATEGORIES,
+    GENERATED_USER_PASSWORD,
+    GENERATOR_CHUNK_SIZE,
+    PRODUCTS,
+)
+from app.utils.tools.helpers import (
+    convert_to_copecks,
+    get_timezone,
+    hash_password,
+)
+
+SEASONAL_FACTORS = (1.0, 0.9, 0.9, 1.0, 1.1, 1.2, 1.3, 1.2, 1.0, 1.0, 1.1, 1.5)
+FOOD_SHARE = 0.7
+SALARY_DAYS = (5, 20)
+
+
+class LedgerGenerator:
+    """Synthetic ledger of one user, about payments_per_day every day.
+
+    The same seed and user give the same records, so runs on different
+    commits read the same data.
+    - salary comes twice a month and covers the spending with a margin
+    - spending follows SEASONAL_FACTORS, more in December and summer
+    - food payments carry grams, the rest carry quantity
+    """
+
+    def __init__(
+        self,
+        user_id: int,
+        food_category_id: int,
+        other_category_ids: list[int],
+        payments_per_day: int,
+        seed: int = 0,
+    ) -> None:
+        self.user_id = user_id
+        self.food_category_id = food_category_id
+        self.other_category_ids = other_category_ids or [food_category_id]
+        self.payments_per_day = payments_per_day
+        self.random = random.Random(f"{seed}:{user_id}")
+        self.timezone = get_timezone()
+
+    def get_time(self, day: datetime.date) -> datetime.datetime:
+        minute = self.random.randrange(8 * 60, 23 * 60)
+        return datetime.datetime.combine(
+            day,
+            datetime.time(minute // 60, minute % 60),
+            tzinfo=self.timezone,
+        )
+
+    def get_count(self, day: datetime.date) -> int:
+        """Number of payments of the day, seasonal and a bit random."""
+        mean = self.payments_per_day * SEASONAL_FACTORS[day.month - 1]
+        return max(0, round(self.random.gauss(mean, mean / 3)))
+
+    def generate_payment(self, day: datetime.date) -> dict:
+        is_food = self.random.random() < FOOD_SHARE
+        if is_food:
+            category_id = self.food_category_id
+            amount = self.random.randrange(50, 1500)
+        else:
+            category_id = self.random.choice(self.other_category_ids)
+            amount = round(self.random.lognormvariate(6.5, 1))
+        return {
+            "name": self.random.choice(PRODUCTS),
+            "amount": convert_to_copecks(max(1, min(amount, 999999))),
+            "category_id": category_id,
+            "user_id": self.user_id,
+            "created_at": self.get_time(day),
+            "grams": self.random.randrange(100, 2000, 50) if is_food else None,
+            "quantity": None if is_food else self.random.randint(1, 5),
+        }
+
+    def generate_payments(
+        self, start: datetime.date, days: int
+    ) -> Iterator[dict]:
+        for offset in range(days):
+            day = start + datetime.timedelta(days=offset)
+            for _ in range(self.get_count(day)):
+                yield self.generate_payment(day)
+
+    def generate_income(
+        self, start: datetime.date, days: int
+    ) -> Iterator[dict]:
+        monthly = 1500 * 31 * self.payments_per_day * max(SEASONAL_FACTORS)
+        for offset in range(days):
+            day = start + datetime.timedelta(days=offset)
+            if day.day not in SALARY_DAYS:
+                continue
+            yield {
+                "name": "зарплата",
+                "amount": convert_to_copecks(round(monthly / 2)),
+                "user_id": self.user_id,
+                "created_at": datetime.datetime.combine(
+                    day, datetime.time(9), tzinfo=self.timezone
+                ),
+            }
+
+
+def get_generator_categories(
+    session: Session, user_id: int
+) -> dict[str, int]:
+    """Creates the default categories of the user if missing."""
+    session.execute(
+        pg_insert(Category)
+        .values([{"name": x, "user_id": user_id} for x in CATEGORIES])
+        .on_conflict_do_nothing()
+    )
+    statement = select(Category.name, Category.id).where(
+        Category.user_id == user_id
+    )
+    return {name: id for name, id in session.execute(statement)}
+
+
+def copy_in_chunks(
+    session: Session, model, records: Iterator[dict], chunk_size: int
+) -> int:
+    count = 0
+    for chunk in batched(records, chunk_size):
+        count += len(copy_records(session, model, list(chunk)))
+    return count
+
+
+def write_ledger(
+    session: Session,
+    user_id: int,
+    years: int,
+    payments_per_day: int,
+    seed: int = 0,
+    chunk_size: int = GENERATOR_CHUNK_SIZE,
+) -> tuple[int, int]:
+    """Generates years of records up to yesterday, returns their counts.
+
+    Records are written with COPY in chunks, the ledger and the rollup
+    are rebuilt once at the end.
+    """
+    category_ids = get_generator_categories(session, user_id)
+    food_category_id = category_ids.pop(CATEGORIES[0])
+    generator = LedgerGenerator(
+        user_id=user_id,
+        food_category_id=food_category_id,
+        other_category_ids=sorted(category_ids.values()),
+        payments_per_day=payments_per_day,
+        seed=seed,
+    )
+    days = 365 * years
+    start = datetime.date.today() - datetime.timedelta(days=days)
+    income = copy_in_chunks(
+        session, Income, generator.generate_income(start, days), chunk_size
+    )
+    payments = copy_in_chunks(
+        session,
+        Payment,
+        generator.generate_payments(start, days),
+        chunk_size,
+    )
+    LedgerRepo(session).rebuild(user_id)
+    RollupRepo(session).rebuild(user_id)
+    session.commit()
+    CATEGORY_CACHE.invalidate(user_id)
+    DASHBOARD_CACHE.invalidate(user_id)
+    return payments, income
+
+
+def create_users(session: Session, count: int, prefix: str) -> list[int]:
+    """Creates users prefix_1..prefix_count, existing ones are reused.
+
+    They all log in with GENERATED_USER_PASSWORD.
+    """
+    usernames = [f"{prefix}_{i}" for i in range(1, count + 1)]
+    password_hash_sum = hash_password(GENERATED_USER_PASSWORD)
+    session.execute(
+        pg_insert(User)
+        .values(
+            [
+                {"username": x, "password_hash_sum": password_hash_sum}
+                for x in usernames
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=[User.username])
+    )
+    return session.scalars(
+        select(User.id).where(User.username.in_(usernames)).order_by(User.id)
+    ).all()
+
+
+def populate(
+    session: Session,
+    users: int,
+    years: int,
+    payments_per_day: int,
+    seed: int = 0,
+    prefix: str = "generated",
+) -> dict[str, int]:
+    """Creates users and writes a ledger for each of them."""
+    user_ids = create_users(session, users, prefix)
+    session.commit()
+    totals = {"users": len(user_ids), "payments": 0, "income": 0}
+    for user_id in user_ids:
+        payments, income = write_ledger(
+            session,
+            user_id=user_id,
+            years=years,
+            payments_per_day=payments_per_day,
+            seed=seed,
+        )
+        totals["payments"] += payments
+        totals["income"] += income
+    return totals
@@ -0,0 +1,101 @@
+import csv
+import io
+import json
+import time
+from collections.abc import Iterable, Iterator
+
+from sqlalchemy import Row
+
+from app.repositories.payments import PaymentRepo
+from app.schemas.dates import DateFilter
+from app.settings import METRICS, SESSION_FACTORY
+from app.utils.constants import EXPORT_CHUNK_SIZE
+from app.utils.tools.helpers import get_timezone
+
+EXPORT_COLUMNS = (
+    "date",
+    "type",
+    "name",
+    "category",
+    "amount",
+    "grams",
+    "quantity",
+    "uuid",
+)
+
+
+def to_export_record(row: Row) -> dict:
+    """Turns a streamed record into plain values, amount is in rubles."""
+    return {
+        "date": row.created_at.astimezone(get_timezone()).isoformat(),
+        "type": row.type,
+        "name": row.name,
+        "category": row.category,
+        "amount": f"{row.amount / 100:.2f}",
+        "grams": row.grams,
+        "quantity": row.quantity,
+        "uuid": str(row.uuid),
+    }
+
+
+def stream_records(user_id: int, limit: DateFilter) -> Iterator[Row]:
+    """Streams records from a session of its own.
+
+    The response body is sent after the request dependencies are
+    closed, so the export cannot use the session of the request.
+    The request stats are closed by then as well, so the time spent
+    waiting on the database is recorded here.
+    """
+    db_seconds = 0.0
+    try:
+        with SESSION_FACTORY() as session:
+            records = PaymentRepo(session).stream_for_period(user_id, limit)
+            while True:
+                start = time.perf_counter()
+                record = next(records, None)
+                db_seconds += time.perf_counter() - start
+                if record is None:
+                    break
+                yield record
+    finally:
+        METRICS.observe_export_db(db_seconds)
+
+
+def join_chunks(lines: Iterable[str]) -> Iterator[str]:
+    """Groups small lines into chunks of about EXPORT_CHUNK_SIZE."""
+    chunk = []
+    size = 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_SIZE:
+            yield "".join(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield "".join(chunk)
+
+
+def csv_lines(records: Iterable[Row]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for record in records:
+        writer.writerow(to_export_record(record).values())
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def ndjson_lines(records: Iterable[Row]) -> Iterator[str]:
+    for record in records:
+        yield json.dumps(to_export_record(record), ensure_ascii=False) + "\n"
+
+
+def export_csv(user_id: int, limit: DateFilter) -> Iterator[str]:
+    return join_chunks(csv_lines(stream_records(user_id, limit)))
+
+
+def export_ndjson(user_id: int, limit: DateFilter) -> Iterator[str]:
+    return join_chunks(ndjson_lines(stream_records(user_id, limit)))
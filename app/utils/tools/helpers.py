@@ -2,8 +2,21 @@ import datetime
 import locale
 import random
 import re
+from collections.abc import Iterable
 from hashlib import sha256
 from calendar import isleap
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    DateTime,
+    and_,
+    cast,
+    func,
+    true,
+)
+
 from app.exceptions import (
     BeebError,
     EmptyStringError,
@@ -12,6 +25,7 @@ from app.exceptions import (
     ValueTooLargeError,
 )
 from app.models import Payment
+from app.schemas.dates import DateFilter
 from app.settings import SETTINGS
 from app.utils.constants import INT_TO_MONTHS, PRODUCTS
 
@@ -59,7 +73,7 @@ def get_number_for_db(frontend_input: str) -> int:
     return convert_to_copecks(locale.atoi(removed_currency_symbol))
 
 
-def get_monthly_payments(all_payments: list[Payment]) -> dict[int, str]:
+def get_monthly_payments(all_payments: Iterable[Payment]) -> dict[int, str]:
     monthly_payments = {}
     for payment in all_payments:
         if payment.created_at.strftime("%m") not in monthly_payments.keys():
@@ -226,3 +240,54 @@ def get_min_date_from_year_and_month_datetime_format(
     date = f"{year}-{str(month).zfill(2)}-{str(day).zfill(2)} {time}"
     res = datetime.datetime.strptime(date, "%Y-%m-%d %H:%M:%S.%f")
     return res.astimezone()
+
+
+def get_timezone() -> ZoneInfo:
+    return ZoneInfo(SETTINGS.server.timezone)
+
+
+def get_period_bounds(
+    limit: DateFilter,
+) -> tuple[datetime.datetime, datetime.datetime] | None:
+    """Turns a year or a month into half-open [start, end) bounds.
+
+    Bounds are computed in the configured timezone.
+    Returns None if the period is not limited.
+    """
+    if not limit.year:
+        return None
+    timezone = get_timezone()
+    if not limit.month:
+        start = datetime.datetime(limit.year, 1, 1, tzinfo=timezone)
+        end = datetime.datetime(limit.year + 1, 1, 1, tzinfo=timezone)
+        return start, end
+    start = datetime.datetime(limit.year, limit.month, 1, tzinfo=timezone)
+    extra_year, next_month = divmod(limit.month, 12)
+    end = datetime.datetime(
+        limit.year + extra_year, next_month + 1, 1, tzinfo=timezone
+    )
+    return start, end
+
+
+def filter_by_period(column, limit: DateFilter) -> ColumnElement[bool]:
+    """Builds an index-friendly range filter for a timestamp column."""
+    if not (bounds := get_period_bounds(limit)):
+        return true()
+    start, end = bounds
+    return and_(column >= start, column < end)
+
+
+def to_local_time(column) -> ColumnElement:
+    """Converts a timestamp column to the configured timezone."""
+    return func.timezone(SETTINGS.server.timezone, column)
+
+
+def to_local_day(value) -> ColumnElement[datetime.date]:
+    """Converts a timestamp to a calendar day in the configured timezone.
+
+    Naive values are read in the database session timezone,
+    the same way they are stored.
+    """
+    return func.date(
+        to_local_time(cast(value, DateTime(timezone=True))), type_=Date
+    )
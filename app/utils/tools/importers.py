@@ -0,0 +1,75 @@
+import csv
+from collections.abc import Iterator
+from pathlib import Path
+
+from pyexcel_odsr import get_data
+
+from app.exceptions import FileOutsideUploadDirError
+
+IMPORT_COLUMNS = {
+    "название": "name",
+    "сумма": "amount_in_rub",
+    "категория": "category",
+    "дата": "created_at",
+    "граммы": "grams",
+    "штуки": "quantity",
+    "name": "name",
+    "amount": "amount_in_rub",
+    "category": "category",
+    "date": "created_at",
+    "grams": "grams",
+    "quantity": "quantity",
+}
+
+
+def get_field_names(header: list) -> list[str | None]:
+    """Maps spreadsheet headers to ImportRow fields, unknown ones to None."""
+    return [IMPORT_COLUMNS.get(str(x).strip().lower()) for x in header]
+
+
+def to_import_row(fields: list[str | None], values: list) -> dict:
+    return {
+        field: value
+        for field, value in zip(fields, values)
+        if field is not None
+    }
+
+
+def get_upload_path(directory: Path, file_name: str) -> Path:
+    """Resolves file_name inside directory, nothing outside it is allowed."""
+    directory = directory.resolve()
+    path = (directory / file_name).resolve()
+    if not path.is_relative_to(directory) or not path.is_file():
+        raise FileOutsideUploadDirError(file_name)
+    return path
+
+
+def read_csv_rows(path: Path) -> Iterator[dict]:
+    """Yields rows one by one, the file is never loaded whole."""
+    with path.open(newline="", encoding="utf-8-sig") as file:
+        reader = csv.reader(file)
+        fields = get_field_names(next(reader, []))
+        for values in reader:
+            yield to_import_row(fields, values)
+
+
+def read_ods_rows(path: Path) -> Iterator[dict]:
+    """Yields rows of the first sheet.
+
+    pyexcel-odsr reads the sheet at once, rows are still handed out
+    one by one so the pipeline is the same as for CSV.
+    """
+    sheets = get_data(str(path))
+    rows = iter(next(iter(sheets.values()), []))
+    fields = get_field_names(next(rows, []))
+    for values in rows:
+        if any(x not in ("", None) for x in values):
+            yield to_import_row(fields, values)
+
+
+def read_import_rows(path: Path) -> Iterator[dict]:
+    if path.suffix.lower() == ".csv":
+        return read_csv_rows(path)
+    if path.suffix.lower() == ".ods":
+        return read_ods_rows(path)
+    raise ValueError(f"Формат файла {path.suffix} не поддерживается")
@@ -0,0 +1,176 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from app.utils.tools.request_stats import CURRENT_STATS
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for key, value in labels.items()
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+class Histogram:
+    """Cumulative latency histogram in seconds, as Prometheus expects."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+
+    def render(self, name: str, labels: dict[str, str]) -> list[str]:
+        lines = [
+            f"{name}_bucket{format_labels(labels | {'le': str(bound)})} "
+            f"{count}"
+            for bound, count in zip(self.buckets, self.counts)
+        ]
+        lines.append(
+            f"{name}_bucket{format_labels(labels | {'le': '+Inf'})} "
+            f"{self.count}"
+        )
+        lines.append(f"{name}_sum{format_labels(labels)} {self.sum}")
+        lines.append(f"{name}_count{format_labels(labels)} {self.count}")
+        return lines
+
+
+class Metrics:
+    """In-process metrics exported in the Prometheus text format.
+
+    Values live in the worker process, each worker is scraped on its own.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.requests: dict[tuple, int] = defaultdict(int)
+        self.request_latency: dict[tuple, Histogram] = defaultdict(Histogram)
+        self.render_latency = Histogram()
+        self.balance_check_latency = Histogram()
+        self.export_db_latency = Histogram()
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def record_request(self, request, call_next):
+        """Middleware counting requests and their latency per route."""
+        start = time.perf_counter()
+        response = await call_next(request)
+        duration = time.perf_counter() - start
+        route = request.scope.get("route")
+        path = route.path if route else "unmatched"
+        stats = CURRENT_STATS.get()
+        with self.lock:
+            key = (request.method, path, str(response.status_code))
+            self.requests[key] += 1
+            self.request_latency[(request.method, path)].observe(duration)
+            if stats and stats.render_ms:
+                self.render_latency.observe(stats.render_ms / 1000)
+        return response
+
+    @contextmanager
+    def time_balance_check(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.balance_check_latency.observe(
+                    time.perf_counter() - start
+                )
+
+    def observe_export_db(self, seconds: float) -> None:
+        """Streamed exports query after the request middleware returned."""
+        with self.lock:
+            self.export_db_latency.observe(seconds)
+
+    def count_error(self, name: str) -> None:
+        with self.lock:
+            self.errors[name] += 1
+
+    def render(
+        self, pool: dict[str, int], caches: dict[str, tuple[int, int]]
+    ) -> str:
+        """Renders all metrics, caches map a name to (hits, misses)."""
+        lines = [
+            "# HELP beeb_requests_total Requests by route and status.",
+            "# TYPE beeb_requests_total counter",
+        ]
+        with self.lock:
+            for (method, path, status), count in sorted(self.requests.items()):
+                labels = {"method": method, "route": path, "status": status}
+                lines.append(
+                    f"beeb_requests_total{format_labels(labels)} {count}"
+                )
+            lines += [
+                "# HELP beeb_request_duration_seconds Latency by route.",
+                "# TYPE beeb_request_duration_seconds histogram",
+            ]
+            for (method, path), histogram in sorted(
+                self.request_latency.items()
+            ):
+                lines += histogram.render(
+                    "beeb_request_duration_seconds",
+                    {"method": method, "route": path},
+                )
+            lines += [
+                "# HELP beeb_template_render_seconds Render time per request.",
+                "# TYPE beeb_template_render_seconds histogram",
+                *self.render_latency.render(
+                    "beeb_template_render_seconds", {}
+                ),
+                "# HELP beeb_balance_check_seconds Balance check latency.",
+                "# TYPE beeb_balance_check_seconds histogram",
+                *self.balance_check_latency.render(
+                    "beeb_balance_check_seconds", {}
+                ),
+                "# HELP beeb_export_db_seconds Database time per export.",
+                "# TYPE beeb_export_db_seconds histogram",
+                *self.export_db_latency.render("beeb_export_db_seconds", {}),
+                "# HELP beeb_errors_total Handled errors by type.",
+                "# TYPE beeb_errors_total counter",
+            ]
+            for name, count in sorted(self.errors.items()):
+                lines.append(
+                    f"beeb_errors_total{format_labels({'type': name})} "
+                    f"{count}"
+                )
+        for name, value in pool.items():
+            lines += [
+                f"# TYPE beeb_db_pool_{name} gauge",
+                f"beeb_db_pool_{name} {value}",
+            ]
+        lines += [
+            "# HELP beeb_cache_hit_ratio Hits over lookups per cache.",
+            "# TYPE beeb_cache_hit_ratio gauge",
+        ]
+        for name, (hits, misses) in sorted(caches.items()):
+            lookups = hits + misses
+            labels = format_labels({"cache": name})
+            ratio = hits / lookups if lookups else 0.0
+            lines.append(f"beeb_cache_hit_ratio{labels} {ratio}")
+        return "\n".join(lines) + "\n"
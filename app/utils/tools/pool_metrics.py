@@ -0,0 +1,61 @@
+import threading
+
+from sqlalchemy import Engine, event
+
+
+class PoolMetrics:
+    """Counts connection pool events of an engine.
+
+    Counters are cumulative since the engine was created, the gauges
+    in snapshot() are read from the pool at call time.
+    """
+
+    def __init__(self) -> None:
+        self.engine: Engine | None = None
+        self.lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.max_checked_out = 0
+
+    def register(self, engine: Engine) -> None:
+        event.listen(engine, "connect", self.on_connect)
+        event.listen(engine, "checkout", self.on_checkout)
+        event.listen(engine, "checkin", self.on_checkin)
+        event.listen(engine, "invalidate", self.on_invalidate)
+        self.engine = engine
+
+    def on_connect(self, *args) -> None:
+        with self.lock:
+            self.connects += 1
+
+    def on_checkout(self, *args) -> None:
+        with self.lock:
+            self.checkouts += 1
+            self.max_checked_out = max(
+                self.max_checked_out, self.engine.pool.checkedout()
+            )
+
+    def on_checkin(self, *args) -> None:
+        with self.lock:
+            self.checkins += 1
+
+    def on_invalidate(self, *args) -> None:
+        with self.lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict[str, int]:
+        pool = self.engine.pool
+        with self.lock:
+            return {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "max_checked_out": self.max_checked_out,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+            }
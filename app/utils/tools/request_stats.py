@@ -0,0 +1,129 @@
+import threading
+import time
+from contextvars import ContextVar
+
+from jinja2_fragments.fastapi import Jinja2Blocks
+from loguru import logger
+from sqlalchemy import Engine, event
+
+
+class RequestStats:
+    """Database and template timings of one request, in milliseconds."""
+
+    __slots__ = (
+        "query_count",
+        "db_ms",
+        "slowest_ms",
+        "slowest_statement",
+        "render_ms",
+    )
+
+    def __init__(self) -> None:
+        self.query_count = 0
+        self.db_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement: str | None = None
+        self.render_ms = 0.0
+
+    def add_query(self, statement: str, duration_ms: float) -> None:
+        self.query_count += 1
+        self.db_ms += duration_ms
+        if duration_ms > self.slowest_ms:
+            self.slowest_ms = duration_ms
+            self.slowest_statement = statement
+
+    def server_timing(self, total_ms: float) -> str:
+        return ", ".join(
+            [
+                f'db;dur={self.db_ms:.1f};desc="{self.query_count} queries"',
+                f"db-slowest;dur={self.slowest_ms:.1f}",
+                f"render;dur={self.render_ms:.1f}",
+                f"total;dur={total_ms:.1f}",
+            ]
+        )
+
+
+CURRENT_STATS: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+class QueryStats:
+    """Times every statement of the registered engines.
+
+    Durations are added to the stats of the current request, if any.
+    Statements slower than slow_query_ms are logged on their own.
+    """
+
+    def __init__(self, slow_query_ms: float) -> None:
+        self.slow_query_ms = slow_query_ms
+        self.lock = threading.Lock()
+        self.slow_queries = 0
+
+    def register(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self.on_before_execute)
+        event.listen(engine, "after_cursor_execute", self.on_after_execute)
+
+    def on_before_execute(
+        self, connection, cursor, statement, parameters, context, *args
+    ):
+        # kept on the execution context, not the pooled connection:
+        # a failed statement must not leave its start time behind
+        if context is not None:
+            context.query_start = time.perf_counter()
+
+    def on_after_execute(
+        self, connection, cursor, statement, parameters, context, *args
+    ):
+        if (start := getattr(context, "query_start", None)) is None:
+            return
+        duration_ms = (time.perf_counter() - start) * 1000
+        if stats := CURRENT_STATS.get():
+            stats.add_query(statement, duration_ms)
+        if duration_ms >= self.slow_query_ms:
+            with self.lock:
+                self.slow_queries += 1
+            logger.bind(duration_ms=round(duration_ms, 1)).warning(
+                f"Медленный запрос ({duration_ms:.1f} мс): {statement}"
+            )
+
+
+class TimedTemplates(Jinja2Blocks):
+    """Adds the time spent rendering templates to the request stats."""
+
+    def TemplateResponse(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().TemplateResponse(*args, **kwargs)
+        finally:
+            if stats := CURRENT_STATS.get():
+                stats.render_ms += (time.perf_counter() - start) * 1000
+
+
+async def record_request_stats(request, call_next):
+    """Middleware that reports the stats in Server-Timing and the log."""
+    stats = RequestStats()
+    token = CURRENT_STATS.set(stats)
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        CURRENT_STATS.reset(token)
+    total_ms = (time.perf_counter() - start) * 1000
+    response.headers["Server-Timing"] = stats.server_timing(total_ms)
+    logger.bind(
+        method=request.method,
+        path=request.url.path,
+        status_code=response.status_code,
+        queries=stats.query_count,
+        db_ms=round(stats.db_ms, 1),
+        slowest_ms=round(stats.slowest_ms, 1),
+        slowest_statement=stats.slowest_statement,
+        render_ms=round(stats.render_ms, 1),
+        total_ms=round(total_ms, 1),
+    ).info(
+        f"{request.method} {request.url.path} {response.status_code}: "
+        f"{stats.query_count} запросов, БД {stats.db_ms:.1f} мс, "
+        f"шаблоны {stats.render_ms:.1f} мс, всего {total_ms:.1f} мс"
+    )
+    return response
@@ -0,0 +1,10 @@
+CREATE INDEX IF NOT EXISTS "payments_user_id_created_at_idx"
+    ON "main"."payments" ("user_id", "created_at")
+    INCLUDE ("amount", "category_id");
+
+CREATE INDEX IF NOT EXISTS "income_user_id_created_at_idx"
+    ON "main"."income" ("user_id", "created_at")
+    INCLUDE ("amount");
+
+CREATE UNIQUE INDEX IF NOT EXISTS "category_user_id_name_key"
+    ON "main"."category" ("user_id", "name");
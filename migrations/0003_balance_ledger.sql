@@ -0,0 +1,12 @@
+CREATE TABLE IF NOT EXISTS "main"."balance_snapshots" (
+    "user_id" INT PRIMARY KEY,
+    "balance" BIGINT NOT NULL DEFAULT 0,
+    "updated_at" TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS "main"."balance_deltas" (
+    "user_id" INT NOT NULL,
+    "day" DATE NOT NULL,
+    "delta" BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY ("user_id", "day")
+);
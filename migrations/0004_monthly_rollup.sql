@@ -0,0 +1,11 @@
+CREATE TABLE IF NOT EXISTS "main"."monthly_rollup" (
+    "user_id" INT NOT NULL,
+    "year" INT NOT NULL,
+    "month" INT NOT NULL,
+    "category_id" INT NOT NULL,
+    "amount" BIGINT NOT NULL DEFAULT 0,
+    "count" INT NOT NULL DEFAULT 0,
+    "grams" BIGINT NOT NULL DEFAULT 0,
+    "quantity" BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY ("user_id", "year", "month", "category_id")
+);
@@ -14,6 +14,7 @@ if __name__ == "__main__":
         "app.application:build_app",
         port=os.getenv("server_port", SETTINGS.server.port),
         host=SETTINGS.server.host,
+        workers=SETTINGS.server.workers,
         proxy_headers=True,
         forwarded_allow_ips="*",
     )
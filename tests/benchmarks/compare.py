@@ -0,0 +1,42 @@
+"""Compares two benchmark reports.
+
+    python -m tests.benchmarks.compare base.json new.json [--threshold 1.2]
+
+Exits with 1 if a median got slower than threshold times the base.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def load_medians(path: Path) -> dict[str, float]:
+    report = json.loads(path.read_text())
+    return {x["name"]: x["median"] for x in report["results"]}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("base", type=Path)
+    parser.add_argument("new", type=Path)
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args(argv)
+    base = load_medians(args.base)
+    new = load_medians(args.new)
+    exit_code = 0
+    for name in sorted(base.keys() & new.keys()):
+        ratio = new[name] / base[name] if base[name] else 1.0
+        mark = ""
+        if ratio > args.threshold:
+            mark = "  SLOWER"
+            exit_code = 1
+        print(
+            f"{name:<45} {base[name] * 1000:>10.2f} ms "
+            f"{new[name] * 1000:>10.2f} ms {ratio:>6.2f}x{mark}"
+        )
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
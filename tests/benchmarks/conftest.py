@@ -0,0 +1,120 @@
+import datetime
+import json
+import os
+import random
+import statistics
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+from sqlalchemy import insert, text
+
+from app.models import Income, Payment
+from app.utils.constants import PRODUCTS
+from tests.conftest import TEST_USER_ID
+
+BENCHMARKS_ENABLED = os.getenv("BEEB_BENCHMARKS") == "1"
+RESULTS_DIR = Path(__file__).parent / "results"
+RESULTS: list[dict] = []
+
+
+def pytest_collection_modifyitems(config, items):
+    """Benchmarks are slow, so they only run when BEEB_BENCHMARKS=1."""
+    if BENCHMARKS_ENABLED:
+        return
+    skip = pytest.mark.skip(reason="set BEEB_BENCHMARKS=1 to run benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+def get_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Saves results of record_benchmark to BEEB_BENCHMARK_RESULTS.
+
+    By default they go to results/<commit>.json, compare two runs with
+    python -m tests.benchmarks.compare.
+    """
+    if not RESULTS:
+        return
+    commit = get_commit()
+    path = Path(
+        os.getenv("BEEB_BENCHMARK_RESULTS", RESULTS_DIR / f"{commit}.json")
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "commit": commit,
+        "created_at": datetime.datetime.now().astimezone().isoformat(),
+        "results": RESULTS,
+    }
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+@pytest.fixture
+def record_benchmark(request):
+    """Times func and keeps the result for the JSON report.
+
+    Returns the result, "median" is the median wall time in seconds.
+    Extra keyword arguments describe the data set and are saved as is.
+    """
+
+    def run(func, name: str | None = None, repeat: int = 20, **params):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        result = {
+            "name": name or request.node.name,
+            "rounds": repeat,
+            "median": statistics.median(timings),
+            "min": min(timings),
+            "max": max(timings),
+            "params": params,
+        }
+        RESULTS.append(result)
+        return result
+
+    return run
+
+
+def fill_ledger(session, category_id: int, size: int, seed: int = 0):
+    """Inserts size payments and size // 10 income records for the user."""
+    generator = random.Random(seed)
+    start = datetime.datetime.now().astimezone() - datetime.timedelta(
+        days=365 * 5
+    )
+    payments = [
+        {
+            "user_id": TEST_USER_ID,
+            "name": generator.choice(PRODUCTS),
+            "amount": generator.randrange(100, 5000, 100),
+            "category_id": category_id,
+            "created_at": start
+            + datetime.timedelta(minutes=generator.randrange(60 * 24 * 1825)),
+        }
+        for _ in range(size)
+    ]
+    income = [
+        {
+            "user_id": TEST_USER_ID,
+            "name": "зарплата",
+            "amount": 10000000,
+            "created_at": start + datetime.timedelta(days=30 * i),
+        }
+        for i in range(size // 10)
+    ]
+    session.execute(insert(Payment), payments)
+    session.execute(insert(Income), income)
+    session.commit()
+    session.execute(text("ANALYZE main.payments, main.income"))
+    session.commit()
@@ -0,0 +1,26 @@
+import pytest
+
+from app.utils.tools import analytics
+from tests.unit.app.utils.tools.analytics.test_analytics import get_rows
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize("size", [10_000, 100_000])
+def test_numpy_against_python_helpers(monkeypatch, record_benchmark, size):
+    pytest.importorskip("numpy")
+    rows = get_rows(size)
+
+    def compute():
+        payments = analytics.load_payments(rows)
+        payments.total()
+        payments.monthly_sums()
+        payments.shares()
+
+    record_benchmark(
+        compute, name="dashboard_statistics_numpy", repeat=5, size=size
+    )
+    monkeypatch.setattr(analytics, "HAS_NUMPY", False)
+    record_benchmark(
+        compute, name="dashboard_statistics_python", repeat=5, size=size
+    )
@@ -0,0 +1,75 @@
+import datetime
+
+import pytest
+
+from app.models import (
+    BalanceDelta,
+    BalanceSnapshot,
+    Income,
+    MonthlyRollup,
+    Payment,
+)
+from app.repositories.payments import PaymentRepo
+from app.schemas.payments import PaymentCreate
+from tests.conftest import TEST_USER_ID
+
+pytestmark = pytest.mark.benchmark
+
+# create makes one round trip per row, larger sizes are extrapolated
+CREATE_BASELINE_SIZE = 10_000
+
+
+def get_payments(category_id: int, size: int) -> list[PaymentCreate]:
+    now = datetime.datetime.now().astimezone()
+    return [
+        PaymentCreate(
+            name="хлеб",
+            amount_in_rub=1,
+            category_id=category_id,
+            created_at=now - datetime.timedelta(minutes=i),
+            user_id=TEST_USER_ID,
+        )
+        for i in range(size)
+    ]
+
+
+def reset(session):
+    for model in (Payment, Income, BalanceDelta, BalanceSnapshot):
+        session.query(model).delete()
+    session.query(MonthlyRollup).delete()
+    session.commit()
+
+
+def add_salary(session, size: int):
+    session.add(
+        Income(name="зарплата", amount=size * 100, user_id=TEST_USER_ID)
+    )
+    session.commit()
+
+
+@pytest.mark.parametrize("size", [1_000, 10_000, 100_000])
+def test_bulk_create_against_create(
+    session, category, record_benchmark, size
+):
+    repo = PaymentRepo(session)
+    payments = get_payments(category.id, size)
+    baseline_size = min(size, CREATE_BASELINE_SIZE)
+
+    def create_one_by_one():
+        for payment in payments[:baseline_size]:
+            repo.create(payment, user_id=TEST_USER_ID)
+
+    def create_in_bulk():
+        repo.bulk_create(payments, user_id=TEST_USER_ID)
+
+    timings = {}
+    cases = (
+        ("create", create_one_by_one, baseline_size),
+        ("bulk_create", create_in_bulk, size),
+    )
+    for name, func, rows in cases:
+        add_salary(session, size)
+        result = record_benchmark(func, name=name, repeat=1, size=rows)
+        timings[name] = result["median"] * size / rows
+        reset(session)
+    assert timings["bulk_create"] * 5 < timings["create"]
@@ -0,0 +1,25 @@
+import pytest
+
+from app.repositories.payments import PaymentRepo
+from tests.benchmarks.conftest import fill_ledger
+from tests.conftest import TEST_USER_ID
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_get_date_bounds_does_not_grow_with_table_size(
+    session, category, record_benchmark
+):
+    repo = PaymentRepo(session)
+    timings = {}
+    filled = 0
+    for size in (1_000, 100_000):
+        fill_ledger(session, category.id, size=size - filled, seed=size)
+        filled = size
+        result = record_benchmark(
+            lambda: repo.get_date_bounds(TEST_USER_ID),
+            name="get_date_bounds",
+            size=size,
+        )
+        timings[size] = result["median"]
+    assert timings[100_000] < timings[1_000] * 3
@@ -0,0 +1,61 @@
+import datetime
+import tracemalloc
+
+import pytest
+
+from app.repositories.payments import PaymentRepo
+from app.schemas.payments import PaymentRow, PaymentShow
+from tests.benchmarks.conftest import fill_ledger
+from tests.conftest import TEST_USER_ID
+
+pytestmark = pytest.mark.benchmark
+
+
+def get_peak_memory(factory, rows) -> int:
+    """Returns peak memory in bytes of building every row."""
+    tracemalloc.start()
+    built = [factory(row) for row in rows]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return peak
+
+
+def test_payment_row_is_cheaper_than_payment_show(
+    session, category, record_benchmark
+):
+    repo = PaymentRepo(session)
+    filled = 0
+    for size in (10_000, 100_000):
+        fill_ledger(session, category.id, size=size - filled, seed=size)
+        filled = size
+        max_date = datetime.datetime.now().astimezone()
+        rows = session.execute(
+            repo.select_between_dates(
+                TEST_USER_ID,
+                max_date=max_date,
+                min_date=max_date - datetime.timedelta(days=365 * 10),
+            )
+        ).all()
+        results = {}
+        for name, factory in (
+            ("payment_show", lambda row: PaymentShow(**row._mapping)),
+            ("payment_row", PaymentRow.from_row),
+        ):
+            peak = get_peak_memory(factory, rows)
+            results[name] = record_benchmark(
+                lambda: [factory(row) for row in rows],
+                name=name,
+                repeat=1,
+                rows=len(rows),
+                peak_bytes=peak,
+            )
+        payment_row, payment_show = (
+            results["payment_row"],
+            results["payment_show"],
+        )
+        assert payment_row["median"] < payment_show["median"]
+        assert (
+            payment_row["params"]["peak_bytes"]
+            < payment_show["params"]["peak_bytes"]
+        )
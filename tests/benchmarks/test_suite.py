@@ -0,0 +1,108 @@
+import datetime
+import os
+
+import pytest
+
+from app.repositories.payments import PaymentRepo
+from app.settings import DASHBOARD_CACHE, SETTINGS
+from app.utils.constants import PAYMENTS_PAGE_SIZE
+from app.utils.tools.data_generator import create_users, write_ledger
+from tests.conftest import TEST_USER_ID
+
+pytestmark = pytest.mark.benchmark
+
+USERS = int(os.getenv("BEEB_BENCHMARK_USERS", "3"))
+YEARS = int(os.getenv("BEEB_BENCHMARK_YEARS", "3"))
+PAYMENTS_PER_DAY = int(os.getenv("BEEB_BENCHMARK_PAYMENTS_PER_DAY", "5"))
+PARAMS = {
+    "users": USERS,
+    "years": YEARS,
+    "payments_per_day": PAYMENTS_PER_DAY,
+}
+
+
+@pytest.fixture
+def ledger(session):
+    """Same records for every run, the measured user is TEST_USER_ID.
+
+    The other users are created first, so their records have an owner.
+    """
+    other_user_ids = create_users(session, USERS - 1, prefix="benchmark")
+    for user_id in [TEST_USER_ID, *other_user_ids]:
+        write_ledger(
+            session,
+            user_id=user_id,
+            years=YEARS,
+            payments_per_day=PAYMENTS_PER_DAY,
+        )
+
+
+def test_read_all(session, ledger, record_benchmark):
+    repo = PaymentRepo(session)
+    record_benchmark(
+        lambda: repo.read_all(TEST_USER_ID), repeat=5, **PARAMS
+    )
+    record_benchmark(
+        lambda: repo.read_all(TEST_USER_ID, limit=PAYMENTS_PAGE_SIZE + 1),
+        name="test_read_all_first_page",
+        **PARAMS,
+    )
+
+
+def test_read_all_between_dates(session, ledger, record_benchmark):
+    repo = PaymentRepo(session)
+    max_date = datetime.datetime.now().astimezone()
+    min_date = max_date - datetime.timedelta(days=365)
+    record_benchmark(
+        lambda: repo.read_all_between_dates(TEST_USER_ID, max_date, min_date),
+        repeat=5,
+        **PARAMS,
+    )
+
+
+def test_get_dashboard(session, ledger, record_benchmark):
+    repo = PaymentRepo(session)
+    max_date = datetime.datetime.now().astimezone()
+    min_date = max_date.replace(day=1, hour=0, minute=0, second=0)
+    record_benchmark(
+        lambda: repo.get_dashboard(
+            user_id=TEST_USER_ID, max_date=max_date, min_date=min_date
+        ),
+        **PARAMS,
+    )
+
+
+def test_check_balance(session, ledger, record_benchmark):
+    repo = PaymentRepo(session)
+    record_benchmark(
+        lambda: repo.check_balance(
+            user_id=TEST_USER_ID,
+            desired_payment_amount=100,
+            max_date=datetime.datetime.now().astimezone(),
+            previous_payment_amount=0,
+        ),
+        **PARAMS,
+    )
+
+
+@pytest.mark.parametrize(
+    "route",
+    ["dashboard", "dashboard_yearly", "dashboard_monthly"],
+)
+def test_dashboard_routes(client, ledger, record_benchmark, route):
+    today = datetime.date.today()
+    url = {
+        "dashboard": SETTINGS.urls.payments_dashboard,
+        "dashboard_yearly": SETTINGS.urls.payments_dashboard_yearly.format(
+            year=today.year
+        ),
+        "dashboard_monthly": SETTINGS.urls.payments_dashboard_monthly.format(
+            year=today.year, month=today.month
+        ),
+    }[route]
+
+    def get_uncached():
+        DASHBOARD_CACHE.clear()
+        assert client.get(url).status_code == 200
+
+    record_benchmark(get_uncached, **PARAMS)
@@ -13,8 +13,17 @@ from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.sql import functions
 
 from app.application import build_app
-from app.models import AlchemyBaseModel, Category, Income, Payment, User
-from app.settings import ENGINE
+from app.models import (
+    AlchemyBaseModel,
+    BalanceDelta,
+    BalanceSnapshot,
+    Category,
+    Income,
+    MonthlyRollup,
+    Payment,
+    User,
+)
+from app.settings import CATEGORY_CACHE, DASHBOARD_CACHE, ENGINE
 from app.utils.constants import CATEGORIES, PRODUCTS
 from app.utils.tools.auth_handler import AuthHandler
 from app.utils.tools.helpers import (
@@ -98,6 +107,9 @@ def clean_db(session):
     session.query(Category).delete()
     session.query(User).delete()
     session.query(Income).delete()
+    session.query(BalanceDelta).delete()
+    session.query(BalanceSnapshot).delete()
+    session.query(MonthlyRollup).delete()
     session.commit()
 
 
@@ -105,6 +117,8 @@ def clean_db(session):
 def tear_down(session):
     yield
     clean_db(session)
+    CATEGORY_CACHE.clear()
+    DASHBOARD_CACHE.clear()
 
 
 def delete_category(session):
@@ -0,0 +1,69 @@
+import csv
+import datetime
+import io
+import json
+
+from fastapi import status
+
+from app.settings import METRICS, SETTINGS
+from app.utils.tools.exporters import EXPORT_COLUMNS
+from tests.conftest import get_all_income, get_payments
+
+
+def test_export_csv(client, fill_db, session):
+    response = client.get(SETTINGS.urls.payments_export_csv)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "payments-all.csv" in response.headers["content-disposition"]
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert tuple(rows[0]) == EXPORT_COLUMNS
+    records = rows[1:]
+    payments = get_payments(session)
+    income = get_all_income(session)
+    assert len(records) == len(payments) + len(income)
+    exported = {x[EXPORT_COLUMNS.index("uuid")] for x in records}
+    assert exported == {str(x.uuid) for x in payments + income}
+    dates = [x[0] for x in records]
+    assert dates == sorted(dates, reverse=True)
+
+
+def test_export_ndjson(client, fill_db, session):
+    response = client.get(SETTINGS.urls.payments_export_ndjson)
+    assert response.status_code == status.HTTP_200_OK
+    records = [json.loads(x) for x in response.text.splitlines()]
+    payments = {str(x.uuid): x for x in get_payments(session)}
+    assert len(records) == len(payments) + len(get_all_income(session))
+    for record in records:
+        assert tuple(record) == EXPORT_COLUMNS
+        if record["type"] == "расход":
+            payment = payments[record["uuid"]]
+            assert record["amount"] == f"{payment.amount / 100:.2f}"
+            assert record["grams"] == payment.grams
+
+
+def test_export_honors_period(client, fill_db):
+    last_year = datetime.datetime.now().year - 1
+    response = client.get(
+        SETTINGS.urls.payments_export_ndjson, params={"year": last_year}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text == ""
+    response = client.get(
+        SETTINGS.urls.payments_export_csv, params={"year": last_year}
+    )
+    assert response.text.splitlines() == [",".join(EXPORT_COLUMNS)]
+
+
+def test_export_no_cookie(client, fill_db):
+    client.cookies = {}
+    response = client.get(SETTINGS.urls.payments_export_csv)
+    assert response.status_code == status.HTTP_303_SEE_OTHER
+    assert response.headers.get("location") == SETTINGS.urls.login
+
+
+def test_export_records_database_time(client, fill_db):
+    before = METRICS.export_db_latency.count
+    response = client.get(SETTINGS.urls.payments_export_ndjson)
+    assert response.status_code == status.HTTP_200_OK
+    assert METRICS.export_db_latency.count == before + 1
+    assert METRICS.export_db_latency.sum > 0
@@ -1,3 +1,4 @@
+import re
 from unittest.mock import patch
 
 from fastapi import status
@@ -54,3 +55,28 @@ def test_wrong_token(client, fill_db, wrong_token):
     response = client.get(SETTINGS.urls.payments)
     assert response.status_code == status.HTTP_303_SEE_OTHER
     assert response.headers.get("location") == SETTINGS.urls.login
+
+
+@patch("app.routers.payments.read_all.PAYMENTS_PAGE_SIZE", 3)
+def test_infinite_scroll(client, fill_db):
+    response = client.get(SETTINGS.urls.payments)
+    assert response.status_code == status.HTTP_200_OK
+    rows = response.text.count('<td scope="row">')
+    pages = 1
+    while next_page := re.search(r'hx-get="([^"]+)"', response.text):
+        response = client.get(next_page.group(1))
+        assert response.status_code == status.HTTP_200_OK
+        assert "<html" not in response.text
+        page_rows = response.text.count('<td scope="row">')
+        assert 0 < page_rows <= 3
+        rows += page_rows
+        pages += 1
+    assert rows == 20
+    assert pages == 7
+
+
+def test_infinite_scroll_invalid_cursor(client, fill_db):
+    response = client.get(
+        SETTINGS.urls.payments_page, params={"cursor": "not a cursor"}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
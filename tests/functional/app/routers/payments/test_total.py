@@ -1,6 +1,13 @@
 import datetime
+from unittest.mock import patch
 
+import pytest
+
+from app.repositories.payments import PaymentRepo
+from app.routers.payments.total import read_dashboard_async
+from app.schemas.payments import PaymentCreate
 from app.settings import SETTINGS
+from tests.conftest import TEST_USER_ID, raise_always
 
 
 def test_total_payment(client, fill_db):
@@ -12,3 +19,51 @@ def test_total_payment_yearly(client, fill_db):
     current_year = datetime.datetime.now().year
     response = client.get(f"{SETTINGS.urls.payments_dashboard}/{current_year}")
     assert response.status_code == 200
+
+
+def test_repeat_view_is_served_from_cache(
+    client, session, fill_db, category
+):
+    first = client.get(SETTINGS.urls.payments_dashboard)
+    assert first.status_code == 200
+    with patch.object(PaymentRepo, "get_period_dashboard", raise_always):
+        second = client.get(SETTINGS.urls.payments_dashboard)
+    assert second.text == first.text
+
+    PaymentRepo(session).create(
+        PaymentCreate(
+            name="хлеб",
+            amount_in_rub=1,
+            category_id=category.id,
+            user_id=TEST_USER_ID,
+            created_at=datetime.datetime.now(),
+        ),
+        user_id=TEST_USER_ID,
+    )
+    with patch.object(PaymentRepo, "get_period_dashboard", raise_always):
+        third = client.get(SETTINGS.urls.payments_dashboard)
+    assert third.text != first.text
+
+
+def test_dashboard_reports_server_timing(client, fill_db):
+    response = client.get(SETTINGS.urls.payments_dashboard)
+    assert response.status_code == 200
+    timings = dict(
+        x.strip().split(";", 1)
+        for x in response.headers["server-timing"].split(",")
+    )
+    assert set(timings) == {"db", "db-slowest", "render", "total"}
+    queries = int(timings["db"].split('desc="')[1].split()[0])
+    assert queries > 0
+    assert float(timings["render"].removeprefix("dur=")) > 0
+
+
+@pytest.mark.asyncio
+async def test_async_dashboard_error_is_raised_when_read():
+    class FailingRepo:
+        async def get_period_dashboard(self, user_id, limit):
+            raise_always()
+
+    read = await read_dashboard_async(FailingRepo(), TEST_USER_ID)
+    with pytest.raises(Exception):
+        read()
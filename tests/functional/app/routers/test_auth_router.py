@@ -1,8 +1,15 @@
+import asyncio
+import threading
 from unittest.mock import patch
 from copy import deepcopy
+
+import httpx
+import pytest
 from fastapi import status
 
+from app.application import build_app
 from app.exceptions import UserNotFoundError, WrongPasswordError
+from app.repositories.payments import PaymentRepo
 from app.repositories.users import UserRepo
 from app.settings import SETTINGS
 from app.utils.tools.auth_handler import AuthHandler
@@ -75,3 +82,48 @@ def test_nominal_signup_page_server(client):
     """Case: endpoint returns signup modal."""
     response = client.get(SETTINGS.urls.signup)
     assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_sync_handlers_do_not_block_each_other(token, fill_db):
+    """Case: several dashboards are requested at the same time.
+
+    Each handler waits until all of them are inside the repo.
+    That only happens if they run in parallel threads,
+    a handler blocking the event loop would break the barrier.
+    """
+    parallel_requests = 4
+    barrier = threading.Barrier(parallel_requests, timeout=5)
+    get_date_bounds = PaymentRepo.get_date_bounds
+
+    def wait_for_other_requests(self, *args, **kwargs):
+        barrier.wait()
+        return get_date_bounds(self, *args, **kwargs)
+
+    transport = httpx.ASGITransport(app=build_app())
+    with patch.object(
+        PaymentRepo, "get_date_bounds", wait_for_other_requests
+    ):
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://testserver",
+            cookies={"token": token},
+        ) as client:
+            responses = await asyncio.gather(
+                *(
+                    client.get(SETTINGS.urls.payments_dashboard)
+                    for _ in range(parallel_requests)
+                )
+            )
+    assert not barrier.broken
+    assert len(responses) == parallel_requests
+
+
+def test_token_is_decoded_once_per_request(client, fill_db):
+    decode_token = AuthHandler.decode_token
+    with patch.object(
+        AuthHandler, "decode_token", autospec=True, side_effect=decode_token
+    ) as decode:
+        response = client.get(SETTINGS.urls.payments_dashboard)
+    assert response.status_code == 200
+    assert decode.call_count == 1
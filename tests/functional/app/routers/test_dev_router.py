@@ -1,5 +1,15 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.application import build_app
 from app.utils.constants import PRODUCTS
-from tests.conftest import clean_db, get_categories, get_payments
+from tests.conftest import (
+    clean_db,
+    get_all_income,
+    get_categories,
+    get_payments,
+)
 
 
 def test_dev_router_populating_the_database_with_payments(client, session):
@@ -23,3 +33,33 @@ def test_dev_router_populating_the_database_with_categories(client, session):
     # verify that categories appered in the database
     all_categories = get_categories(session)
     assert all_categories
+
+
+def test_dev_router_populating_the_database_in_bulk(client, session):
+    response = client.post(
+        "/populate-bulk",
+        params={"users": 2, "years": 1, "payments_per_day": 2},
+    )
+    assert response.status_code == 200
+    totals = response.json()
+    assert totals["users"] == 2
+    assert totals["payments"] == len(get_payments(session))
+    assert totals["income"] == len(get_all_income(session))
+
+
+@pytest.mark.parametrize(
+    "file_name", ["../../../etc/passwd", "/etc/passwd", "missing.csv"]
+)
+def test_dev_router_import_rejects_files_outside_upload_dir(
+    client, session, file_name
+):
+    response = client.post("/import-payments", params={"file_name": file_name})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not get_payments(session)
+
+
+def test_dev_router_import_requires_token(session):
+    response = TestClient(app=build_app(), follow_redirects=False).post(
+        "/import-payments", params={"file_name": "payments.csv"}
+    )
+    assert response.status_code == status.HTTP_303_SEE_OTHER
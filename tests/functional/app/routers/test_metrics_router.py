@@ -0,0 +1,34 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.application import build_app
+from app.settings import METRICS, SETTINGS
+
+
+def test_metrics(client, fill_db):
+    client.get(SETTINGS.urls.payments_dashboard)
+    response = client.get(SETTINGS.urls.metrics)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    route = SETTINGS.urls.payments_dashboard
+    assert (
+        f'beeb_request_duration_seconds_count{{method="GET",route="{route}"}}'
+        in response.text
+    )
+    assert "beeb_template_render_seconds_count" in response.text
+    assert "beeb_db_pool_checked_out" in response.text
+    assert 'beeb_cache_hit_ratio{cache="dashboard"}' in response.text
+
+
+def test_metrics_count_handled_errors():
+    """Case: an invalid token is rejected by the route, not raised."""
+    before = sum(METRICS.errors.values())
+    client = TestClient(
+        app=build_app(), follow_redirects=False, cookies={"token": "bad"}
+    )
+    response = client.get(SETTINGS.urls.payments_dashboard)
+    assert response.status_code == status.HTTP_303_SEE_OTHER
+    assert sum(METRICS.errors.values()) == before + 1
+    assert "beeb_errors_total{type=" in client.get(
+        SETTINGS.urls.metrics
+    ).text
@@ -0,0 +1,258 @@
+"""HTTP load test of the whole request path.
+
+Starts uvicorn on build_app(), fills the database with generated users
+and drives login, list, create and dashboards from concurrent clients:
+
+    python -m tests.load --users 10 --concurrency 50 --duration 60
+
+Prints RPS, p50/p95/p99 latency and the error rate per route.
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.settings import SESSION_FACTORY, SETTINGS
+from app.utils.constants import CATEGORIES, GENERATED_USER_PASSWORD
+from app.utils.tools.data_generator import populate
+
+MIGRATIONS_DIR = Path(__file__).parent.parent.parent / "migrations"
+
+
+class RouteStats:
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self.errors = 0
+
+    def add(self, latency: float, ok: bool) -> None:
+        self.latencies.append(latency)
+        if not ok:
+            self.errors += 1
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile, q in [0, 100]."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def get_scenario() -> list[tuple[str, str, str, dict | None]]:
+    """Routes hit by every client in turn: name, method, url, form."""
+    today = datetime.date.today()
+    urls = SETTINGS.urls
+    return [
+        ("list", "GET", urls.payments, None),
+        (
+            "create",
+            "POST",
+            urls.create_payment,
+            {"name": "хлеб", "amount": "1", "category": CATEGORIES[1]},
+        ),
+        ("dashboard", "GET", urls.payments_dashboard, None),
+        (
+            "dashboard_yearly",
+            "GET",
+            urls.payments_dashboard_yearly.format(year=today.year),
+            None,
+        ),
+        (
+            "dashboard_monthly",
+            "GET",
+            urls.payments_dashboard_monthly.format(
+                year=today.year, month=today.month
+            ),
+            None,
+        ),
+    ]
+
+
+async def timed_request(
+    client: httpx.AsyncClient,
+    stats: RouteStats,
+    method: str,
+    url: str,
+    data: dict | None = None,
+) -> httpx.Response | None:
+    start = time.perf_counter()
+    try:
+        response = await client.request(method, url, data=data)
+    except httpx.HTTPError:
+        stats.add(time.perf_counter() - start, ok=False)
+        return None
+    stats.add(time.perf_counter() - start, ok=response.status_code < 400)
+    return response
+
+
+async def run_client(
+    base_url: str,
+    username: str,
+    deadline: float,
+    stats: dict[str, RouteStats],
+) -> None:
+    scenario = get_scenario()
+    async with httpx.AsyncClient(
+        base_url=base_url, follow_redirects=False, timeout=30
+    ) as client:
+        response = await timed_request(
+            client,
+            stats["login"],
+            "POST",
+            SETTINGS.urls.login,
+            {"username": username, "password": GENERATED_USER_PASSWORD},
+        )
+        if response is None or "token" not in client.cookies:
+            return
+        step = random.randrange(len(scenario))
+        while time.perf_counter() < deadline:
+            name, method, url, data = scenario[step % len(scenario)]
+            await timed_request(client, stats[name], method, url, data)
+            step += 1
+
+
+async def run_load(
+    base_url: str, users: int, concurrency: int, duration: float
+) -> tuple[dict[str, RouteStats], float]:
+    names = ["login", *(x[0] for x in get_scenario())]
+    stats = {name: RouteStats() for name in names}
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(
+        *(
+            run_client(
+                base_url, f"generated_{i % users + 1}", deadline, stats
+            )
+            for i in range(concurrency)
+        )
+    )
+    return stats, time.perf_counter() - start
+
+
+def build_report(stats: dict[str, RouteStats], elapsed: float) -> dict:
+    report = {}
+    for name, route in stats.items():
+        count = len(route.latencies)
+        report[name] = {
+            "requests": count,
+            "rps": count / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(route.latencies, 50) * 1000,
+            "p95_ms": percentile(route.latencies, 95) * 1000,
+            "p99_ms": percentile(route.latencies, 99) * 1000,
+            "error_rate": route.errors / count if count else 0.0,
+        }
+    return report
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"{'route':<20}{'requests':>10}{'rps':>10}{'p50 ms':>10}"
+        f"{'p95 ms':>10}{'p99 ms':>10}{'errors':>10}"
+    )
+    for name, row in report.items():
+        print(
+            f"{name:<20}{row['requests']:>10}{row['rps']:>10.1f}"
+            f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}"
+            f"{row['p99_ms']:>10.1f}{row['error_rate']:>10.2%}"
+        )
+
+
+def migrate(attempts: int = 30) -> None:
+    """Applies the migrations, waiting for the database to come up."""
+    for attempt in range(attempts):
+        try:
+            with SESSION_FACTORY() as session:
+                for migration in sorted(MIGRATIONS_DIR.iterdir()):
+                    with session.begin():
+                        session.execute(text(migration.read_text()))
+            return
+        except OperationalError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(1)
+
+
+def start_server(port: int, workers: int) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.application:build_app",
+            "--factory",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        env=os.environ.copy(),
+    )
+    ping = f"http://127.0.0.1:{port}{SETTINGS.urls.ping}"
+    for _ in range(100):
+        try:
+            if httpx.get(ping).status_code == 200:
+                return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("uvicorn did not start")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m tests.load")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--years", type=int, default=2)
+    parser.add_argument("--payments-per-day", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--base-url", help="test a running server, skips the setup"
+    )
+    parser.add_argument("--output", type=Path, help="save the report as JSON")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        migrate()
+        with SESSION_FACTORY() as session:
+            populate(
+                session,
+                users=args.users,
+                years=args.years,
+                payments_per_day=args.payments_per_day,
+            )
+        server = start_server(args.port, args.workers)
+        base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        stats, elapsed = asyncio.run(
+            run_load(base_url, args.users, args.concurrency, args.duration)
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    report = build_report(stats, elapsed)
+    print_report(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    return 1 if any(x["error_rate"] for x in report.values()) else 0
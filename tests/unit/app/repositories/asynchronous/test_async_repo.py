@@ -0,0 +1,37 @@
+import pytest
+
+from app.repositories.asynchronous import AsyncPaymentRepo
+from app.repositories.payments import PaymentRepo
+from app.schemas.dates import DateFilter
+from app.settings import ASYNC_SESSION_FACTORY, SETTINGS
+from tests.conftest import TEST_USER_ID
+
+
+def get_limits(session) -> list[DateFilter]:
+    bounds = PaymentRepo(session).get_date_bounds(TEST_USER_ID)
+    year, month = bounds.max_date.year, bounds.max_date.month
+    return [
+        DateFilter(),
+        DateFilter(year=year),
+        DateFilter(year=year, month=month),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not SETTINGS.database.use_async, reason="use_async is not set"
+)
+async def test_async_repo_matches_sync_repo(session, fill_db):
+    repo = PaymentRepo(session)
+    async with ASYNC_SESSION_FACTORY() as async_session:
+        async_repo = AsyncPaymentRepo(async_session)
+        bounds = await async_repo.get_date_bounds(TEST_USER_ID)
+        dashboards = [
+            await async_repo.get_period_dashboard(TEST_USER_ID, limit)
+            for limit in get_limits(session)
+        ]
+    assert bounds == repo.get_date_bounds(TEST_USER_ID)
+    assert dashboards == [
+        repo.get_period_dashboard(TEST_USER_ID, limit)
+        for limit in get_limits(session)
+    ]
@@ -1,8 +1,18 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from sqlalchemy.orm import Session
 
-from app.exceptions import DuplicateNameCreateError
+from app.exceptions import (
+    DuplicateNameCreateError,
+    DuplicateNameEditError,
+    NotOwnerError,
+)
+from app.models import Category
 from app.repositories.categories import CategoryRepo
 from app.schemas.categories import CategoryCreate
+from app.settings import CATEGORY_CACHE, ENGINE
 
 
 def test_create_same_name_same_user(session, category_create):
@@ -16,3 +26,81 @@ def test_create_same_name_different_user(session, category_create):
     to_create.user_id = 500
     new_category = CategoryRepo(session).create(to_create)
     assert new_category.id
+
+
+def test_get_dict_names_is_cached_until_create(session, category):
+    repo = CategoryRepo(session)
+    names = repo.get_dict_names(category.user_id)
+    assert names[category.name] == category.id
+    assert CATEGORY_CACHE.get(category.user_id) == names
+    new_category = repo.create(
+        CategoryCreate(name="новая категория", user_id=category.user_id)
+    )
+    assert CATEGORY_CACHE.get(category.user_id) is None
+    assert repo.get_dict_names(category.user_id)[new_category.name] == (
+        new_category.id
+    )
+    assert repo.list_names(category.user_id) == [
+        x.name for x in repo.read_all(category.user_id)
+    ]
+
+
+def test_get_category_id_reads_again_on_miss(session, category):
+    repo = CategoryRepo(session)
+    repo.get_dict_names(category.user_id)
+    new_category = Category(name="в обход кэша", user_id=category.user_id)
+    session.add(new_category)
+    session.commit()
+    assert repo.get_category_id(new_category.name, category.user_id) == (
+        new_category.id
+    )
+    with pytest.raises(KeyError):
+        repo.get_category_id("нет такой", category.user_id)
+
+
+def test_create_same_name_in_parallel(category):
+    """Case: several requests create the same category at once.
+
+    Only the unique index can tell them apart, exactly one must win.
+    """
+    parallel_requests = 4
+    barrier = threading.Barrier(parallel_requests, timeout=5)
+    to_create = CategoryCreate(name="параллельная", user_id=category.user_id)
+
+    def create(_) -> bool:
+        with Session(ENGINE) as session:
+            barrier.wait()
+            try:
+                CategoryRepo(session).create(to_create)
+                return True
+            except DuplicateNameCreateError:
+                return False
+
+    with ThreadPoolExecutor(max_workers=parallel_requests) as pool:
+        results = list(pool.map(create, range(parallel_requests)))
+    assert results.count(True) == 1
+
+
+def test_update_keeps_own_name(session, category):
+    to_update = CategoryCreate(
+        name=category.name, is_active=False, user_id=category.user_id
+    )
+    CategoryRepo(session).update(category.id, to_update)
+    assert not CategoryRepo(session).read(category.id).is_active
+
+
+def test_update_to_taken_name(session, category):
+    repo = CategoryRepo(session)
+    other = repo.create(
+        CategoryCreate(name="занятое имя", user_id=category.user_id)
+    )
+    to_update = CategoryCreate(name=other.name, user_id=category.user_id)
+    with pytest.raises(DuplicateNameEditError):
+        repo.update(category.id, to_update)
+    assert repo.read(category.id).name == category.name
+
+
+def test_update_not_owner(session, category):
+    to_update = CategoryCreate(name="чужая", user_id=category.user_id + 1)
+    with pytest.raises(NotOwnerError):
+        CategoryRepo(session).update(category.id, to_update)
@@ -0,0 +1,67 @@
+import csv
+from pathlib import Path
+
+from app.models import Category
+from app.repositories.imports import ImportRepo
+from app.repositories.ledger import LedgerRepo
+from app.repositories.rollups import RollupRepo
+from app.utils.tools.importers import read_import_rows
+from tests.conftest import (
+    TEST_USER_ID,
+    get_all_income,
+    get_categories,
+    get_payments,
+)
+
+ROWS = [
+    ["Название", "Сумма", "Категория", "Дата", "Граммы", "Штуки"],
+    ["хлеб", "120", "еда", "2025-01-10T12:00:00+03:00", "500", ""],
+    ["зарплата", "100 000 ₽", "", "2025-01-05T09:00:00+03:00", "", ""],
+    ["", "100", "еда", "2025-01-11T12:00:00+03:00", "", ""],
+    ["молоко", "-5", "еда", "2025-01-11T12:00:00+03:00", "", ""],
+    ["билет", "50", "Транспорт", "2025-01-12T12:00:00+03:00", "", "2"],
+]
+
+
+def write_csv(tmp_path) -> Path:
+    path = tmp_path / "payments.csv"
+    with path.open("w", newline="", encoding="utf-8") as file:
+        csv.writer(file).writerows(ROWS)
+    return path
+
+
+def test_read_import_rows_maps_headers(tmp_path):
+    rows = list(read_import_rows(write_csv(tmp_path)))
+    assert len(rows) == len(ROWS) - 1
+    assert rows[0] == {
+        "name": "хлеб",
+        "amount_in_rub": "120",
+        "category": "еда",
+        "created_at": "2025-01-10T12:00:00+03:00",
+        "grams": "500",
+        "quantity": "",
+    }
+
+
+def test_import_rows(session, tmp_path):
+    session.add(Category(name="еда", user_id=TEST_USER_ID))
+    session.commit()
+    rows = read_import_rows(write_csv(tmp_path))
+
+    report = ImportRepo(session).import_rows(TEST_USER_ID, rows, chunk_size=2)
+
+    assert report.payments == 2
+    assert report.income == 1
+    assert [x.row for x in report.errors] == [4, 5]
+    payments = {x.name: x for x in get_payments(session)}
+    assert payments["хлеб"].amount == 12000
+    assert payments["хлеб"].grams == 500
+    assert payments["билет"].quantity == 2
+    assert {x.name for x in get_categories(session)} == {"еда", "транспорт"}
+    assert [x.amount for x in get_all_income(session)] == [10000000]
+    ledger = LedgerRepo(session).verify(TEST_USER_ID)
+    assert ledger.balance == ledger.expected_balance
+    rollup = RollupRepo(session)
+    rows_before_rebuild = rollup.read_rows(TEST_USER_ID)
+    rollup.rebuild(TEST_USER_ID)
+    assert rollup.read_rows(TEST_USER_ID) == rows_before_rebuild
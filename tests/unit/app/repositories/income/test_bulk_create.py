@@ -0,0 +1,33 @@
+import datetime
+
+from app.models import Income
+from app.repositories.income import IncomeRepo
+from app.repositories.ledger import LedgerRepo
+from app.repositories.rollups import RollupRepo
+from app.schemas.income import IncomeCreate
+from tests.conftest import TEST_USER_ID
+
+
+def test_bulk_create(session, fill_db):
+    now = datetime.datetime.now().astimezone()
+    incomes = [
+        IncomeCreate(
+            name="премия",
+            amount_in_rub=1000 * (i + 1),
+            created_at=now - datetime.timedelta(days=40 * i),
+            user_id=TEST_USER_ID,
+        )
+        for i in range(3)
+    ]
+
+    ids = IncomeRepo(session).bulk_create(incomes, user_id=TEST_USER_ID)
+
+    assert [session.get(Income, x).amount for x in ids] == [
+        int(x.amount) for x in incomes
+    ]
+    ledger = LedgerRepo(session).verify(TEST_USER_ID)
+    assert ledger.balance == ledger.expected_balance
+    rollup = RollupRepo(session)
+    rows = rollup.read_rows(TEST_USER_ID)
+    rollup.rebuild(TEST_USER_ID)
+    assert rollup.read_rows(TEST_USER_ID) == rows
@@ -0,0 +1,129 @@
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy.orm import Session
+
+from app.models import Income
+from app.repositories.income import IncomeRepo
+from app.repositories.ledger import LedgerRepo
+from app.repositories.payments import PaymentRepo
+from app.schemas.income import IncomeCreate
+from app.schemas.payments import PaymentCreate
+from app.settings import ENGINE
+from tests.conftest import TEST_USER_ID
+
+
+def add_salary(session, created_at: datetime.datetime) -> Income:
+    salary = Income(
+        name="зарплата",
+        amount=500000,
+        user_id=TEST_USER_ID,
+        created_at=created_at,
+    )
+    session.add(salary)
+    session.commit()
+    return salary
+
+
+def test_rebuild_matches_raw_balance(
+    session, current_payment, month_ago_payment, year_ago_payment
+):
+    add_salary(session, year_ago_payment.created_at)
+    ledger = LedgerRepo(session)
+    ledger.rebuild(TEST_USER_ID)
+    session.commit()
+    repo = PaymentRepo(session)
+    for max_date in (
+        year_ago_payment.created_at,
+        month_ago_payment.created_at,
+        month_ago_payment.created_at - datetime.timedelta(seconds=1),
+        datetime.datetime.now().astimezone(),
+    ):
+        assert ledger.get_balance(
+            user_id=TEST_USER_ID, max_date=max_date
+        ) == repo.get_balance(user_id=TEST_USER_ID, max_date=max_date)
+    assert ledger.verify(TEST_USER_ID).is_consistent
+
+
+def test_get_balance_without_snapshot(session):
+    ledger = LedgerRepo(session)
+    now = datetime.datetime.now().astimezone()
+    assert ledger.get_balance(user_id=TEST_USER_ID, max_date=now) is None
+
+
+def test_writes_keep_ledger_consistent(session, category):
+    income = IncomeRepo(session).create(
+        IncomeCreate(
+            name="зарплата",
+            amount_in_rub=1000,
+            user_id=TEST_USER_ID,
+            created_at=datetime.datetime.now(),
+        ),
+        user_id=TEST_USER_ID,
+    )
+    repo = PaymentRepo(session)
+    payment = repo.create(
+        PaymentCreate(
+            name="хлеб",
+            amount_in_rub=100,
+            category_id=category.id,
+            user_id=TEST_USER_ID,
+            created_at=datetime.datetime.now(),
+        ),
+        user_id=TEST_USER_ID,
+    )
+    ledger = LedgerRepo(session)
+    report = ledger.verify(TEST_USER_ID)
+    assert report.is_consistent
+    assert report.balance == income.amount - payment.amount
+
+    repo.delete(payment_id=payment.id, user_id=TEST_USER_ID)
+    report = ledger.verify(TEST_USER_ID)
+    assert report.is_consistent
+    assert report.balance == income.amount
+
+    IncomeRepo(session).delete(income_id=income.id, user_id=TEST_USER_ID)
+    report = ledger.verify(TEST_USER_ID)
+    assert report.is_consistent
+    assert report.balance == 0
+
+
+def test_verify_detects_drift(session, category, current_payment):
+    ledger = LedgerRepo(session)
+    ledger.rebuild(TEST_USER_ID)
+    session.commit()
+    add_salary(session, datetime.datetime.now())
+    report = ledger.verify(TEST_USER_ID)
+    assert not report.is_consistent
+    ledger.rebuild(TEST_USER_ID)
+    session.commit()
+    assert ledger.verify(TEST_USER_ID).is_consistent
+
+
+def test_first_writes_in_parallel(session):
+    """Case: a user without a ledger writes from several requests at once.
+
+    Only one of them may build the ledger, the others must wait for it.
+    """
+    parallel_requests = 4
+    barrier = threading.Barrier(parallel_requests, timeout=5)
+
+    def write(_) -> None:
+        with Session(ENGINE) as parallel_session:
+            ledger = LedgerRepo(parallel_session)
+            barrier.wait()
+            ledger.ensure(TEST_USER_ID)
+            ledger.apply(
+                user_id=TEST_USER_ID,
+                created_at=datetime.datetime.now().astimezone(),
+                delta=100,
+            )
+            parallel_session.commit()
+
+    with ThreadPoolExecutor(max_workers=parallel_requests) as pool:
+        list(pool.map(write, range(parallel_requests)))
+    now = datetime.datetime.now().astimezone()
+    assert LedgerRepo(session).get_balance(
+        user_id=TEST_USER_ID, max_date=now
+    ) == 100 * parallel_requests
@@ -0,0 +1,62 @@
+import datetime
+
+from app.models import Income
+from app.repositories.payments import PaymentRepo
+from app.utils.tools.helpers import get_timezone
+from tests.conftest import TEST_USER_ID
+
+
+def test_aggregate_dashboard_matches_row_by_row_totals(
+    session, current_payment, month_ago_payment, year_ago_payment, category
+):
+    salary = Income(
+        name="зарплата",
+        amount=20000,
+        user_id=TEST_USER_ID,
+        created_at=year_ago_payment.created_at,
+    )
+    session.add(salary)
+    session.flush()
+    session.commit()
+    max_date = datetime.datetime.now().astimezone()
+    min_date = month_ago_payment.created_at
+    repo = PaymentRepo(session)
+
+    aggregates = repo.aggregate_dashboard(
+        user_id=TEST_USER_ID, max_date=max_date, min_date=min_date
+    )
+
+    assert aggregates.total_income == salary.amount
+    assert aggregates.total_spending == repo.sum_payments(
+        user_id=TEST_USER_ID, max_date=max_date
+    )
+    assert aggregates.balance == repo.get_balance(
+        user_id=TEST_USER_ID, max_date=max_date
+    )
+    in_period = [current_payment, month_ago_payment]
+    assert aggregates.period_spending == sum(x.amount for x in in_period)
+    assert aggregates.category_spending == {
+        category.name: sum(x.amount for x in in_period)
+    }
+    expected_monthly = {}
+    for payment in in_period:
+        month = payment.created_at.astimezone(get_timezone()).month
+        expected_monthly[month] = (
+            expected_monthly.get(month, 0) + payment.amount
+        )
+    assert aggregates.monthly_spending == expected_monthly
+    assert aggregates.years == sorted(
+        {x.created_at.astimezone(get_timezone()).year for x in in_period},
+        reverse=True,
+    )
+
+
+def test_aggregate_dashboard_empty_db(session):
+    now = datetime.datetime.now().astimezone()
+    aggregates = PaymentRepo(session).aggregate_dashboard(
+        user_id=TEST_USER_ID, max_date=now, min_date=now
+    )
+    assert aggregates.balance == 0
+    assert not aggregates.monthly_spending
+    assert not aggregates.category_spending
+    assert not aggregates.years
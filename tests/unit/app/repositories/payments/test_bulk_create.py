@@ -0,0 +1,70 @@
+import datetime
+
+import pytest
+from sqlalchemy import func, select
+
+from app.exceptions import SpendingOverBalanceError
+from app.models import Payment
+from app.repositories.ledger import LedgerRepo
+from app.repositories.payments import PaymentRepo
+from app.repositories.rollups import RollupRepo
+from app.schemas.payments import PaymentCreate
+from tests.conftest import TEST_USER_ID, get_categories
+
+
+def get_new_payments(session, amount_in_rub: int, size: int):
+    category_id = get_categories(session)[0].id
+    now = datetime.datetime.now().astimezone()
+    return [
+        PaymentCreate(
+            name=f"товар {i}",
+            amount_in_rub=amount_in_rub,
+            category_id=category_id,
+            created_at=now - datetime.timedelta(days=40 * i),
+            grams=100 if i % 2 else None,
+            user_id=TEST_USER_ID,
+        )
+        for i in range(size)
+    ]
+
+
+def test_bulk_create(session, fill_db):
+    payments = get_new_payments(session, amount_in_rub=10, size=5)
+
+    ids = PaymentRepo(session).bulk_create(payments, user_id=TEST_USER_ID)
+
+    assert len(ids) == len(set(ids)) == len(payments)
+    for payment_id, payment in zip(ids, payments):
+        created = session.get(Payment, payment_id)
+        assert created.name == payment.name
+        assert created.amount == int(payment.amount)
+        assert created.grams == payment.grams
+        assert created.quantity is None
+        assert created.created_at == payment.created_at
+    ledger = LedgerRepo(session).verify(TEST_USER_ID)
+    assert ledger.balance == ledger.expected_balance
+    assert not ledger.mismatched_days
+    rollup = RollupRepo(session)
+    rows = rollup.read_rows(TEST_USER_ID)
+    rollup.rebuild(TEST_USER_ID)
+    assert rollup.read_rows(TEST_USER_ID) == rows
+
+
+def test_bulk_create_checks_balance_of_the_whole_batch(session, fill_db):
+    count_before = session.scalar(select(func.count(Payment.id)))
+    balance = PaymentRepo(session).get_balance(
+        TEST_USER_ID, max_date=datetime.datetime.now().astimezone()
+    )
+    payments = get_new_payments(
+        session, amount_in_rub=balance // 100 // 2 + 1, size=2
+    )
+
+    with pytest.raises(SpendingOverBalanceError):
+        PaymentRepo(session).bulk_create(payments, user_id=TEST_USER_ID)
+
+    session.rollback()
+    assert session.scalar(select(func.count(Payment.id))) == count_before
+
+
+def test_bulk_create_empty(session):
+    assert PaymentRepo(session).bulk_create([], user_id=TEST_USER_ID) == []
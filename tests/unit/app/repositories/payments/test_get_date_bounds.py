@@ -0,0 +1,44 @@
+from app.models import Income
+from app.repositories.payments import PaymentRepo
+from app.utils.enums import LedgerSource
+from tests.conftest import TEST_USER_ID
+
+
+def test_get_date_bounds_payments_and_income(
+    session, year_ago_payment, month_ago_payment, current_payment
+):
+    income = Income(
+        name="зарплата",
+        amount=20000,
+        user_id=TEST_USER_ID,
+        created_at=month_ago_payment.created_at,
+    )
+    session.add(income)
+    session.commit()
+    bounds = PaymentRepo(session).get_date_bounds(TEST_USER_ID)
+    assert bounds.min_date == year_ago_payment.created_at
+    assert bounds.max_date.date() == current_payment.created_at.date()
+
+
+def test_get_date_bounds_income_only(session, month_ago_payment):
+    income = Income(name="зарплата", amount=20000, user_id=TEST_USER_ID)
+    session.add(income)
+    session.commit()
+    bounds = PaymentRepo(session).get_date_bounds(
+        TEST_USER_ID, source=LedgerSource.income
+    )
+    assert bounds.min_date == bounds.max_date == income.created_at
+
+
+def test_get_date_bounds_no_income(session, year_ago_payment, current_payment):
+    session.commit()
+    repo = PaymentRepo(session)
+    bounds = repo.get_date_bounds(TEST_USER_ID)
+    assert bounds.min_date == year_ago_payment.created_at
+    assert repo.get_min_date_overall(TEST_USER_ID) == bounds.min_date
+
+
+def test_get_date_bounds_empty_db(session):
+    bounds = PaymentRepo(session).get_date_bounds(TEST_USER_ID)
+    assert bounds.min_date is None
+    assert bounds.max_date is None
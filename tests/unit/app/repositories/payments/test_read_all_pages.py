@@ -0,0 +1,59 @@
+import datetime
+
+import pytest
+from sqlalchemy import update
+
+from app.exceptions import InvalidCursorError
+from app.models import Income, Payment
+from app.repositories.payments import PaymentRepo
+from app.schemas.payments import PaymentCursor
+from tests.conftest import TEST_USER_ID
+
+
+def test_pages_cover_all_records_once(session, fill_db):
+    """Case: records share created_at within one transaction.
+
+    Walking the pages with a cursor must return every record
+    exactly once and in the same order as the unpaginated list.
+    """
+    repo = PaymentRepo(session)
+    expected = [(x.type, x.id) for x in repo.read_all(user_id=TEST_USER_ID)]
+    pages, cursor = [], None
+    while page := repo.read_all(user_id=TEST_USER_ID, cursor=cursor, limit=3):
+        assert len(page) <= 3
+        pages.extend((x.type, x.id) for x in page)
+        cursor = PaymentCursor.decode(repo.get_cursor(page[-1]).encode())
+    assert pages == expected
+    assert len(set(pages)) == len(expected) == 20
+
+
+def test_pages_cover_records_of_both_kinds_at_one_time(session, fill_db):
+    """Case: payments and income share one created_at.
+
+    Ids of the two tables overlap, so pages must not stop or repeat
+    records when the cursor lands between a payment and an income.
+    """
+    created_at = datetime.datetime.now().astimezone()
+    session.execute(update(Payment).values(created_at=created_at))
+    session.execute(update(Income).values(created_at=created_at))
+    session.commit()
+    repo = PaymentRepo(session)
+    expected = [(x.type, x.id) for x in repo.read_all(user_id=TEST_USER_ID)]
+    for limit in (1, 2, 7):
+        pages, cursor = [], None
+        while page := repo.read_all(
+            user_id=TEST_USER_ID, cursor=cursor, limit=limit
+        ):
+            pages.extend((x.type, x.id) for x in page)
+            cursor = repo.get_cursor(page[-1])
+        assert pages == expected
+
+
+def test_empty_db(session):
+    assert PaymentRepo(session).read_all(user_id=TEST_USER_ID, limit=3) == []
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", "e30="])
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        PaymentCursor.decode(cursor)
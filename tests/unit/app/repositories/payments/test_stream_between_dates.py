@@ -0,0 +1,40 @@
+import datetime
+
+from app.repositories.payments import PaymentRepo
+from tests.conftest import TEST_USER_ID
+
+
+def test_stream_matches_read_all_between_dates(session, fill_db):
+    repo = PaymentRepo(session)
+    max_date = datetime.datetime.now().astimezone()
+    min_date = max_date - datetime.timedelta(days=1)
+    expected = repo.read_all_between_dates(
+        user_id=TEST_USER_ID, max_date=max_date, min_date=min_date
+    )
+    streamed = repo.stream_between_dates(
+        user_id=TEST_USER_ID,
+        max_date=max_date,
+        min_date=min_date,
+        batch_size=3,
+    )
+    received = [(x.id, x.amount, x.created_at) for x in streamed]
+    assert received == [(x.id, x.amount, x.created_at) for x in expected]
+    assert len(received) == 20
+
+
+def test_shares_from_stream(session, fill_db):
+    repo = PaymentRepo(session)
+    max_date = datetime.datetime.now().astimezone()
+    min_date = max_date - datetime.timedelta(days=1)
+    expected = repo.get_total_monthly_payments_shares(
+        repo.get_spendings(
+            repo.read_all_between_dates(
+                user_id=TEST_USER_ID, max_date=max_date, min_date=min_date
+            )
+        )
+    )
+    streamed = repo.stream_between_dates(
+        user_id=TEST_USER_ID, max_date=max_date, min_date=min_date
+    )
+    spendings = (x for x in streamed if x.type != "доход")
+    assert repo.get_total_monthly_payments_shares(spendings) == expected
@@ -0,0 +1,130 @@
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy.orm import Session
+
+from app.models import Income
+from app.repositories.income import IncomeRepo
+from app.repositories.payments import PaymentRepo
+from app.repositories.rollups import RollupRepo
+from app.schemas.dates import DateFilter
+from app.schemas.income import IncomeCreate
+from app.schemas.payments import PaymentCreate
+from app.settings import ENGINE
+from app.utils.tools.helpers import get_period_bounds, get_timezone
+from tests.conftest import TEST_USER_ID
+
+
+def test_aggregate_matches_raw_aggregates(
+    session, current_payment, month_ago_payment, year_ago_payment
+):
+    session.add(
+        Income(
+            name="зарплата",
+            amount=500000,
+            user_id=TEST_USER_ID,
+            created_at=year_ago_payment.created_at,
+        )
+    )
+    session.commit()
+    rollup = RollupRepo(session)
+    rollup.rebuild(TEST_USER_ID)
+    session.commit()
+    repo = PaymentRepo(session)
+    for payment in (current_payment, month_ago_payment, year_ago_payment):
+        local = payment.created_at.astimezone(get_timezone())
+        for limit in (
+            DateFilter(year=local.year),
+            DateFilter(year=local.year, month=local.month),
+        ):
+            start, end = get_period_bounds(limit)
+            expected = repo.aggregate_dashboard(
+                user_id=TEST_USER_ID,
+                max_date=end - datetime.timedelta(microseconds=1),
+                min_date=start,
+            )
+            assert rollup.aggregate(user_id=TEST_USER_ID, limit=limit) == (
+                expected
+            )
+
+
+def test_writes_keep_rollup_consistent(session, category):
+    income_repo = IncomeRepo(session)
+    income = income_repo.create(
+        IncomeCreate(
+            name="зарплата",
+            amount_in_rub=1000,
+            user_id=TEST_USER_ID,
+            created_at=datetime.datetime.now(),
+        ),
+        user_id=TEST_USER_ID,
+    )
+    repo = PaymentRepo(session)
+    payment = repo.create(
+        PaymentCreate(
+            name="хлеб",
+            amount_in_rub=100,
+            category_id=category.id,
+            grams=500,
+            user_id=TEST_USER_ID,
+            created_at=datetime.datetime.now(),
+        ),
+        user_id=TEST_USER_ID,
+    )
+    rollup = RollupRepo(session)
+    incremental = rollup.read_rows(TEST_USER_ID)
+    rollup.rebuild(TEST_USER_ID)
+    assert rollup.read_rows(TEST_USER_ID) == incremental
+    assert len(incremental) == 2
+
+    repo.delete(payment_id=payment.id, user_id=TEST_USER_ID)
+    income_repo.delete(income_id=income.id, user_id=TEST_USER_ID)
+    assert not rollup.read_rows(TEST_USER_ID)
+
+
+def test_aggregate_without_rollup_reads_raw_tables(
+    session, current_payment
+):
+    """Case: the user has records but no rollup, the read must not write."""
+    repo = PaymentRepo(session)
+    rollup = RollupRepo(session)
+    assert not rollup.has_rows(TEST_USER_ID)
+    local = current_payment.created_at.astimezone(get_timezone())
+    aggregates = repo.aggregate_dashboard_from_rollup(
+        user_id=TEST_USER_ID, limit=DateFilter(year=local.year)
+    )
+    assert not rollup.has_rows(TEST_USER_ID)
+    assert aggregates.period_spending == current_payment.amount
+    assert aggregates.years == [local.year]
+
+
+def test_first_writes_in_parallel(session):
+    """Case: a user without a rollup writes from several requests at once.
+
+    Only one of them may build the rollup, the others must wait for it.
+    """
+    parallel_requests = 4
+    barrier = threading.Barrier(parallel_requests, timeout=5)
+    created_at = datetime.datetime.now()
+
+    def write(_) -> None:
+        with Session(ENGINE) as parallel_session:
+            barrier.wait()
+            IncomeRepo(parallel_session).create(
+                IncomeCreate(
+                    name="зарплата",
+                    amount_in_rub=1000,
+                    user_id=TEST_USER_ID,
+                    created_at=created_at,
+                ),
+                user_id=TEST_USER_ID,
+            )
+
+    with ThreadPoolExecutor(max_workers=parallel_requests) as pool:
+        list(pool.map(write, range(parallel_requests)))
+    rollup = RollupRepo(session)
+    incremental = rollup.read_rows(TEST_USER_ID)
+    rollup.rebuild(TEST_USER_ID)
+    assert rollup.read_rows(TEST_USER_ID) == incremental
+    assert len(incremental) == 1
@@ -0,0 +1,54 @@
+import datetime
+
+from app.repositories.payments import PaymentRepo
+from app.schemas.payments import PaymentRow, PaymentShow
+from tests.conftest import TEST_USER_ID
+
+DISPLAY_FIELDS = (
+    "id",
+    "uuid",
+    "name",
+    "amount",
+    "category",
+    "readable_grams",
+    "readable_quantity",
+    "amount_in_rub",
+    "date",
+    "type",
+)
+
+
+def test_payment_row_matches_payment_show(session, fill_db):
+    repo = PaymentRepo(session)
+    max_date = datetime.datetime.now().astimezone()
+    rows = session.execute(
+        repo.select_between_dates(
+            TEST_USER_ID,
+            max_date=max_date,
+            min_date=max_date - datetime.timedelta(days=1),
+        )
+    ).all()
+    assert rows
+    for row in rows:
+        payment_row = PaymentRow.from_row(row)
+        payment_show = PaymentShow(**row._mapping)
+        for field in DISPLAY_FIELDS:
+            assert getattr(payment_row, field) == getattr(payment_show, field)
+        assert str(row.uuid) in repr(payment_row)
+
+
+def test_payment_row_has_no_instance_dict():
+    row = PaymentRow(
+        id=1,
+        uuid=None,
+        name="хлеб",
+        grams=None,
+        quantity=2,
+        amount=10000,
+        category_id=1,
+        user_id=TEST_USER_ID,
+        created_at=datetime.datetime.now(),
+        category="продукты",
+    )
+    assert not hasattr(row, "__dict__")
+    assert row.type == "вещь"
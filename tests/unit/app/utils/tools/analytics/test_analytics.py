@@ -0,0 +1,58 @@
+import datetime
+import random
+import uuid
+
+import pytest
+
+from app.schemas.payments import PaymentRow
+from app.utils.tools import analytics
+from app.utils.tools.category_helpers import (
+    get_payments_shares,
+    get_payments_sums_per_category,
+)
+from app.utils.tools.helpers import get_monthly_payments
+
+
+def get_rows(size: int, seed: int = 0) -> list[PaymentRow]:
+    generator = random.Random(seed)
+    start = datetime.datetime(2024, 1, 1).astimezone()
+    return [
+        PaymentRow(
+            id=i,
+            uuid=uuid.uuid4(),
+            name="хлеб",
+            grams=None,
+            quantity=None,
+            amount=generator.randrange(100, 5000, 100),
+            category_id=1,
+            user_id=1,
+            created_at=start
+            + datetime.timedelta(minutes=generator.randrange(60 * 24 * 365)),
+            category=generator.choice(["еда", "транспорт", "дом"]),
+        )
+        for i in range(size)
+    ]
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "fallback"])
+def has_numpy(request, monkeypatch):
+    if request.param and not analytics.HAS_NUMPY:
+        pytest.skip("numpy is not installed")
+    monkeypatch.setattr(analytics, "HAS_NUMPY", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("size", [0, 1, 500])
+def test_matches_python_helpers(has_numpy, size):
+    rows = get_rows(size)
+    payments = analytics.load_payments(iter(rows))
+    category_sums = get_payments_sums_per_category(rows)
+    assert isinstance(payments, analytics.PaymentArrays) == has_numpy
+    assert len(payments) == size
+    assert payments.total() == sum(x.amount for x in rows)
+    assert payments.monthly_sums() == get_monthly_payments(rows)
+    assert payments.shares() == (
+        get_payments_shares(category_sums, sum(category_sums.values()))
+        if rows
+        else {}
+    )
@@ -1,7 +1,11 @@
+import datetime
+import time
+from unittest.mock import patch
+
 import pytest
 
 from app.exceptions import InvalidTokenError
-from app.utils.tools.auth_handler import AuthHandler
+from app.utils.tools.auth_handler import CLAIMS_CACHE, AuthHandler, ClaimsCache
 from tests.conftest import TEST_USER_ID
 
 
@@ -19,3 +23,33 @@ def test_decode_token():
 def test_wrong_token(wrong_token):
     with pytest.raises(InvalidTokenError):
         AuthHandler().decode_token(wrong_token)
+
+
+def test_repeat_decode_skips_verification():
+    token = AuthHandler().encode_token(username="Poblebonk", id=TEST_USER_ID)
+    first = AuthHandler().decode_token(token)
+    with patch("app.utils.tools.auth_handler.jwt.decode") as decode:
+        second = AuthHandler().decode_token(token)
+    decode.assert_not_called()
+    assert first == second
+
+
+def test_cached_token_expires():
+    token = AuthHandler().encode_token(
+        username="Poblebonk",
+        id=TEST_USER_ID,
+        expires_delta=datetime.timedelta(seconds=1),
+    )
+    AuthHandler().decode_token(token)
+    with patch("app.utils.tools.auth_handler.time.time") as now:
+        now.return_value = time.time() + 2
+        assert CLAIMS_CACHE.get(token) is None
+
+
+def test_claims_cache_is_bounded():
+    cache = ClaimsCache(max_size=2)
+    exp = time.time() + 60
+    for token in ("a", "b", "c"):
+        cache.set(token, {"id": TEST_USER_ID, "exp": exp})
+    assert cache.get("a") is None
+    assert cache.get("c") == {"id": TEST_USER_ID, "exp": exp}
@@ -0,0 +1,140 @@
+import datetime
+import fnmatch
+from unittest.mock import patch
+
+import pytest
+
+from app.schemas.dates import DateFilter
+from app.settings.schema import ServerSettings
+from app.utils.tools.cache import (
+    CategoryCache,
+    DashboardCache,
+    MemoryCache,
+    RedisCache,
+    build_cache_backend,
+)
+
+
+class FakeRedis:
+    """Keeps bytes in a dict, like a Redis client with default options."""
+
+    def __init__(self) -> None:
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value):
+        self.values[key] = value.encode() if isinstance(value, str) else value
+
+    def scan_iter(self, pattern):
+        return [x for x in self.values if fnmatch.fnmatch(x, pattern)]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def dashboard_cache(request):
+    if request.param == "memory":
+        return DashboardCache(MemoryCache(max_size=10))
+    return DashboardCache(RedisCache(FakeRedis()))
+
+
+@pytest.fixture(params=["memory", "redis"])
+def category_cache(request):
+    if request.param == "memory":
+        return CategoryCache(MemoryCache(max_size=10))
+    return CategoryCache(RedisCache(FakeRedis()))
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_redis_cache_counts_hits_and_misses():
+    cache = RedisCache(FakeRedis())
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_dashboard_cache_round_trip(dashboard_cache):
+    year = DateFilter(year=2025)
+    dashboard = {"header_text": "Расходы за 2025 год", "all_years": [2025]}
+    assert dashboard_cache.get(1, year) is None
+    dashboard_cache.set(1, year, dashboard)
+    assert dashboard_cache.get(1, year) == dashboard
+    assert dashboard_cache.get(1, DateFilter(year=2025, month=1)) is None
+    assert dashboard_cache.get(2, year) is None
+
+
+def test_dashboard_cache_invalidates_one_user(dashboard_cache):
+    limit = DateFilter()
+    dashboard_cache.set(1, limit, {"total_income": "1"})
+    dashboard_cache.set(10, limit, {"total_income": "10"})
+    dashboard_cache.invalidate(1)
+    assert dashboard_cache.get(1, limit) is None
+    assert dashboard_cache.get(10, limit) == {"total_income": "10"}
+
+
+def test_dashboard_cache_expires_next_day(dashboard_cache):
+    limit = DateFilter()
+    dashboard_cache.set(1, limit, {"days_left": "завтра"})
+    tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+    with patch("app.utils.tools.cache.datetime.date") as date:
+        date.today.return_value = tomorrow
+        assert dashboard_cache.get(1, limit) is None
+
+
+def test_dashboard_cache_returns_copies(dashboard_cache):
+    limit = DateFilter()
+    dashboard_cache.set(1, limit, {"header_text": "все"})
+    dashboard_cache.get(1, limit)["request"] = object()
+    assert dashboard_cache.get(1, limit) == {"header_text": "все"}
+
+
+def test_category_cache_keeps_order_and_one_user(category_cache):
+    categories = {"еда": 3, "бытовая химия": 1, "транспорт": 2}
+    assert category_cache.get(1) is None
+    category_cache.set(1, categories)
+    category_cache.set(10, {"еда": 4})
+    assert list(category_cache.get(1).items()) == list(categories.items())
+    category_cache.invalidate(1)
+    assert category_cache.get(1) is None
+    assert category_cache.get(10) == {"еда": 4}
+
+
+@pytest.mark.parametrize(
+    "workers, cache_backend, expected",
+    [(1, "", "memory"), (4, "", "redis"), (4, "memory", "memory")],
+)
+def test_cache_backend_follows_workers(workers, cache_backend, expected):
+    server = ServerSettings(
+        host="0.0.0.0",
+        port=1818,
+        debug="False",
+        workers=workers,
+        cache_backend=cache_backend,
+    )
+    assert server.selected_cache_backend == expected
+
+
+def test_build_cache_backend():
+    backend = build_cache_backend(
+        "memory", max_size=3, redis_url="", namespace="beeb"
+    )
+    assert isinstance(backend, MemoryCache)
+    assert backend.max_size == 3
+    with pytest.raises(ValueError):
+        build_cache_backend("disk", max_size=3, redis_url="", namespace="")
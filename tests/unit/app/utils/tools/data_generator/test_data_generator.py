@@ -0,0 +1,69 @@
+import datetime
+import statistics
+
+from app.repositories.ledger import LedgerRepo
+from app.utils.tools.data_generator import (
+    SALARY_DAYS,
+    LedgerGenerator,
+    populate,
+)
+from tests.conftest import get_all_income, get_payments
+
+START = datetime.date(2024, 1, 1)
+
+
+def get_generator(seed: int = 0) -> LedgerGenerator:
+    return LedgerGenerator(
+        user_id=1,
+        food_category_id=1,
+        other_category_ids=[2, 3],
+        payments_per_day=10,
+        seed=seed,
+    )
+
+
+def test_generator_is_deterministic():
+    first = list(get_generator().generate_payments(START, 30))
+    second = list(get_generator().generate_payments(START, 30))
+    other = list(get_generator(seed=1).generate_payments(START, 30))
+    assert first == second
+    assert first != other
+
+
+def test_food_has_grams_and_the_rest_has_quantity():
+    payments = list(get_generator().generate_payments(START, 30))
+    food = [x for x in payments if x["category_id"] == 1]
+    other = [x for x in payments if x["category_id"] != 1]
+    assert len(food) > len(other) > 0
+    assert all(x["grams"] and x["quantity"] is None for x in food)
+    assert all(x["quantity"] and x["grams"] is None for x in other)
+
+
+def test_spending_is_seasonal():
+    generator = get_generator()
+    per_day = {
+        month: statistics.mean(
+            generator.get_count(datetime.date(2024, month, 1))
+            for _ in range(500)
+        )
+        for month in (2, 12)
+    }
+    assert per_day[12] > per_day[2]
+
+
+def test_income_is_periodic():
+    income = list(get_generator().generate_income(START, 366))
+    assert len(income) == 12 * len(SALARY_DAYS)
+    assert {x["created_at"].day for x in income} == set(SALARY_DAYS)
+
+
+def test_populate(session):
+    totals = populate(session, users=2, years=1, payments_per_day=3)
+    assert totals["users"] == 2
+    assert totals["payments"] == len(get_payments(session))
+    assert totals["income"] == len(get_all_income(session))
+    ledger = LedgerRepo(session)
+    for user_id in ledger.list_user_ids():
+        report = ledger.verify(user_id)
+        assert report.balance == report.expected_balance
+        assert report.balance >= 0
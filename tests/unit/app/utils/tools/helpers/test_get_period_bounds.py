@@ -0,0 +1,26 @@
+import datetime
+
+from app.schemas.dates import DateFilter
+from app.utils.tools.helpers import get_period_bounds, get_timezone
+
+
+def test_get_period_bounds_no_limit():
+    assert get_period_bounds(DateFilter()) is None
+
+
+def test_get_period_bounds_year():
+    start, end = get_period_bounds(DateFilter(year=2024))
+    assert start == datetime.datetime(2024, 1, 1, tzinfo=get_timezone())
+    assert end == datetime.datetime(2025, 1, 1, tzinfo=get_timezone())
+
+
+def test_get_period_bounds_month():
+    start, end = get_period_bounds(DateFilter(year=2024, month=2))
+    assert start == datetime.datetime(2024, 2, 1, tzinfo=get_timezone())
+    assert end == datetime.datetime(2024, 3, 1, tzinfo=get_timezone())
+
+
+def test_get_period_bounds_december():
+    start, end = get_period_bounds(DateFilter(year=2024, month=12))
+    assert start == datetime.datetime(2024, 12, 1, tzinfo=get_timezone())
+    assert end == datetime.datetime(2025, 1, 1, tzinfo=get_timezone())
@@ -0,0 +1,38 @@
+from app.exceptions import NotPositiveValueError
+from app.settings import METRICS
+from app.utils.tools.metrics import Histogram, Metrics
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value)
+    assert histogram.render("latency", {"route": "/"}) == [
+        'latency_bucket{route="/",le="0.1"} 1',
+        'latency_bucket{route="/",le="1.0"} 2',
+        'latency_bucket{route="/",le="+Inf"} 3',
+        'latency_sum{route="/"} 5.55',
+        'latency_count{route="/"} 3',
+    ]
+
+
+def test_render():
+    metrics = Metrics()
+    metrics.count_error("NotOwnerError")
+    with metrics.time_balance_check():
+        pass
+    metrics.observe_export_db(0.2)
+    text = metrics.render(
+        pool={"checked_out": 2}, caches={"dashboard": (3, 1)}
+    )
+    assert 'beeb_errors_total{type="NotOwnerError"} 1' in text
+    assert "beeb_balance_check_seconds_count 1" in text
+    assert "beeb_export_db_seconds_sum 0.2" in text
+    assert "beeb_db_pool_checked_out 2" in text
+    assert 'beeb_cache_hit_ratio{cache="dashboard"} 0.75' in text
+
+
+def test_beeb_errors_are_not_counted_when_created():
+    before = METRICS.errors["NotPositiveValueError"]
+    NotPositiveValueError(-1)
+    assert METRICS.errors["NotPositiveValueError"] == before
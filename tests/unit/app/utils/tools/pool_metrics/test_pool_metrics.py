@@ -0,0 +1,34 @@
+from sqlalchemy import create_engine, text
+
+from app.settings import ENGINE, SETTINGS
+from app.utils.tools.pool_metrics import PoolMetrics
+
+
+def test_pool_metrics_track_checkouts_and_overflow():
+    engine = create_engine(ENGINE.url, pool_size=1, max_overflow=1)
+    metrics = PoolMetrics()
+    metrics.register(engine)
+    try:
+        with engine.connect() as first, engine.connect() as second:
+            first.execute(text("SELECT 1"))
+            second.execute(text("SELECT 1"))
+            snapshot = metrics.snapshot()
+            assert snapshot["checked_out"] == 2
+            assert snapshot["overflow"] == 1
+        snapshot = metrics.snapshot()
+        assert snapshot["checked_out"] == 0
+        assert snapshot["checkouts"] == snapshot["checkins"] == 2
+        assert snapshot["max_checked_out"] == 2
+        assert snapshot["connects"] == 2
+    finally:
+        engine.dispose()
+
+
+def test_engine_options_from_settings():
+    options = SETTINGS.database.engine_options
+    assert ENGINE.pool.size() == options["pool_size"]
+    assert ENGINE.pool._max_overflow == options["max_overflow"]
+    if SETTINGS.database.statement_timeout:
+        assert str(SETTINGS.database.statement_timeout) in (
+            options["connect_args"]["options"]
+        )
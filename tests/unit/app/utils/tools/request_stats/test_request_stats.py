@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import ProgrammingError
+
+from app.settings import ENGINE, SETTINGS
+from app.utils.tools.request_stats import (
+    CURRENT_STATS,
+    QueryStats,
+    RequestStats,
+)
+
+
+def test_query_stats_count_queries_of_the_current_request():
+    engine = create_engine(ENGINE.url)
+    query_stats = QueryStats(slow_query_ms=0)
+    query_stats.register(engine)
+    stats = RequestStats()
+    token = CURRENT_STATS.set(stats)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT pg_sleep(0.01)"))
+    finally:
+        CURRENT_STATS.reset(token)
+        engine.dispose()
+    assert stats.query_count == 2
+    assert stats.slowest_statement == "SELECT pg_sleep(0.01)"
+    assert stats.slowest_ms >= 10
+    assert stats.db_ms >= stats.slowest_ms
+    assert query_stats.slow_queries == 2
+
+
+def test_query_stats_outside_of_a_request():
+    engine = create_engine(ENGINE.url)
+    query_stats = QueryStats(slow_query_ms=SETTINGS.server.slow_query_ms)
+    query_stats.register(engine)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    finally:
+        engine.dispose()
+    assert CURRENT_STATS.get() is None
+    assert query_stats.slow_queries == 0
+
+
+def test_query_stats_after_a_failed_statement():
+    """Case: a statement fails on a connection that is used again."""
+    engine = create_engine(ENGINE.url, pool_size=1)
+    query_stats = QueryStats(slow_query_ms=SETTINGS.server.slow_query_ms)
+    query_stats.register(engine)
+    with engine.connect() as connection:
+        with pytest.raises(ProgrammingError):
+            connection.execute(text("SELECT * FROM no_such_table"))
+    stats = RequestStats()
+    token = CURRENT_STATS.set(stats)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT pg_sleep(0.01)"))
+    finally:
+        CURRENT_STATS.reset(token)
+        engine.dispose()
+    assert stats.query_count == 1
+    assert 10 <= stats.slowest_ms < 1000
+
+
+def test_server_timing():
+    stats = RequestStats()
+    stats.add_query("SELECT 1", 1.25)
+    stats.add_query("SELECT 2", 2.5)
+    stats.render_ms = 3
+    assert stats.server_timing(total_ms=10) == (
+        'db;dur=3.8;desc="2 queries", db-slowest;dur=2.5, '
+        "render;dur=3.0, total;dur=10.0"
+    )
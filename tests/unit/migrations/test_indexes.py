@@ -0,0 +1,73 @@
+import datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from app.models import Category
+from tests.conftest import TEST_USER_ID
+
+
+def explain(session, query: str, **params) -> str:
+    """Returns the query plan with sequential scans disabled.
+
+    Test tables are tiny, so without this the planner would prefer
+    a sequential scan even when a suitable index exists.
+    """
+    session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = session.execute(text(f"EXPLAIN {query}"), params).scalars().all()
+    return "\n".join(plan)
+
+
+def test_sum_payments_uses_index(session, fill_db):
+    plan = explain(
+        session,
+        "SELECT sum(amount) FROM main.payments "
+        "WHERE user_id = :user_id AND created_at <= :max_date",
+        user_id=TEST_USER_ID,
+        max_date=datetime.datetime.now().astimezone(),
+    )
+    assert "payments_user_id_created_at_idx" in plan
+
+
+def test_payments_per_period_uses_index(session, fill_db):
+    now = datetime.datetime.now().astimezone()
+    plan = explain(
+        session,
+        "SELECT id, amount, category_id FROM main.payments "
+        "WHERE user_id = :user_id "
+        "AND created_at >= :min_date AND created_at < :max_date",
+        user_id=TEST_USER_ID,
+        min_date=now - datetime.timedelta(days=30),
+        max_date=now,
+    )
+    assert "payments_user_id_created_at_idx" in plan
+
+
+def test_sum_income_uses_index(session, fill_db):
+    plan = explain(
+        session,
+        "SELECT sum(amount) FROM main.income "
+        "WHERE user_id = :user_id AND created_at <= :max_date",
+        user_id=TEST_USER_ID,
+        max_date=datetime.datetime.now().astimezone(),
+    )
+    assert "income_user_id_created_at_idx" in plan
+
+
+def test_category_by_name_uses_index(session, categories):
+    plan = explain(
+        session,
+        "SELECT id FROM main.category "
+        "WHERE user_id = :user_id AND name = :name",
+        user_id=TEST_USER_ID,
+        name="продукты",
+    )
+    assert "category_user_id_name_key" in plan
+
+
+def test_category_name_is_unique_per_user(session, category):
+    session.add(Category(name=category.name, user_id=category.user_id))
+    with pytest.raises(IntegrityError):
+        session.flush()
+    session.rollback()